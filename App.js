@@ -12,8 +12,17 @@ function App() {
   }, []);
 
   const fetchResumes = async () => {
-    const res = await axios.get("http://localhost:8000/resumes");
-    setResumes(res.data.map(r => ({ ...r, id: r.id })));
+    // /resumes is keyset-paginated; follow X-Next-After-Id until the last page
+    let all = [];
+    let afterId = null;
+    do {
+      const params = { limit: 1000 };
+      if (afterId !== null) params.after_id = afterId;
+      const res = await axios.get("http://localhost:8000/resumes", { params });
+      all = all.concat(res.data);
+      afterId = res.headers["x-next-after-id"] ?? null;
+    } while (afterId !== null);
+    setResumes(all.map(r => ({ ...r, id: r.id })));
   };
 
   const handleUpload = async (event) => {
@@ -0,0 +1,80 @@
+"""Check extractor.extract_information against the pre-rewrite reference and
+time the field extraction (spaCy runs once up front and is not timed).
+
+    python -m backend.benchmarks.fields --count 300
+
+Exits non-zero if any document's output differs.
+"""
+import argparse
+import sys
+import time
+
+from backend import extractor
+from backend.benchmarks import legacy_fields
+from backend.benchmarks.synthetic import generate_corpus
+
+# Hand-written inputs for the rules the synthetic corpus rarely exercises
+EDGE_CASES = [
+    '',
+    'Name: Priya Sharma\nGPA 3.85 / 4.00\nprimary@mail.org, second@iitb.ac.in\nPhone: 9876543210',
+    'JOHN DOE\r\nCGPA:\r\n8.75\r\nemail: john.doe@company.co.in\r\n+1 5551234567',
+    'Resume\nMr Rahul Gupta\nrahul gupta\nCGPA \\d\\.\\dd and 7.25\nno-at-sign.example.com',
+    'Curriculum Vitae\x0cAnanya Iyer\x0cGPA\x0c3.9\x0c9.123 score\nlinks: a@b.xyz c@d.com',
+    'Ravi Kumar\nTECHNICAL SKILLS:\npython, sql, x, tableau\nWork Experience\nSOFTWARE ENGINEER AT ACME\n'
+    '- built things\n* more things\nData Analyst, Globex Jan 2019 - Mar 2021\n• dashboards\n'
+    'some loose line\nPROJECTS\nnot experience',
+    'experience\nIntern, Initech (Remote) Present\n- tickets\n\nEDUCATION\nB.Tech 1999, 2051, 1949, 20199',
+    'Work Experience: 4 years\nPROFESSIONAL EXPERIENCE\nLead Engineer, Hooli 2018 to 2022\nSKILLS\n',
+    'Sneha Reddy phone 080 12345678901 gpa-3.456\x1cEXPERIENCE\x1dConsultant, Wayne Tech',
+    'Name - dr. j. smith\nName - J. R. Smith\ncgpa 9.10\nCGPA 8.20',
+]
+
+
+def corpus(count, seed):
+    texts = list(EDGE_CASES)
+    texts += ['\n'.join(lines) for _, lines in generate_corpus(count, seed)]
+    return texts
+
+
+def best_of(fn, docs, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text, doc in docs:
+            fn(text, doc)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare field extraction with the reference implementation')
+    parser.add_argument('--count', type=int, default=300, help='synthetic resumes on top of the edge cases')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    texts = corpus(args.count, args.seed)
+    docs = list(zip(texts, extractor.nlp.pipe(texts)))
+    legacy = lambda text, doc: legacy_fields.extract_information(text, doc, extractor.matcher)
+
+    mismatches = 0
+    for index, (text, doc) in enumerate(docs):
+        expected, actual = legacy(text, doc), extractor.extract_information(text, doc)
+        if list(expected.items()) != list(actual.items()):
+            mismatches += 1
+            print(f'mismatch in document {index}:')
+            for key in expected:
+                if expected[key] != actual.get(key):
+                    print(f'  {key}: expected {expected[key]!r}, got {actual.get(key)!r}')
+    print(f'{len(docs)} documents, {mismatches} mismatches')
+
+    before = best_of(legacy, docs, args.repeat)
+    after = best_of(extractor.extract_information, docs, args.repeat)
+    print(f'reference: {before * 1000 / len(docs):.3f} ms/doc')
+    print(f'current:   {after * 1000 / len(docs):.3f} ms/doc ({before / after:.2f}x)')
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Compare the PDF text backends on the same synthetic corpus.
+
+    python -m backend.benchmarks.pdf_backends --count 60 --out pdf_backends.json
+
+Every installed backend reads every PDF, with no fallback. Reported per
+backend: docs/sec, p50/p95 latency, ms/page, failures, and how many documents
+give the same name, email and phone as the plain-text twin of the PDF.
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from backend.benchmarks.run import StageTimer, load_text
+from backend.benchmarks.synthetic import write_corpus
+from backend.extractor import extract_header_fields
+from backend.pdf_text import BACKENDS, available_backends, iter_page_texts, page_count
+
+
+def read_all(path, name):
+    return ''.join(iter_page_texts(path, backends=[name]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare PDF text backends')
+    parser.add_argument('--count', type=int, default=60, help='synthetic resumes to generate')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--corpus', help='reuse/keep the corpus in this directory')
+    parser.add_argument('--out', help='write results as JSON')
+    args = parser.parse_args(argv)
+
+    backends = available_backends()
+    timer = StageTimer()
+    failures = dict.fromkeys(backends, 0)
+    agree = dict.fromkeys(backends, 0)
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = write_corpus(args.corpus or os.path.join(workdir, 'corpus'), args.count, args.seed)
+        for path in paths:
+            pages = page_count(path)
+            expected = extract_header_fields([load_text(path)])
+            for name in backends:
+                try:
+                    text = timer.measure(name, read_all, path, name, pages=pages)
+                except Exception:
+                    failures[name] += 1
+                    continue
+                agree[name] += extract_header_fields([text]) == expected
+
+    stages = timer.report()
+    results = {}
+    print(f"{'backend':<10} {'docs/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'ms/page':>8} {'failed':>7} {'header ok':>10}")
+    for name in backends:
+        stats = stages.get(name, {})
+        results[name] = dict(stats, failed=failures[name], header_agreement=f"{agree[name]}/{len(paths)}")
+        print(f"{name:<10} {stats.get('docs_per_sec', '-'):>9} {stats.get('p50_ms', '-'):>9} {stats.get('p95_ms', '-'):>9} "
+              f"{stats.get('ms_per_page', '-'):>8} {failures[name]:>7} {results[name]['header_agreement']:>10}")
+    missing = [name for name in BACKENDS if name not in backends]
+    if missing:
+        print(f"not installed: {', '.join(missing)}")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({'count': args.count, 'seed': args.seed, 'backends': results}, f, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Size and decode cost of packed ResumeInfo results against the JSON/dict form
+they replace, on the synthetic corpus.
+
+    python -m backend.benchmarks.records --count 200
+
+Reports the cached payload and the work_experience column per result in
+bytes, the memory of the decoded results, and decode time.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from backend.benchmarks.synthetic import generate_corpus
+from backend.extractor import extract_information
+from backend.records import ResumeInfo, pack_experience
+
+
+def decoded_bytes(decode, payloads):
+    # Memory held by every payload decoded at once
+    tracemalloc.start()
+    results = [decode(payload) for payload in payloads]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return size
+
+
+def best_time(fn, payloads, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            fn(payload)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare packed results with JSON dicts')
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    dicts = [extract_information('\n'.join(lines)) for _, lines in generate_corpus(args.count, args.seed)]
+    infos = [ResumeInfo.from_dict(d) for d in dicts]
+    # What the cache and the work_experience column held before
+    json_payloads = [json.dumps(d, separators=(',', ':')) for d in dicts]
+    repr_columns = [str(d['work_experience']) for d in dicts]
+    packed_payloads = [info.pack() for info in infos]
+    packed_columns = [pack_experience(info.work_experience) for info in infos]
+
+    n = len(dicts)
+    rows = [
+        ('cache payload B', sum(map(len, json_payloads)) / n, sum(map(len, packed_payloads)) / n),
+        ('experience col B', sum(len(c.encode('utf-8')) for c in repr_columns) / n, sum(map(len, packed_columns)) / n),
+        ('decoded memory B', decoded_bytes(json.loads, json_payloads) / n, decoded_bytes(ResumeInfo.unpack, packed_payloads) / n),
+        ('decode us', best_time(json.loads, json_payloads) / n * 1e6, best_time(ResumeInfo.unpack, packed_payloads) / n * 1e6),
+    ]
+    print(f"{'per result':<18} {'json/dict':>10} {'packed':>10} {'change':>8}")
+    results = {}
+    for label, before, after in rows:
+        results[label] = {'json': round(before, 1), 'packed': round(after, 1)}
+        print(f"{label:<18} {before:>10.1f} {after:>10.1f} {(after - before) / before * 100:>+7.1f}%")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+"""Per-stage benchmark of the extraction pipeline on a synthetic corpus.
+
+    python -m backend.benchmarks.run --count 60 --out bench.json
+    python -m backend.benchmarks.run --count 60 --compare bench.json
+
+Stages are timed per document and reported as docs/sec, p50/p95 latency and
+the process's peak RSS; --out writes the same numbers as JSON so two runs can
+be compared with --compare.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from backend.benchmarks.synthetic import write_corpus
+from backend.pdf_text import page_count
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class StageTimer:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.pages = defaultdict(int)
+
+    def measure(self, stage, fn, *args, pages=0):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.samples[stage].append(time.perf_counter() - start)
+        self.pages[stage] += pages
+        return result
+
+    def report(self):
+        stages = {}
+        for stage, samples in self.samples.items():
+            total = sum(samples)
+            stages[stage] = {
+                'docs': len(samples),
+                'docs_per_sec': round(len(samples) / total, 2) if total else None,
+                'p50_ms': round(percentile(samples, 50) * 1000, 3),
+                'p95_ms': round(percentile(samples, 95) * 1000, 3),
+                'total_s': round(total, 4),
+            }
+            if self.pages[stage]:
+                stages[stage]['ms_per_page'] = round(total * 1000 / self.pages[stage], 3)
+        return stages
+
+
+def load_text(pdf_path):
+    with open(pdf_path[:-4] + '.txt') as f:
+        return f.read()
+
+
+WEB_SCHEMA = '''CREATE TABLE resumes (id INTEGER PRIMARY KEY AUTOINCREMENT, filename TEXT, name TEXT, email TEXT,
+    phone TEXT, skills TEXT, work_experience TEXT, cgpa TEXT)'''
+DESKTOP_SCHEMA = '''CREATE TABLE resumes (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, email TEXT, phone TEXT,
+    skills TEXT, work_experience TEXT, upload_date TEXT, filename TEXT, status TEXT)'''
+
+
+def bench_web(paths, timer, source, workdir):
+    from backend import extractor
+    from backend.db import ConnectionPool
+    from backend.skill_index import SKILL_INDEX_SCHEMA, index_resume
+
+    pool = ConnectionPool(os.path.join(workdir, 'web.sqlite3'))
+    conn = pool.connection()
+    conn.execute(WEB_SCHEMA)
+    for statement in SKILL_INDEX_SCHEMA:
+        conn.execute(statement)
+
+    def insert(path, info):
+        with conn:
+            resume_id = conn.execute(
+                'INSERT INTO resumes (filename, name, email, phone, skills, work_experience, cgpa) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (os.path.basename(path), info['name'], info['email'], info['phone'], ','.join(info['skills']),
+                 str(info['work_experience']), info['cgpa']),
+            ).lastrowid
+            index_resume(conn, resume_id, info['skills'])
+
+    for path in paths:
+        if source == 'pdf':
+            text = timer.measure('web.pdf_text', extractor.extract_text_from_pdf, path, pages=page_count(path))
+        else:
+            text = load_text(path)
+        doc = timer.measure('web.spacy', extractor.nlp, text)
+        timer.measure('web.matcher', extractor.matcher, doc)
+        # Aho-Corasick alternative to the two stages above (RSE_SKILL_ENGINE=scanner)
+        timer.measure('web.scanner', extractor.get_scanner().skills, text)
+        # Rule and regex passes on a ready doc (includes one more matcher call)
+        info = timer.measure('web.fields', extractor.extract_information, text, doc)
+        timer.measure('web.total', extractor.extract_information, text)
+        timer.measure('web.db_insert', insert, path, info)
+    pool.close_all()
+
+
+def bench_desktop(paths, timer, source, workdir):
+    from backend.resume_extractor import ResumeParser
+
+    parser = ResumeParser()
+    conn = sqlite3.connect(os.path.join(workdir, 'desktop.db'))
+    conn.execute(DESKTOP_SCHEMA)
+
+    def insert(path, info):
+        with conn:
+            conn.execute(
+                'INSERT INTO resumes (name, email, phone, skills, work_experience, upload_date, filename, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (info['name'], info['email'], info['phone'], json.dumps(info['skills']),
+                 json.dumps(info['work_experience']), datetime.now().isoformat(), os.path.basename(path), 'To Review'),
+            )
+
+    for path in paths:
+        if source == 'pdf':
+            text = timer.measure('desktop.pdf_text', parser.extract_text_from_pdf, path, pages=page_count(path))
+        else:
+            text = load_text(path)
+        doc = timer.measure('desktop.spacy', parser.nlp, text)
+        timer.measure('desktop.matcher', parser.matcher, doc)
+        info = timer.measure('desktop.total', parser.extract_information, text)
+        timer.measure('desktop.db_insert', insert, path, info)
+    conn.close()
+
+
+def compare(current, baseline):
+    print(f"\n{'stage':<20} {'p50 base':>10} {'p50 now':>10} {'change':>8} {'docs/s base':>12} {'docs/s now':>11}")
+    for stage, now in current['stages'].items():
+        base = baseline.get('stages', {}).get(stage)
+        if not base:
+            print(f"{stage:<20} {'-':>10} {now['p50_ms']:>10} {'new':>8}")
+            continue
+        change = (now['p50_ms'] - base['p50_ms']) / base['p50_ms'] * 100 if base['p50_ms'] else 0.0
+        print(f"{stage:<20} {base['p50_ms']:>10} {now['p50_ms']:>10} {change:>+7.1f}% "
+              f"{base['docs_per_sec']:>12} {now['docs_per_sec']:>11}")
+    print(f"peak RSS: {baseline.get('peak_rss_mb')} MB -> {current['peak_rss_mb']} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark resume extraction stages')
+    parser.add_argument('--count', type=int, default=60, help='synthetic resumes to generate')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--source', choices=['pdf', 'text'], default='pdf',
+                        help='feed PDFs (includes the PDF text stage) or the plain-text twins')
+    parser.add_argument('--extractor', choices=['web', 'desktop', 'both'], default='web')
+    parser.add_argument('--corpus', help='reuse/keep the corpus in this directory')
+    parser.add_argument('--out', help='write results as JSON')
+    parser.add_argument('--compare', help='baseline JSON from an earlier --out')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus = args.corpus or os.path.join(workdir, 'corpus')
+        paths = write_corpus(corpus, args.count, args.seed)
+        timer = StageTimer()
+        if args.extractor in ('web', 'both'):
+            bench_web(paths, timer, args.source, workdir)
+        if args.extractor in ('desktop', 'both'):
+            bench_desktop(paths, timer, args.source, workdir)
+
+    result = {
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'count': args.count,
+        'seed': args.seed,
+        'source': args.source,
+        'stages': timer.report(),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    print(f"{'stage':<20} {'docs/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'ms/page':>8}")
+    for stage, stats in result['stages'].items():
+        print(f"{stage:<20} {stats['docs_per_sec']:>9} {stats['p50_ms']:>9} {stats['p95_ms']:>9} "
+              f"{stats.get('ms_per_page', ''):>8}")
+    print(f"peak RSS: {result['peak_rss_mb']} MB")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(result, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(result, json.load(f))
+    return result
+
+
+if __name__ == '__main__':
+    main()
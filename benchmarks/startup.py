@@ -0,0 +1,71 @@
+"""Cold-start cost of the API and the extractors, each measured in a fresh
+interpreter so nothing is already imported or loaded.
+
+    python -m backend.benchmarks.startup --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Each snippet runs in its own process and prints the seconds it measured
+SNIPPET = '''
+import json, time
+start = time.perf_counter()
+{setup}
+setup_s = time.perf_counter() - start
+start = time.perf_counter()
+{body}
+print(json.dumps({{"setup_s": setup_s, "body_s": time.perf_counter() - start}}))
+'''
+
+SAMPLE = "Priya Sharma\\nEmail: priya@iitb.ac.in\\nTechnical Skills\\npython, sql, docker\\nCGPA 8.50"
+
+STAGES = {
+    'import backend.main': ('import backend.main', 'pass'),
+    'import backend.extractor': ('import backend.extractor', 'pass'),
+    'import backend.resume_extractor': ('import backend.resume_extractor', 'pass'),
+    'web model load': ('from backend import extractor', 'extractor.warm_up()'),
+    'web first extraction': ('from backend import extractor', f'extractor.extract_information("{SAMPLE}")'),
+    'desktop model load': ('from backend.resume_extractor import ResumeParser', 'ResumeParser().init_nlp()'),
+    'desktop first extraction': ('from backend.resume_extractor import ResumeParser',
+                                 f'ResumeParser().extract_information("{SAMPLE}")'),
+}
+
+
+def measure(setup, body, env):
+    code = SNIPPET.format(setup=setup, body=body)
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure process cold-start times')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--out', help='write results as JSON')
+    args = parser.parse_args(argv)
+
+    # Children resolve backend.* the same way this process does
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p or os.getcwd() for p in sys.path))
+    results = {}
+    print(f"{'stage':<32} {'median s':>9} {'min s':>8}")
+    for stage, (setup, body) in STAGES.items():
+        try:
+            runs = [measure(setup, body, env) for _ in range(args.repeat)]
+        except subprocess.CalledProcessError as e:
+            print(f"{stage:<32} failed: {e.stderr.strip().splitlines()[-1] if e.stderr.strip() else e}")
+            continue
+        # Import stages time the setup line itself; the others time the body after it
+        samples = [r['setup_s'] if body == 'pass' else r['body_s'] for r in runs]
+        results[stage] = {'median_s': round(statistics.median(samples), 4), 'min_s': round(min(samples), 4)}
+        print(f"{stage:<32} {results[stage]['median_s']:>9} {results[stage]['min_s']:>8}")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
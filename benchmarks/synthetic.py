@@ -0,0 +1,134 @@
+"""Deterministic synthetic resumes (plain text and PDF) for benchmarking.
+
+The same seed always yields the same corpus, so timings from different runs
+are measured on identical input.
+"""
+import argparse
+import os
+import random
+
+FIRST_NAMES = ['Aarav', 'Priya', 'Rohan', 'Ananya', 'Vikram', 'Sneha', 'James', 'Emily', 'Daniel', 'Sofia',
+               'Arjun', 'Kavya', 'Michael', 'Olivia', 'Rahul', 'Meera']
+LAST_NAMES = ['Sharma', 'Iyer', 'Patel', 'Reddy', 'Smith', 'Johnson', 'Garcia', 'Nair', 'Gupta', 'Brown',
+              'Kapoor', 'Wilson', 'Menon', 'Das']
+DOMAINS = ['gmail.com', 'outlook.com', 'iitb.ac.in', 'stanford.edu', 'company.co.in', 'mail.org']
+SKILLS = ['python', 'java', 'c++', 'sql', 'javascript', 'html', 'css', 'react', 'node.js', 'django', 'flask',
+          'machine learning', 'deep learning', 'data science', 'nlp', 'aws', 'azure', 'git', 'docker',
+          'kubernetes', 'Tableau', 'Power BI', 'Excel', 'Angular', 'C#', 'Leadership', 'Communication']
+TITLES = ['Software Engineer', 'Data Analyst', 'Intern', 'Backend Developer', 'Research Assistant',
+          'Product Manager', 'ML Engineer', 'Consultant']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries', 'Wayne Tech']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+FILLER = ('designed built improved scalable services pipeline customers latency reports team delivered '
+          'migrated analysis dashboards automated testing deployment reduced cost performance features '
+          'collaborated stakeholders requirements research published models accuracy production').split()
+
+# Rough body sizes: paragraphs of filler per section
+PROFILES = {
+    'short': {'jobs': (1, 2), 'paragraphs': (1, 2)},
+    'medium': {'jobs': (2, 4), 'paragraphs': (3, 6)},
+    'long': {'jobs': (4, 8), 'paragraphs': (15, 30)},
+}
+
+
+def _sentence(rng, skill_density):
+    words = []
+    for _ in range(rng.randint(8, 18)):
+        words.append(rng.choice(SKILLS) if rng.random() < skill_density else rng.choice(FILLER))
+    return ' '.join(words).capitalize() + '.'
+
+
+def generate_resume(rng, profile='medium', skill_density=0.05):
+    """Return one resume as a list of text lines"""
+    spec = PROFILES[profile]
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f'{first} {last}' if rng.random() < 0.7 else f'Name: {first} {last}',
+        f'Email: {first.lower()}.{last.lower()}{rng.randint(1, 99)}@{rng.choice(DOMAINS)}',
+        f'Phone: +91 {rng.randint(6000000000, 9999999999)}',
+        f'CGPA: {rng.randint(6, 9)}.{rng.randint(10, 99)}',
+        '',
+        'SUMMARY',
+    ]
+    lines += [_sentence(rng, skill_density) for _ in range(rng.randint(*spec['paragraphs']))]
+    lines += ['', 'Technical Skills', ', '.join(rng.sample(SKILLS, rng.randint(4, 10))), '', 'WORK EXPERIENCE']
+    start_year = rng.randint(2005, 2020)
+    for _ in range(rng.randint(*spec['jobs'])):
+        end_year = min(start_year + rng.randint(1, 3), 2024)
+        lines.append(f'{rng.choice(TITLES)}, {rng.choice(COMPANIES)} '
+                     f'{rng.choice(MONTHS)} {start_year} - {rng.choice(MONTHS)} {end_year}')
+        lines += [f'- {_sentence(rng, skill_density)}' for _ in range(rng.randint(2, 4))]
+        start_year = end_year
+    lines += ['', 'PROJECTS']
+    lines += [_sentence(rng, skill_density) for _ in range(rng.randint(*spec['paragraphs']))]
+    lines += ['', 'EDUCATION', f'B.Tech Computer Science, {rng.randint(2000, 2020)}']
+    return lines
+
+
+def generate_corpus(count, seed=0, profiles=('short', 'medium', 'long'), skill_density=(0.02, 0.15)):
+    """Yield (name, lines) for count resumes, cycling through the profiles"""
+    rng = random.Random(seed)
+    for i in range(count):
+        profile = profiles[i % len(profiles)]
+        density = rng.uniform(*skill_density)
+        yield f'resume_{i:05d}_{profile}', generate_resume(rng, profile, density)
+
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path, lines, lines_per_page=55):
+    """Write lines as a minimal text-only PDF (Helvetica, one line per row)"""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = []  # 1-based object bodies
+    objects.append(b'<< /Type /Catalog /Pages 2 0 R >>')
+    objects.append(None)  # pages tree, filled in once the kids are known
+    objects.append(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    kids = []
+    for page_lines in pages:
+        body = ['BT /F1 10 Tf 12 TL 50 790 Td']
+        body += [f'({_pdf_escape(line)}) Tj T*' for line in page_lines]
+        body.append('ET')
+        stream = '\n'.join(body).encode('latin-1', 'replace')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(('<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+                        '/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % content_id).encode())
+        kids.append(len(objects))
+    objects[1] = ('<< /Type /Pages /Kids [%s] /Count %d >>'
+                  % (' '.join(f'{k} 0 R' for k in kids), len(kids))).encode()
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+def write_corpus(directory, count, seed=0, **kwargs):
+    """Write <name>.pdf and <name>.txt pairs; returns the PDF paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name, lines in generate_corpus(count, seed, **kwargs):
+        pdf_path = os.path.join(directory, name + '.pdf')
+        write_pdf(pdf_path, lines)
+        with open(os.path.join(directory, name + '.txt'), 'w') as f:
+            f.write('\n'.join(lines))
+        paths.append(pdf_path)
+    return paths
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write a synthetic resume corpus')
+    parser.add_argument('directory')
+    parser.add_argument('--count', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(f'Wrote {len(write_corpus(args.directory, args.count, args.seed))} resumes to {args.directory}')
@@ -0,0 +1,80 @@
+"""Full-text search latency over the synthetic corpus.
+
+    python -m backend.benchmarks.text_search --count 100000
+
+Indexes the text of `count` synthetic resumes in a fresh database migrated
+like db.sqlite3, then reports indexing docs/sec, the index size, and p50/p95
+latency of each kind of query run through search_text (bm25 ranking and
+snippets, top `limit`). The synthetic vocabulary is small, so the filler
+word query matches nearly every resume: a worst case for ranking.
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from backend.benchmarks.run import percentile
+from backend.benchmarks.synthetic import generate_corpus
+from backend.migrations import migrate, WEB_MIGRATIONS
+from backend.text_index import fts_query, index_text, search_text
+
+QUERIES = {
+    'company': 'Hooli',
+    'phrase': '"Umbrella Labs"',
+    'name': 'Kavya Menon',
+    'skill': 'kubernetes',
+    'prefix': 'kube*',
+    'two skills': 'docker azure',
+    'filler word': 'deployment',
+    'no match': 'fortran',
+}
+
+
+def build(path, count, seed, batch=5000):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    migrate(conn, WEB_MIGRATIONS)
+    started = time.perf_counter()
+    with conn:
+        for name, lines in generate_corpus(count, seed):
+            resume_id = conn.execute("INSERT INTO resumes (filename) VALUES (?)", (name + '.pdf',)).lastrowid
+            index_text(conn, resume_id, '\n'.join(lines))
+    return conn, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time full-text search over synthetic resumes')
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'text_search.sqlite3')
+        conn, build_s = build(path, args.count, args.seed)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"indexed {args.count} resumes in {build_s:.1f}s "
+              f"({args.count / build_s:.0f} docs/sec, includes generating them), db {size_mb:.1f} MB")
+        results = {'count': args.count, 'build_s': round(build_s, 2), 'db_mb': round(size_mb, 1), 'queries': {}}
+        print(f"{'query':<12} {'hits':>6} {'p50 ms':>8} {'p95 ms':>8}")
+        for label, query in QUERIES.items():
+            samples, hits = [], []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                hits = search_text(conn, query, args.limit)
+                samples.append(time.perf_counter() - start)
+            total = conn.execute("SELECT count(*) FROM resume_text WHERE resume_text MATCH ?",
+                                 (fts_query(query),)).fetchone()[0]
+            p50, p95 = percentile(samples, 50) * 1000, percentile(samples, 95) * 1000
+            results['queries'][label] = {'query': query, 'matches': total, 'p50_ms': round(p50, 3), 'p95_ms': round(p95, 3)}
+            print(f"{label:<12} {total:>6} {p50:>8.2f} {p95:>8.2f}")
+        conn.close()
+    return results
+
+
+if __name__ == '__main__':
+    main()
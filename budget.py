@@ -0,0 +1,93 @@
+"""Limits on how much of one document is read and analysed.
+
+Reading stops at max_pages pages, max_chars characters or max_ms
+milliseconds of parsing, whichever comes first. Skills and experience are
+then extracted from at most the first body_chars characters. When anything
+was left out, the header fields (name, email, phone, CGPA) come from the
+first header_pages pages instead, and the result records what was cut under
+'truncated'. A document within every limit is analysed as a whole.
+
+Each limit is off when set to 0.
+"""
+import time
+
+from backend import settings
+
+
+class ExtractionBudget:
+    def __init__(self, max_pages=None, max_chars=None, max_ms=None, header_pages=None, body_chars=None):
+        self.max_pages = settings.BUDGET_MAX_PAGES if max_pages is None else max_pages
+        self.max_chars = settings.BUDGET_MAX_CHARS if max_chars is None else max_chars
+        self.max_ms = settings.BUDGET_MAX_MS if max_ms is None else max_ms
+        self.header_pages = settings.BUDGET_HEADER_PAGES if header_pages is None else header_pages
+        self.body_chars = settings.BUDGET_BODY_KB * 1024 if body_chars is None else body_chars
+
+    def signature(self):
+        # Limits that decide what is extracted, for cache versions. The time
+        # limit is left out: results it cut short are not cached
+        return f"{self.max_pages}:{self.max_chars}:{self.header_pages}:{self.body_chars}"
+
+    def read(self, pages, report):
+        """Page texts from the pages iterator until a limit is reached.
+
+        The limits that cut the document short are listed in
+        report['truncated_by'].
+        """
+        texts, chars = [], 0
+        started = time.perf_counter()
+        truncated_by = []
+        try:
+            while True:
+                # Checked before the next page is pulled, so it is never parsed
+                if self.max_ms and (time.perf_counter() - started) * 1000 > self.max_ms:
+                    truncated_by.append('max_ms')
+                    break
+                text = next(pages, None)
+                if text is None:
+                    break
+                if self.max_chars and chars + len(text) > self.max_chars:
+                    texts.append(text[:self.max_chars - chars])
+                    truncated_by.append('max_chars')
+                    break
+                texts.append(text)
+                chars += len(text)
+        finally:
+            pages.close()
+        readable = min(report['page_total'] or 0, self.max_pages or report['page_total'] or 0)
+        if truncated_by == ['max_ms'] and len(texts) == readable:
+            # Out of time just after the last page it would read anyway
+            truncated_by = []
+        if not truncated_by and report['page_total'] and report['pages'] < report['page_total']:
+            truncated_by.append('max_pages')
+        report['truncated_by'] = truncated_by
+        return texts
+
+    def split(self, pages, report):
+        """(text to analyse, header text, truncation record) for the page texts read.
+
+        Within budget the whole text is analysed, and header text and record
+        are None.
+        """
+        text = ''.join(pages)
+        body = text
+        reasons = report.pop('truncated_by', None) or []
+        if self.body_chars and len(text) > self.body_chars:
+            # Cut at a line break so the last line analysed is whole
+            body = text[:text.rfind('\n', 0, self.body_chars) + 1 or self.body_chars]
+            reasons.append('body_chars')
+        if not reasons:
+            return text, None, None
+        truncated = {
+            'reasons': reasons,
+            'pages_read': len(pages),
+            'pages_total': report['page_total'],
+            'chars_read': len(text),
+            'chars_analysed': len(body),
+        }
+        return body, ''.join(pages[:self.header_pages]) if self.header_pages else body, truncated
+
+
+def cacheable(info):
+    """False for results cut short by the time limit, which may read more next time"""
+    truncated = info.truncated
+    return not truncated or 'max_ms' not in truncated['reasons']
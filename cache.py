@@ -0,0 +1,128 @@
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from backend import settings
+from backend.records import ResumeInfo
+
+def content_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_version(namespace, extractor_version, skills, taxonomy=None):
+    """Tag that changes whenever the extractor, its skill list, the spaCy
+    model or the PDF fallback engines change.
+
+    taxonomy is the digest of a prebuilt skill matcher when one is loaded.
+    The built-in skill lists are hashed either way, as the scanner engine and
+    fallbacks still read them.
+    """
+    skills_hash = hashlib.sha256('\n'.join(sorted(skills)).encode('utf-8')).hexdigest()[:16]
+    if taxonomy:
+        skills_hash = f"{taxonomy}:{skills_hash}"
+    engines = f"{settings.SPACY_MODEL}:{','.join(settings.PDF_FALLBACK_BACKENDS)}"
+    return f"{namespace}:{extractor_version}:{engines}:{skills_hash}"
+
+
+class ExtractionCache:
+    """Packed ResumeInfo results keyed by content hash: SQLite table fronted by a size-bounded LRU.
+
+    The extraction_cache table comes from the database's migrations.
+    """
+
+    def __init__(self, db_path, version, max_bytes=None, connect=None):
+        self.db_path = db_path
+        self.connect = connect
+        self.version = version
+        self.max_bytes = settings.CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self._lru = OrderedDict()
+        self._lru_bytes = 0
+        self._lock = threading.Lock()
+
+    def prune(self):
+        """Delete rows written by other extractor versions, which can never be hit again"""
+        conn = self._connect()
+        conn.execute("DELETE FROM extraction_cache WHERE version != ?", (self.version,))
+        conn.commit()
+        conn.close()
+
+    def _connect(self):
+        if self.connect is not None:
+            return self.connect()
+        return sqlite3.connect(self.db_path)
+
+    def _key(self, digest):
+        return f"{self.version}:{digest}"
+
+    def _remember(self, key, payload):
+        # Caller holds the lock
+        if key in self._lru:
+            self._lru_bytes -= len(self._lru.pop(key))
+        if len(payload) > self.max_bytes:
+            return
+        self._lru[key] = payload
+        self._lru_bytes += len(payload)
+        while self._lru_bytes > self.max_bytes:
+            _, evicted = self._lru.popitem(last=False)
+            self._lru_bytes -= len(evicted)
+
+    def get(self, digest):
+        """Return a fresh copy of the cached result for this content hash, or None"""
+        key = self._key(digest)
+        with self._lock:
+            payload = self._lru.get(key)
+            if payload is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return ResumeInfo.unpack(payload)
+        conn = self._connect()
+        row = conn.execute("SELECT payload FROM extraction_cache WHERE key=?", (key,)).fetchone()
+        conn.close()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, row[0])
+        return ResumeInfo.unpack(row[0])
+
+    def put(self, digest, info):
+        key = self._key(digest)
+        payload = info.pack()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO extraction_cache (key, version, payload, created_at) VALUES (?, ?, ?, ?)",
+            (key, self.version, payload, datetime.now().isoformat()),
+        )
+        conn.commit()
+        conn.close()
+        with self._lock:
+            self._remember(key, payload)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "memory_entries": len(self._lru),
+                "memory_bytes": self._lru_bytes,
+                "memory_max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,142 @@
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+
+from backend import settings
+
+
+class PooledConnection(sqlite3.Connection):
+    """Connection owned by a ConnectionPool: close() hands it back instead of closing it"""
+
+    def close(self):
+        # Leave nothing half-done for the next user of this thread's connection
+        if self.in_transaction:
+            self.rollback()
+
+    def really_close(self):
+        super().close()
+
+
+class ConnectionPool:
+    """One tuned SQLite connection per thread, reused across requests"""
+
+    def __init__(self, path, mmap_size=None, cached_statements=None):
+        self.path = path
+        self.mmap_size = settings.DB_MMAP_SIZE if mmap_size is None else mmap_size
+        self.cached_statements = cached_statements or settings.DB_CACHED_STATEMENTS
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _open(self, factory=PooledConnection):
+        conn = sqlite3.connect(
+            self.path,
+            timeout=settings.DB_BUSY_TIMEOUT,
+            factory=factory,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers proceed while a writer commits; NORMAL is durable
+        # across application crashes and only skips an fsync per commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        return conn
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def dedicated(self):
+        """Fresh tuned connection outside the pool, for cursors that outlive a
+        single call (e.g. streamed responses); the caller must close it"""
+        return self._open(factory=sqlite3.Connection)
+
+    def close_all(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.really_close()
+            self._connections = []
+        self._local = threading.local()
+
+
+class WriteQueue:
+    """Single writer thread that commits concurrently submitted writes in groups"""
+
+    def __init__(self, pool, max_batch=None, max_wait=None):
+        self.pool = pool
+        self.max_batch = max_batch or settings.DB_WRITE_BATCH
+        self.max_wait = settings.DB_WRITE_WAIT if max_wait is None else max_wait
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def execute(self, sql, params=()):
+        """Queue one write; the returned Future resolves to the row's lastrowid"""
+        return self.call(lambda conn: conn.execute(sql, params).lastrowid)
+
+    def call(self, fn, *args):
+        """Queue fn(conn, *args) to run inside a grouped write transaction;
+        the returned Future resolves to its return value"""
+        future = Future()
+        self._ensure_started()
+        self._queue.put((fn, args, future))
+        return future
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _next_group(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        group = [first]
+        # Whatever else arrives within the wait window shares the commit
+        while len(group) < self.max_batch:
+            try:
+                item = self._queue.get(timeout=self.max_wait)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            group.append(item)
+        return group
+
+    def _run(self):
+        conn = self.pool.connection()
+        while True:
+            group = self._next_group()
+            if group is None:
+                return
+            try:
+                with conn:
+                    results = [fn(conn, *args) for fn, args, _ in group]
+            except Exception:
+                # One bad write must not fail its neighbours: retry them one by one
+                for fn, args, future in group:
+                    try:
+                        with conn:
+                            future.set_result(fn(conn, *args))
+                    except Exception as e:
+                        future.set_exception(e)
+                continue
+            for (_, _, future), result in zip(group, results):
+                future.set_result(result)
@@ -0,0 +1,117 @@
+"""Background extraction queue for the desktop app.
+
+Files are extracted on worker threads, so the Tk main loop never waits on
+PDF parsing, spaCy or the worker pool. Threads report finished jobs on a
+queue.Queue that the window drains from root.after; Tk widgets and the
+window's SQLite connection are only touched on the main thread.
+"""
+import itertools
+import queue
+import threading
+import time
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+
+class FileJob:
+    __slots__ = ('id', 'path', 'state', 'info', 'digest', 'error', 'elapsed_ms')
+
+    def __init__(self, job_id, path):
+        self.id = job_id
+        self.path = path
+        self.state = QUEUED
+        self.info = None
+        self.digest = None
+        self.error = None
+        self.elapsed_ms = None
+
+    @property
+    def finished(self):
+        return self.state in (DONE, FAILED, CANCELLED)
+
+
+class ExtractionQueue:
+    """Extracts queued files on `threads` daemon threads with extract(path) -> (ResumeInfo, content hash)"""
+
+    def __init__(self, extract, threads=1):
+        self.extract = extract
+        self.threads = max(1, threads)
+        self.jobs = {}
+        # (job, new state) for every state change, oldest first, for the UI to pick up
+        self.events = queue.Queue()
+        self._pending = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._workers = []
+
+    def add(self, paths):
+        """Queue files for extraction; returns their jobs"""
+        jobs = []
+        for path in paths:
+            job = FileJob(next(self._ids), path)
+            self.jobs[job.id] = job
+            self._pending.put(job)
+            jobs.append(job)
+        # Threads start with the first file, not with the window
+        while len(self._workers) < min(self.threads, len(self.jobs)):
+            worker = threading.Thread(target=self._work, name=f"extract-{len(self._workers)}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        return jobs
+
+    def cancel(self, job_id):
+        """Cancel a job. A queued file is skipped; a running one finishes but its result is dropped"""
+        job = self.jobs.get(job_id)
+        with self._lock:
+            if job is None or job.finished:
+                return False
+            job.state = CANCELLED
+        self.events.put((job, CANCELLED))
+        return True
+
+    def cancel_all(self):
+        return sum(self.cancel(job_id) for job_id in list(self.jobs))
+
+    def forget(self, job_id):
+        """Drop a finished job from jobs"""
+        job = self.jobs.get(job_id)
+        if job is not None and job.finished:
+            del self.jobs[job_id]
+
+    def counts(self):
+        counts = dict.fromkeys((QUEUED, RUNNING, DONE, FAILED, CANCELLED), 0)
+        for job in list(self.jobs.values()):
+            counts[job.state] += 1
+        return counts
+
+    def drain(self, limit):
+        """Up to `limit` (job, state) changes since the last call"""
+        changed = []
+        while len(changed) < limit:
+            try:
+                changed.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return changed
+
+    def _work(self):
+        while True:
+            job = self._pending.get()
+            with self._lock:
+                if job.state != QUEUED:
+                    continue
+                job.state = RUNNING
+            self.events.put((job, RUNNING))
+            started = time.perf_counter()
+            try:
+                (info, digest), error = self.extract(job.path), None
+            except Exception as e:
+                info, digest, error = None, None, str(e) or type(e).__name__
+            with self._lock:
+                job.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+                if job.state == CANCELLED:
+                    # Already reported when it was cancelled
+                    continue
+                job.info, job.digest, job.error = info, digest, error
+                job.state = FAILED if error else DONE
+            self.events.put((job, job.state))
@@ -1,10 +1,19 @@
-import spacy
-from spacy.matcher import PhraseMatcher
-import PyPDF2
 import re
+import threading
+import time
+from datetime import datetime
 
-nlp = spacy.load("en_core_web_sm")
-matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+from backend import settings
+from backend.nlp_pipeline import load_pipeline
+from backend.skill_matcher import load_skill_matcher
+from backend.skill_scanner import SkillScanner
+from backend.pdf_text import extract_pdf_text, iter_pdf_pages, read_pdf_pages
+from backend.budget import ExtractionBudget
+from backend.sections import KNOWN_HEADER, SectionIndex
+from backend.records import ResumeInfo
+
+# Bump whenever extraction output changes; cached results keyed on it are dropped
+EXTRACTOR_VERSION = "5"
 
 COMMON_SKILLS = [
     # Add your skills here, e.g.:
@@ -12,301 +21,297 @@ COMMON_SKILLS = [
     'machine learning', 'deep learning', 'data science', 'nlp', 'aws', 'azure', 'git', 'docker', 'kubernetes'
 ]
 
-patterns = [nlp.make_doc(skill) for skill in COMMON_SKILLS]
-matcher.add("SKILLS", patterns)
-
-def extract_text_from_pdf(file_path):
-    text = ""
-    with open(file_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
-        for page in pdf_reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text
-    return text
-
-def extract_information(text):
-    doc = nlp(text)
-    lines = text.split('\n')
-    info = {
-        'name': '',
-        'email': '',
-        'phone': '',
-        'skills': [],
-        'work_experience': [],
-        'cgpa': ''
-    }
+# spaCy and the model are loaded on first use, so importing this module
+# (e.g. to serve GET /resumes) stays cheap
+_pipeline = None
+_pipeline_lock = threading.Lock()
+_scanner = None
+# Seconds spent building the pipeline (or scanner) in this process, once built
+load_seconds = None
 
-    # 0. CGPA Extraction
-    import re
-    cgpa_pattern = re.compile(r'(CGPA|GPA)[^\d]*(\d\.\d{2,3})', re.I)
-    cgpa = ''
-    for line in lines:
-        match = cgpa_pattern.search(line)
-        if match:
-            cgpa = match.group(2)
-            break
-    if not cgpa:
-        # fallback: find first X.XX or X.XXX anywhere
-        match = re.search(r'\b(\d\.\d{2,3})\b', text)
-        if match:
-            cgpa = match.group(1)
-    info['cgpa'] = cgpa
-
-    # 1. Name Extraction: Prefer 'Name:' or 'Name -' label in top 12 lines
-    info['name'] = ''
-    lines = text.splitlines()
-    # Try to extract name from 'Name:' or 'Name -' label
-    for line in lines[:12]:
-        lstrip = line.strip()
-        if lstrip.lower().startswith('name:') or lstrip.lower().startswith('name -'):
+def get_pipeline():
+    """Return (nlp, matcher), loading them on the first call"""
+    global _pipeline, load_seconds
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                start = time.perf_counter()
+                nlp = load_pipeline(settings.SPACY_MODEL, settings.WEB_NLP_COMPONENTS)
+                # Prebuilt taxonomy artifact when there is one, else COMMON_SKILLS
+                matcher = load_skill_matcher(nlp, COMMON_SKILLS)
+                _pipeline = nlp, matcher
+                load_seconds = time.perf_counter() - start
+    return _pipeline
+
+def get_scanner():
+    """Aho-Corasick scanner over COMMON_SKILLS, for RSE_SKILL_ENGINE=scanner"""
+    global _scanner, load_seconds
+    if _scanner is None:
+        start = time.perf_counter()
+        _scanner = SkillScanner(COMMON_SKILLS)
+        load_seconds = time.perf_counter() - start
+    return _scanner
+
+def __getattr__(name):
+    # nlp and matcher used to be built at import; keep them reachable as attributes
+    if name == 'nlp':
+        return get_pipeline()[0]
+    if name == 'matcher':
+        return get_pipeline()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def make_doc(text):
+    # Tokenizer only unless components were opted back in
+    nlp = get_pipeline()[0]
+    return nlp(text) if nlp.pipe_names else nlp.make_doc(text)
+
+def warm_up():
+    # Lets pool workers and the API process pay the load cost before their first job
+    if settings.SKILL_ENGINE == 'scanner':
+        return get_scanner()
+    return get_pipeline()
+
+def find_skills(text, doc=None):
+    """Lowercased skill names in text, one per occurrence"""
+    if settings.SKILL_ENGINE == 'scanner':
+        # Whole-word scan of the raw text; spaCy is never loaded
+        return [name.lower() for name in get_scanner().skills(text)]
+    if doc is None:
+        doc = make_doc(text)
+    return [name.lower() for name in get_pipeline()[1].skills(doc)]
+
+def extract_text_from_pdf(file_path, pool=None):
+    # Pages are parsed one at a time (split over pool for long documents) and joined once
+    return extract_pdf_text(file_path, pool)
+
+# Field patterns, compiled once. Each runs as a single scan over the text
+# (or over one line), and the line-based rules share one walk over the lines.
+CGPA_LABEL = re.compile(r'(CGPA|GPA)[^\d\n]*(\d\.\d{2,3})', re.I)  # within one line
+CGPA_NUMBER = re.compile(r'\b(\d\.\d{2,3})\b')
+# The doubled backslashes make this match a literal "\d" only; kept as it was
+# so results do not change
+CGPA_OVERRIDE = re.compile(r'(?:CGPA|C\.G\.P\.A|GPA)[^\\d]{0,10}(\\d\\.\\d{2,3})', re.I)
+NAME_WORDS = re.compile(r'^([A-Z][a-zA-Z]+) ([A-Z][a-zA-Z]+)$')
+EMAIL_ALL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.(com|in|co\.in|ac\.in|net|org|edu|gov)(\.[a-z]{2,})*', re.I)
+EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.I)
+PHONE = re.compile(r'\b(\+?\d{1,3}[- ]?)?(\d{10,12})\b')
+YEAR = re.compile(r'(19[5-9][0-9]|20[0-4][0-9]|2050)')  # Years from 1950 to 2050
+EXPERIENCE_ENTRY = re.compile(r"^([A-Za-z\s\-&/]+),\s*([A-Za-z0-9\s\-&/()]+).*?(\w{3,9} \d{4}\s*[-–to]+\s*\w{3,9} \d{4}|Present|present)?$")
+
+NAME_SKIP_KEYWORDS = [
+    'curriculum vitae', 'resume', 'email', 'phone', 'contact', 'address', 'dob', 'date of birth',
+    'cgpa', 'gpa', 'linkedin', 'github', 'india', 'bengaluru', 'bangalore', 'delhi', 'mumbai', 'pune',
+    'summary', 'profile', 'objective', 'skills', 'education', 'career', 'professional', 'work experience',
+    'title', 'course', 'specialisation', 'specialization', 'department', 'branch', 'stream'
+]
+NAME_SKIP_TITLES = tuple(t + ' ' for t in ['mr', 'ms', 'mrs', 'dr', 'prof', 'sir', 'madam', 'miss', 'shri', 'smt'])
+
+def _name_candidate(lstrip):
+    # Lines that can't be a bare name line
+    if not lstrip:
+        return False
+    lwr = lstrip.lower()
+    return not any(k in lwr for k in NAME_SKIP_KEYWORDS) and not lwr.startswith(NAME_SKIP_TITLES)
+
+def _extract_name(stripped):
+    # Prefer 'Name:' or 'Name -' label in top 12 lines
+    for lstrip in stripped[:12]:
+        lwr = lstrip.lower()
+        if lwr.startswith('name:') or lwr.startswith('name -'):
             possible_name = lstrip.split(':', 1)[-1].strip() if ':' in lstrip else lstrip.split('-', 1)[-1].strip()
             # Accept if at least 2 words, all capitalized or initialed
             words = possible_name.split()
             if len(words) >= 2 and all(w[0].isupper() for w in words if w and w[0].isalpha()):
-                info['name'] = possible_name
-                break
-    # Fallback: Strictly from top 6 lines, avoid titles and keywords
-    if not info['name']:
-        skip_keywords = [
-            'curriculum vitae', 'resume', 'email', 'phone', 'contact', 'address', 'dob', 'date of birth',
-            'cgpa', 'gpa', 'linkedin', 'github', 'india', 'bengaluru', 'bangalore', 'delhi', 'mumbai', 'pune',
-            'summary', 'profile', 'objective', 'skills', 'education', 'career', 'professional', 'work experience',
-            'title', 'course', 'specialisation', 'specialization', 'department', 'branch', 'stream'
-        ]
-        skip_titles = ['mr', 'ms', 'mrs', 'dr', 'prof', 'sir', 'madam', 'miss', 'shri', 'smt']
-        for line in lines[:6]:
-            lstrip = line.strip()
-            if not lstrip:
-                continue
-            lwr = lstrip.lower()
-            if any(k in lwr for k in skip_keywords):
-                continue
-            if any(lwr.startswith(t + ' ') for t in skip_titles):
-                continue
-            words = lstrip.split()
-            # Require at least 2 words, all capitalized and alphabetic, no digits
-            if len(words) >= 2 and all(w[0].isupper() and w.isalpha() for w in words) and not any(char.isdigit() for char in lstrip):
-                info['name'] = lstrip.title()
-                break
-        # Fallback: regex for two capitalized words (first 6 lines)
-        if not info['name']:
-            import re
-            for line in lines[:6]:
-                lstrip = line.strip()
-                if not lstrip:
-                    continue
-                lwr = lstrip.lower()
-                if any(k in lwr for k in skip_keywords):
-                    continue
-                if any(lwr.startswith(t + ' ') for t in skip_titles):
-                    continue
-                match = re.match(r'^([A-Z][a-zA-Z]+) ([A-Z][a-zA-Z]+)$', lstrip)
-                if match:
-                    info['name'] = match.group(0)
-                    break
-    # If still no plausible name, leave blank
-
-    # 2. Email Extraction (robust multi-TLD, extract all)
-    import re
-    email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.(com|in|co\.in|ac\.in|net|org|edu|gov)(\.[a-z]{2,})*', re.IGNORECASE)
-    all_emails = email_pattern.findall(text)
-    # findall returns tuples, so we need to use finditer to get full matches
-    info['emails'] = [m.group(0) for m in email_pattern.finditer(text)]
-    info['email'] = info['emails'][0] if info['emails'] else ''
-
-    # 2.5. Work Experience Extraction: Prefer direct statement in top 20 lines
-    info['total_experience'] = None
-    for line in lines[:20]:
-        lstrip = line.strip()
-        match = re.search(r'(work experience|experience)(\s*\(years\))?\s*[:\-]?\s*(\d+(?:\.\d+)?)', lstrip, re.IGNORECASE)
+                return possible_name
+    # Fallback: strictly from top 6 lines, avoid titles and keywords
+    candidates = [lstrip for lstrip in stripped[:6] if _name_candidate(lstrip)]
+    for lstrip in candidates:
+        words = lstrip.split()
+        # Require at least 2 words, all capitalized and alphabetic, no digits
+        if len(words) >= 2 and all(w[0].isupper() and w.isalpha() for w in words) and not any(char.isdigit() for char in lstrip):
+            return lstrip.title()
+    # Fallback: two capitalized words
+    for lstrip in candidates:
+        match = NAME_WORDS.match(lstrip)
         if match:
-            try:
-                info['total_experience'] = float(match.group(3))
-            except Exception:
-                pass
-            break
-    # Fallback: previous logic if not found (leave as None or handle below)
-    # For compatibility, always set work_experience to total_experience if present
-    if info['total_experience'] is not None:
-        info['work_experience'] = info['total_experience']
-
-    # 3. Technical Skills Extraction (section-aware, comma-separated)
-    skills_section_idx = -1
-    next_section_idx = None
-    skill_section_headers = [r"technical skills"]
-    for i, line in enumerate(lines):
-        if any(re.match(rf"^\s*{header}\s*:?$", line.strip(), re.I) for header in skill_section_headers):
-            skills_section_idx = i
-            break
-    extracted_skills = set()
-    if skills_section_idx != -1:
-        # The skills are usually on the next line after the header
-        skill_line = lines[skills_section_idx+1] if skills_section_idx+1 < len(lines) else ''
-        extracted_skills = set(s.strip().lower() for s in skill_line.split(',') if len(s.strip()) > 1)
-    # Add matcher-based skills
-    matches = matcher(doc)
-    for match_id, start, end in matches:
-        span = doc[start:end]
-        extracted_skills.add(span.text.lower())
-    info['skills'] = sorted(set(extracted_skills))
-
-    # 3. Email and Phone Extraction (all emails, multi-part domains)
-    email_pattern = re.compile(r"[a-zA-Z0-9_.+-]+@[-a-zA-Z0-9]+(\.[a-zA-Z0-9-]+)+")
-    all_emails = email_pattern.findall(text)
-    all_emails_full = re.findall(email_pattern, text)
-    # Findall returns only groups, so use finditer to get full matches
-    emails = [m.group() for m in email_pattern.finditer(text)]
-    # Prefer .ac.in or .edu, else first
-    preferred_email = next((e for e in emails if ".ac.in" in e or ".edu" in e), emails[0] if emails else "")
-    info['email'] = preferred_email
-    # Phone extraction (first valid)
-    phone_pattern = re.compile(r"\b(\+?\d{1,3}[- ]?)?(\d{10,12})\b")
-    for line in lines:
-        if not info['phone']:
-            match = phone_pattern.search(line)
-            if match:
-                info['phone'] = match.group()
-        if not info['phone']:
-            match = phone_pattern.search(line)
-            if match:
-                info['phone'] = match.group()
-        if info['email'] and info['phone']:
-            break
-
-    # 4. Work Experience Extraction (resume-specific, structured)
-    import re
-    exp_section_idx = -1
-    next_exp_section_idx = None
-    exp_headers = ["work experience", "experience", "professional experience", "employment history", "career history"]
-    for i, line in enumerate(lines):
-        if any(h == line.strip().lower() for h in exp_headers):
-            exp_section_idx = i
-            break
-    # Find next section header (all-caps or known section)
-    known_section_headers = ["projects", "position of responsibility", "entrepreneurship", "extra curriculars", "education", "skills", "summary", "profile", "objective"]
-    if exp_section_idx != -1:
-        for j in range(exp_section_idx+1, len(lines)):
-            if re.match(r"^[A-Z][A-Z\s\-]{2,}$", lines[j].strip()) or any(h in lines[j].strip().lower() for h in known_section_headers):
-                next_exp_section_idx = j
-                break
-        exp_lines = lines[exp_section_idx+1:next_exp_section_idx] if next_exp_section_idx else lines[exp_section_idx+1:]
-    else:
-        exp_lines = []
+            return match.group(0)
+    return ''
 
-    experience_entries = []
+def _extract_experience(exp_lines):
+    # exp_lines are the stripped lines of the experience section
+    entries = []
     i = 0
-    def is_caps_line(line):
-        return line.isupper() and len(line) > 4 and not any(h in line.strip().lower() for h in known_section_headers)
     while i < len(exp_lines):
-        line = exp_lines[i].strip()
-        # Detect entry header: all caps (not section), or loose pattern with comma and date at end
-        entry_match = re.match(r"^([A-Za-z\s\-&/]+),\s*([A-Za-z0-9\s\-&/()]+).*?(\w{3,9} \d{4}\s*[-–to]+\s*\w{3,9} \d{4}|Present|present)?$", line)
-        if is_caps_line(line) or entry_match:
-            if entry_match:
-                position = entry_match.group(1).strip()
-                organization = entry_match.group(2).strip()
-                duration = entry_match.group(3).strip() if entry_match.group(3) else ''
-            else:
-                position = line
-                organization = ''
-                duration = ''
-            description_lines = []
-            j = i + 1
-            while j < len(exp_lines):
-                desc_line = exp_lines[j].strip()
-                if desc_line.startswith(('-', '•', '*')):
-                    description_lines.append(desc_line.lstrip('-•*').strip())
-                    j += 1
-                else:
-                    break
-            experience_entries.append({
-                'position': position,
-                'organization': organization,
-                'duration': duration,
-                'description': ' '.join(description_lines)
-            })
-            i = j
-        else:
+        line = exp_lines[i]
+        # Entry header: all caps (not a section), or comma with an optional date range at the end
+        entry_match = EXPERIENCE_ENTRY.match(line)
+        is_caps_line = line.isupper() and len(line) > 4 and not KNOWN_HEADER.search(line.lower())
+        if not (is_caps_line or entry_match):
             # fallback: just add raw line if non-empty
             if line:
-                experience_entries.append({'raw': line})
+                entries.append({'raw': line})
             i += 1
-    # Calculate total work experience duration (oldest year method)
-    import re
-    from datetime import datetime
-    now = datetime.now()
-    current_year = now.year
-    # Gather all years from the entire resume text
-    years_found = []
-    year_pattern = re.compile(r'(19[5-9][0-9]|20[0-4][0-9]|2050)')  # Years from 1950 to 2050
-    for match in year_pattern.findall(text):
-        y = int(match)
-        if 1950 <= y <= current_year:
-            years_found.append(y)
-    if years_found:
-        oldest = min(years_found)
-        info['total_experience'] = current_year - oldest
+            continue
+        if entry_match:
+            position = entry_match.group(1).strip()
+            organization = entry_match.group(2).strip()
+            duration = entry_match.group(3).strip() if entry_match.group(3) else ''
+        else:
+            position, organization, duration = line, '', ''
+        description_lines = []
+        j = i + 1
+        while j < len(exp_lines) and exp_lines[j].startswith(('-', '•', '*')):
+            description_lines.append(exp_lines[j].lstrip('-•*').strip())
+            j += 1
+        entries.append({
+            'position': position,
+            'organization': organization,
+            'duration': duration,
+            'description': ' '.join(description_lines)
+        })
+        i = j
+    return entries
+
+def _extract_cgpa(text, lines):
+    # First labelled value, else the first X.XX or X.XXX anywhere
+    match = CGPA_LABEL.search(text)
+    if match:
+        cgpa = match.group(2)
     else:
-        info['total_experience'] = 0
-    info['work_experience'] = experience_entries
-
-    # Improved email extraction: robust extraction for .com, .in, .co.in, etc.
-    import re
-    email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.IGNORECASE)
-    match = email_pattern.search(text)
-    email = match.group(0) if match else None
-    info['email'] = email
-
-    # 3. Email and Phone Extraction (unchanged)
-    email_pattern = re.compile(r"[\w\.-]+@[\w\.-]+", re.I)
-    phone_pattern = re.compile(r"\b(\+?\d{1,3}[- ]?)?(\d{10,12})\b")
-    for line in lines:
-        if not info['email']:
-            match = email_pattern.search(line)
-            if match:
-                info['email'] = match.group()
-        if not info['phone']:
-            match = phone_pattern.search(line)
+        match = CGPA_NUMBER.search(text)
+        cgpa = match.group(1) if match else ''
+    if '\\' in text:
+        for line in lines:
+            match = CGPA_OVERRIDE.search(line)
             if match:
-                info['phone'] = match.group()
-        if info['email'] and info['phone']:
-            break
-
-    # 4. Work Experience Extraction (section-aware, stricter)
-    job_keywords = [
-        "intern", "engineer", "manager", "developer", "consultant", "analyst", "lead", "specialist", "director", "officer", "associate", "architect", "scientist", "administrator", "coordinator",
-        "designer", "executive", "trainer", "supervisor", "president", "vice", "head", "founder", "cofounder", "researcher", "professor", "lecturer"
-    ]
-    years_found = []
-    year_pattern = re.compile(r'(19[5-9][0-9]|20[0-4][0-9]|2050)')  # Years from 1950 to 2050
-    for match in year_pattern.findall(text):
-        y = int(match)
-        if 1950 <= y <= current_year:
-            years_found.append(y)
-    if years_found:
-        oldest = min(years_found)
-        info['total_experience'] = current_year - oldest
+                cgpa = match.group(1)
+                break
+    return cgpa
+
+def extract_information(text, doc=None):
+    # One walk over the lines finds every section; each rule below reads its own
+    sections = SectionIndex(text)
+    lines, stripped = sections.lines, sections.stripped
+
+    cgpa = _extract_cgpa(text, lines)
+
+    # Emails: all robust multi-TLD matches, plus the first generic one as the email
+    if '@' in text:
+        emails = [m.group(0) for m in EMAIL_ALL.finditer(text)]
+        match = EMAIL.search(text)
+        email = match.group(0) if match else None
     else:
-        info['total_experience'] = 0
-    info['work_experience'] = experience_entries
-
-    # Improved email extraction: robust extraction for .com, .in, .co.in, etc.
-    import re
-    email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.IGNORECASE)
-    match = email_pattern.search(text)
-    email = match.group(0) if match else None
-    info['email'] = email
-
-    # 5. CGPA Extraction
-    cgpa_regex = re.compile(r'(?:CGPA|C\.G\.P\.A|GPA)[^\\d]{0,10}(\\d\\.\\d{2,3})', re.I)
-    cgpa_found = None
-    for line in lines:
-        m = cgpa_regex.search(line)
-        if m:
-            cgpa_found = m.group(1)
-            break
-    if cgpa_found:
-        info['cgpa'] = cgpa_found
+        emails, email = [], None
+
+    # Phone: first valid number (the pattern never spans lines)
+    match = PHONE.search(text)
+    phone = match.group() if match else ''
+
+    # Technical skills: comma-separated line after the header, plus matcher hits
+    skills = set()
+    skills_section = sections.get('technical skills')
+    if skills_section:
+        skill_line = lines[skills_section.start_line] if skills_section.start_line < len(lines) else ''
+        skills = set(s.strip().lower() for s in skill_line.split(',') if len(s.strip()) > 1)
+    skills.update(find_skills(text, doc))
 
+    # Total experience: years since the oldest year mentioned anywhere
+    current_year = datetime.now().year
+    years = [y for y in map(int, YEAR.findall(text)) if 1950 <= y <= current_year]
+
+    return {
+        'name': _extract_name(stripped),
+        'email': email,
+        'phone': phone,
+        'skills': sorted(skills),
+        # Entries between the experience header and the next section
+        'work_experience': _extract_experience(sections.lines_of('experience')),
+        'cgpa': cgpa,
+        'emails': emails,
+        'total_experience': current_year - min(years) if years else 0,
+    }
+
+def _settled_match(pattern, text, start, settled):
+    # A match inside the complete lines can't change as more text arrives:
+    # none of the header patterns can run across a line break
+    match = pattern.search(text, start, settled)
+    return match.group() if match else None
+
+def extract_header_fields(pages):
+    """name, email and phone from an iterable of page texts.
+
+    Pages are consumed only until all three are settled, so for a PDF the
+    rest of the document is never parsed. The values are the ones
+    extract_information would give for the whole text.
+    """
+    text = ''
+    name = email = phone = None
+    searched = 0
+    for page in pages:
+        text += page
+        # The last line may continue on the next page
+        settled = text.rfind('\n') + 1
+        if name is None:
+            lines = text[:settled].splitlines()
+            # The name rules only look at the first 12 lines
+            if len(lines) >= 12:
+                name = _extract_name([line.strip() for line in lines])
+        email = email or _settled_match(EMAIL, text, searched, settled)
+        phone = phone or _settled_match(PHONE, text, searched, settled)
+        searched = settled
+        if name is not None and email and phone:
+            return {'name': name, 'email': email, 'phone': phone}
+    if name is None:
+        name = _extract_name([line.strip() for line in text.splitlines()])
+    if not email:
+        email = _settled_match(EMAIL, text, searched, len(text))
+    if not phone:
+        phone = _settled_match(PHONE, text, searched, len(text)) or ''
+    return {'name': name, 'email': email, 'phone': phone}
+
+def extract_pdf_header(file_path):
+    # Only the first pages are parsed unless a field is missing from them
+    return extract_header_fields(iter_pdf_pages(file_path, max_pages=ExtractionBudget().max_pages))
+
+def extract_skills(text):
+    # Skills named in free text (e.g. a job description), same matcher as resumes
+    return sorted(set(find_skills(text)))
+
+def extract_information_batch(items, batch_size=32, n_process=1):
+    # items: iterable of (text, context) pairs; yields (info, context) in input order
+    # while spaCy processes the texts in batches
+    if settings.SKILL_ENGINE == 'scanner':
+        for text, context in items:
+            yield extract_information(text), context
+        return
+    docs = get_pipeline()[0].pipe(items, as_tuples=True, batch_size=batch_size, n_process=n_process)
+    for doc, context in docs:
+        yield extract_information(doc.text, doc=doc), context
+
+def extract_header_info(header):
+    # The cheap, regex-only fields, for a document too long to analyse whole
+    info = extract_header_fields([header])
+    info['cgpa'] = _extract_cgpa(header, header.splitlines())
     return info
+
+def apply_budget(info, header, truncated, pdf, text=''):
+    # ResumeInfo for fields extracted from ExtractionBudget.split's text;
+    # that text is kept on it for the full-text index
+    if header is not None:
+        info.update(extract_header_info(header))
+    info['text'] = text
+    info['truncated'] = truncated
+    # Which PDF backend produced the text, and how long it took
+    info['pdf'] = pdf
+    return ResumeInfo.from_dict(info)
+
+def read_resume_pages(file_path):
+    # Pool job: page texts within the extraction budget, and the PDF report
+    return read_pdf_pages(file_path, budget=ExtractionBudget())
+
+def extract_resume(file_path):
+    # Job entry point for the extraction worker pool
+    budget = ExtractionBudget()
+    pages, pdf = read_pdf_pages(file_path, budget=budget)
+    text, header, truncated = budget.split(pages, pdf)
+    return apply_budget(extract_information(text), header, truncated, pdf, text)
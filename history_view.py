@@ -0,0 +1,113 @@
+"""Incrementally loaded history list for the desktop app.
+
+Rows are read a page at a time, newest first, with keyset queries on
+(upload_date, id), and the next page only when the list is scrolled to its
+end. Items are keyed by resume id, so a status change, a delete or a new
+upload touches just the items concerned instead of reloading the list.
+"""
+from backend import settings
+
+# upload_date is an isoformat string; its first 16 characters are the minute
+HISTORY_SELECT = "SELECT id, substr(replace(upload_date, 'T', ' '), 1, 16), filename, status, upload_date FROM resumes"
+STATUS_TAGS = {'Accept': ('accept',), 'Reject': ('reject',)}
+
+
+class HistoryView:
+    """Pages resumes rows into a ttk.Treeview with Date, Filename and Status columns"""
+
+    def __init__(self, tree, conn, page_size=None):
+        self.tree = tree
+        self.conn = conn
+        self.page_size = page_size or settings.DESKTOP_HISTORY_PAGE
+        # Tags are configured once, not per row
+        tree.tag_configure('accept', foreground='green')
+        tree.tag_configure('reject', foreground='red')
+        self._conditions = []
+        self._params = []
+        self._status = None
+        self._last = None
+        self._exhausted = True
+
+    def show(self, status=None, ids_sql=None, params=()):
+        """Replace the list with the first page of matching rows.
+
+        status keeps one status only; ids_sql is a subquery of the resume ids
+        to show, with its params.
+        """
+        self.clear()
+        self._conditions, self._params = [], []
+        if status:
+            self._conditions.append("status = ?")
+            self._params.append(status)
+        if ids_sql:
+            self._conditions.append(f"id IN ({ids_sql})")
+            self._params.extend(params)
+        self._status = status
+        self._last = None
+        self._exhausted = False
+        self.load_more()
+
+    def clear(self):
+        """Empty the list; scrolling loads nothing until the next show()"""
+        self.tree.delete(*self.tree.get_children())
+        self._exhausted = True
+
+    def load_more(self):
+        """Append the next page; returns the number of rows added"""
+        if self._exhausted:
+            return 0
+        conditions, params = list(self._conditions), list(self._params)
+        if self._last is not None:
+            conditions.append("(upload_date, id) < (?, ?)")
+            params.extend(self._last)
+        rows = self.conn.execute(
+            f"{HISTORY_SELECT}{self._where(conditions)} ORDER BY upload_date DESC, id DESC LIMIT ?",
+            params + [self.page_size],
+        ).fetchall()
+        for row in rows:
+            self._insert('end', row)
+        if rows:
+            self._last = (rows[-1][4], rows[-1][0])
+        self._exhausted = len(rows) < self.page_size
+        return len(rows)
+
+    def on_scroll(self, first, last):
+        """yscrollcommand hook: loads the next page once the end of the list is in view"""
+        if not self._exhausted and float(last) >= 1.0:
+            self.load_more()
+
+    def add(self, resume_ids):
+        """Show newly saved resumes at the top, if they match the current filter"""
+        if not resume_ids:
+            return
+        conditions = self._conditions + [f"id IN ({','.join('?' * len(resume_ids))})"]
+        rows = self.conn.execute(
+            f"{HISTORY_SELECT}{self._where(conditions)} ORDER BY upload_date ASC, id ASC",
+            self._params + list(resume_ids),
+        ).fetchall()
+        for row in rows:
+            if not self.tree.exists(str(row[0])):
+                self._insert(0, row)
+
+    def set_status(self, resume_id, status):
+        iid = str(resume_id)
+        if not self.tree.exists(iid):
+            return
+        if self._status and status != self._status:
+            # No longer matches the status filter
+            self.tree.delete(iid)
+            return
+        date, filename, _ = self.tree.item(iid, 'values')
+        self.tree.item(iid, values=(date, filename, status), tags=STATUS_TAGS.get(status, ()))
+
+    def remove(self, resume_id):
+        iid = str(resume_id)
+        if self.tree.exists(iid):
+            self.tree.delete(iid)
+
+    def _insert(self, index, row):
+        self.tree.insert('', index, iid=str(row[0]), values=(row[1], row[2], row[3]), tags=STATUS_TAGS.get(row[3], ()))
+
+    @staticmethod
+    def _where(conditions):
+        return f" WHERE {' AND '.join(conditions)}" if conditions else ""
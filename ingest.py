@@ -0,0 +1,255 @@
+"""Offline bulk ingest of resume PDFs into the API's database.
+
+    python -m backend.ingest SOURCE [SOURCE ...] --db db.sqlite3
+
+A source is a PDF, a directory (walked recursively) or a zip/tar archive,
+including archives found inside directories. PDFs are extracted on a
+process pool over every core and saved in batched transactions. A file whose
+content hash is already in resumes is skipped. Every source file is logged in
+ingest_files in the same transaction as its resume, so a run that was
+interrupted carries on after its last committed batch when started again.
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+from collections import Counter, deque
+from datetime import datetime
+
+from backend import settings
+from backend.cache import file_digest
+from backend.db import ConnectionPool
+from backend.extractor import extract_resume, warm_up
+from backend.migrations import migrate, WEB_MIGRATIONS
+from backend.resume_store import insert_resumes
+from backend.worker_pool import ExtractionPool
+
+INGESTED, DUPLICATE, FAILED = "ingested", "duplicate", "failed"
+
+ZIP_SUFFIXES = ('.zip',)
+TAR_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def _is_pdf(name):
+    return name.lower().endswith('.pdf')
+
+
+def _archive_members(path):
+    # (source, filename, size, None, opener) per PDF in a zip or tar archive;
+    # the opener is only valid until the next member is yielded
+    lower = path.lower()
+    if lower.endswith(ZIP_SUFFIXES):
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.infolist():
+                if not member.is_dir() and _is_pdf(member.filename):
+                    yield (f"{path}::{member.filename}", os.path.basename(member.filename), member.file_size,
+                           None, lambda member=member: archive.open(member))
+    else:
+        # Streamed member by member, so compressed tars are read once
+        with tarfile.open(path, 'r:*') as archive:
+            for member in archive:
+                if member.isfile() and _is_pdf(member.name):
+                    yield (f"{path}::{member.name}", os.path.basename(member.name), member.size,
+                           None, lambda member=member: archive.extractfile(member))
+
+
+def iter_sources(paths, on_error=None):
+    """(source, filename, size, path on disk or None, opener or None) for every PDF under paths.
+
+    A file or archive that can't be read is passed to on_error(path, exception)
+    and the walk goes on with the next one; without on_error it raises.
+    """
+    for path in paths:
+        try:
+            if os.path.isdir(path):
+                for dirpath, dirnames, files in os.walk(path):
+                    dirnames.sort()
+                    for name in sorted(files):
+                        yield from iter_sources([os.path.join(dirpath, name)], on_error)
+            elif path.lower().endswith(ZIP_SUFFIXES + TAR_SUFFIXES):
+                # Members yielded before a corrupt part of the archive are kept
+                yield from _archive_members(path)
+            elif _is_pdf(path):
+                yield path, os.path.basename(path), os.path.getsize(path), path, None
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(path, e)
+
+
+def _error_text(error):
+    return str(error) or type(error).__name__
+
+
+def _stage(opener, dest):
+    # Copies an archive member to disk for the workers; returns its sha256
+    digest = hashlib.sha256()
+    try:
+        with opener() as src, open(dest, 'wb') as dst:
+            for chunk in iter(lambda: src.read(settings.UPLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                dst.write(chunk)
+    except BaseException:
+        if os.path.exists(dest):
+            os.remove(dest)
+        raise
+    return digest.hexdigest()
+
+
+class Ingest:
+    """One ingest run into a migrated connection, extracting on pool"""
+
+    def __init__(self, conn, pool, batch_size=500, window=None, retry_failed=False, progress_every=2.0, out=sys.stdout):
+        self.conn = conn
+        self.pool = pool
+        self.batch_size = batch_size
+        self.window = window or pool.workers * 2
+        self.progress_every = progress_every
+        self.out = out
+        skip_sql = "SELECT source FROM ingest_files"
+        if retry_failed:
+            skip_sql += f" WHERE state != '{FAILED}'"
+        # Checkpoint: every source logged by a committed batch
+        self.done = {row[0] for row in conn.execute(skip_sql)}
+        # content hash -> resume id, for skipping content ingested before
+        self.known = dict(conn.execute("SELECT content_hash, id FROM resumes WHERE content_hash IS NOT NULL").fetchall())
+        self.stats = Counter()
+        self._rows = []
+        self._log = []
+        self._started = self._last_report = None
+
+    def run(self, paths):
+        self._started = self._last_report = time.perf_counter()
+        pending = deque()
+        with tempfile.TemporaryDirectory(prefix='rse-ingest-') as staging:
+
+            def unreadable(source, error):
+                # A broken file or archive fails on its own; the run goes on
+                if source in self.done:
+                    self.stats['resumed'] += 1
+                    return
+                self._record(source, None, FAILED, 0, error=_error_text(error))
+
+            def staged():
+                # Paths for the pool; what's needed to save each result goes in pending
+                for n, (source, filename, size, path, opener) in enumerate(iter_sources(paths, unreadable)):
+                    if source in self.done:
+                        self.stats['resumed'] += 1
+                        continue
+                    try:
+                        if path is None:
+                            path = os.path.join(staging, f"{n}.pdf")
+                            digest = _stage(opener, path)
+                        else:
+                            digest = file_digest(path)
+                    except Exception as e:
+                        self._record(source, None, FAILED, size, error=_error_text(e))
+                        continue
+                    if digest in self.known:
+                        self._record(source, digest, DUPLICATE, size, resume_id=self.known[digest])
+                        if opener is not None:
+                            os.remove(path)
+                        continue
+                    # Same content later in this run is a duplicate of this file
+                    self.known[digest] = None
+                    pending.append((source, filename, size, path if opener is not None else None, digest))
+                    yield path
+
+            try:
+                for future in self.pool.imap(extract_resume, staged(), self.window):
+                    source, filename, size, staged_path, digest = pending.popleft()
+                    try:
+                        info = future.result(timeout=self.pool.timeout)
+                    except Exception as e:
+                        self._record(source, digest, FAILED, size, error=_error_text(e))
+                        # A later copy is extracted again rather than logged as a duplicate
+                        self.known.pop(digest, None)
+                    else:
+                        self._rows.append((source, filename, info, digest))
+                        self.stats['bytes'] += size
+                    if staged_path is not None:
+                        os.remove(staged_path)
+                    if len(self._rows) + len(self._log) >= self.batch_size:
+                        self.commit()
+                    self.report()
+            finally:
+                # Whatever finished is kept, interrupted or not
+                self.commit()
+        self.report(final=True)
+        return self.stats
+
+    def _record(self, source, digest, state, size, resume_id=None, error=None):
+        self._log.append((source, digest, state, resume_id, error))
+        self.stats['bytes'] += size
+        self.stats[state] += 1
+
+    def commit(self):
+        """Save the results so far and their ingest_files entries in one transaction"""
+        if not self._rows and not self._log:
+            return
+        now = datetime.now().isoformat()
+        with self.conn:
+            indexed = insert_resumes(self.conn, [(filename, info, digest) for _, filename, info, digest in self._rows])
+            entries = [(source, digest, INGESTED, resume_id, None, now)
+                       for (source, _, _, digest), (resume_id, _) in zip(self._rows, indexed)]
+            entries += [entry + (now,) for entry in self._log]
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO ingest_files (source, content_hash, state, resume_id, error, ingested_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", entries)
+        for (_, _, _, digest), (resume_id, _) in zip(self._rows, indexed):
+            self.known[digest] = resume_id
+        self.stats[INGESTED] += len(self._rows)
+        self._rows, self._log = [], []
+
+    def report(self, final=False):
+        now = time.perf_counter()
+        if not final and now - self._last_report < self.progress_every:
+            return
+        self._last_report = now
+        elapsed = max(now - self._started, 1e-9)
+        stats = self.stats
+        ingested = stats[INGESTED] + len(self._rows)
+        handled = ingested + stats[DUPLICATE] + stats[FAILED]
+        print(f"[{elapsed:7.1f}s] {handled} files: {ingested} ingested, {stats[DUPLICATE]} duplicate, "
+              f"{stats[FAILED]} failed, {stats['resumed']} done before | "
+              f"{handled / elapsed:.1f} files/s {stats['bytes'] / elapsed / 1e6:.2f} MB/s", file=self.out, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ingest resume PDFs from directories and zip/tar archives')
+    parser.add_argument('sources', nargs='+', help='PDFs, directories or zip/tar archives')
+    parser.add_argument('--db', default='db.sqlite3', help="the API's database")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='extraction processes')
+    parser.add_argument('--batch', type=int, default=500, help='files per transaction')
+    parser.add_argument('--retry-failed', action='store_true', help='extract files that failed in an earlier run again')
+    args = parser.parse_args(argv)
+
+    conn = ConnectionPool(args.db).dedicated()
+    migrate(conn, WEB_MIGRATIONS)
+    pool = ExtractionPool(workers=args.workers, queue_depth=args.workers * 2, preload=(warm_up,))
+    pool.start()
+    ingest = Ingest(conn, pool, batch_size=args.batch, retry_failed=args.retry_failed)
+    try:
+        stats = ingest.run(args.sources)
+    except KeyboardInterrupt:
+        print("Interrupted; committed files are logged in ingest_files and skipped by the next run", file=sys.stderr)
+        pool.shutdown(wait=False)
+        conn.close()
+        return 130
+    pool.shutdown()
+    if stats[INGESTED]:
+        # Merge the full-text index segments the batches left behind
+        started = time.perf_counter()
+        conn.execute("INSERT INTO resume_text (resume_text) VALUES ('optimize')")
+        conn.commit()
+        print(f"Optimized the text index in {time.perf_counter() - started:.1f}s")
+    conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
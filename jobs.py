@@ -0,0 +1,219 @@
+import asyncio
+import json
+import logging
+from datetime import datetime
+
+from backend import settings
+from backend.cache import file_digest
+from backend.extractor import extract_resume, extract_pdf_header
+from backend.budget import cacheable
+from backend.worker_pool import get_pool, PoolBusy, ExtractionTimeout
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+def _now():
+    return datetime.now().isoformat()
+
+
+def _elapsed_ms(start, end):
+    if not start or not end:
+        return None
+    delta = datetime.fromisoformat(end) - datetime.fromisoformat(start)
+    return round(delta.total_seconds() * 1000, 1)
+
+
+class JobQueue:
+    """SQLite-backed extraction queue drained by asyncio workers feeding the pool.
+
+    The jobs table comes from the database's migrations.
+    """
+
+    def __init__(self, connect, save_result, workers=None, cache=None):
+        # connect() -> sqlite3 connection;
+        # await save_result(filename, info, content hash) -> resume row id
+        self.connect = connect
+        self.save_result = save_result
+        self.cache = cache
+        self.workers = workers or settings.JOB_WORKERS
+        self._wakeup = asyncio.Event()
+        self._tasks = []
+
+    def enqueue(self, filename, path, content_hash):
+        conn = self.connect()
+        cur = conn.execute(
+            "INSERT INTO jobs (filename, path, content_hash, state, created_at) VALUES (?, ?, ?, ?, ?)",
+            (filename, path, content_hash, QUEUED, _now()),
+        )
+        conn.commit()
+        conn.close()
+        self._wakeup.set()
+        return cur.lastrowid
+
+    def get(self, job_id):
+        conn = self.connect()
+        row = conn.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+        conn.close()
+        if not row:
+            return None
+        job = dict(row)
+        job.pop("path", None)
+        # name, email and phone from the first page, before the job is done
+        job["header"] = json.loads(job["header"]) if job["header"] else None
+        job["queue_ms"] = _elapsed_ms(job["created_at"], job["started_at"])
+        job["run_ms"] = _elapsed_ms(job["started_at"], job["finished_at"])
+        return job
+
+    @staticmethod
+    def pending(conn, content_hash):
+        """Whether a queued or running job still needs the file with this hash"""
+        return conn.execute(
+            "SELECT 1 FROM jobs WHERE content_hash=? AND state IN (?, ?) LIMIT 1", (content_hash, QUEUED, RUNNING)
+        ).fetchone() is not None
+
+    async def start(self):
+        conn = self.connect()
+        # Jobs that were running when the process died go back on the queue
+        resumed = conn.execute(
+            "UPDATE jobs SET state=?, started_at=NULL WHERE state=?", (QUEUED, RUNNING)
+        ).rowcount
+        conn.commit()
+        conn.close()
+        if resumed:
+            logger.info("Re-queued %d interrupted extraction jobs", resumed)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._wakeup.set()
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _claim(self):
+        conn = self.connect()
+        try:
+            row = conn.execute(
+                "SELECT id, filename, path, content_hash FROM jobs WHERE state=? ORDER BY id LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if not row:
+                return None
+            # The state check keeps two server processes from claiming the same job
+            claimed = conn.execute(
+                "UPDATE jobs SET state=?, started_at=?, attempts=attempts+1 WHERE id=? AND state=?",
+                (RUNNING, _now(), row["id"], QUEUED),
+            ).rowcount
+            conn.commit()
+            return dict(row) if claimed else None
+        finally:
+            conn.close()
+
+    def _finish(self, job_id, state, resume_id=None, error=None):
+        conn = self.connect()
+        try:
+            conn.execute(
+                "UPDATE jobs SET state=?, resume_id=?, error=?, finished_at=? WHERE id=?",
+                (state, resume_id, error, _now(), job_id),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _requeue(self, job_id):
+        conn = self.connect()
+        try:
+            conn.execute("UPDATE jobs SET state=?, started_at=NULL WHERE id=?", (QUEUED, job_id))
+            conn.commit()
+        finally:
+            conn.close()
+
+    async def _save_header(self, job_id, path):
+        try:
+            header = await get_pool().run_async(extract_pdf_header, path)
+        except Exception:
+            # Best effort: the full extraction reports what is wrong with the file
+            return
+        try:
+            conn = self.connect()
+            try:
+                conn.execute("UPDATE jobs SET header=? WHERE id=?", (json.dumps(header), job_id))
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception:
+            logger.exception("Could not save the header of extraction job %s", job_id)
+
+    async def _read_pdf(self, job_id, path):
+        # The header stops parsing once page 1 has every contact field, so it
+        # is on the job long before the full extraction is saved
+        header = asyncio.create_task(self._save_header(job_id, path))
+        try:
+            info = await get_pool().run_async(extract_resume, path)
+        except BaseException:
+            header.cancel()
+            raise
+        await header
+        return info
+
+    async def _extract(self, job_id, path, expected_hash=None):
+        """(info, content hash) for the file at path"""
+        digest = await asyncio.to_thread(file_digest, path)
+        # Jobs queued before content hashes were recorded have none to check
+        if expected_hash and digest != expected_hash:
+            raise ValueError("The uploaded file changed before it was extracted.")
+        if self.cache is None:
+            return await self._read_pdf(job_id, path), digest
+        info = self.cache.get(digest)
+        if info is None:
+            info = await self._read_pdf(job_id, path)
+            if cacheable(info):
+                self.cache.put(digest, info)
+        return info, digest
+
+    async def _worker(self):
+        while True:
+            try:
+                job = self._claim()
+            except Exception:
+                # e.g. "database is locked" past the busy timeout; the consumer
+                # waits and tries again rather than exiting
+                logger.exception("Could not claim an extraction job")
+                await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+                continue
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), settings.JOB_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Extraction job %s failed", job["id"])
+                self._fail(job["id"], str(e) or type(e).__name__)
+
+    async def _run(self, job):
+        try:
+            info, digest = await self._extract(job["id"], job["path"], job["content_hash"])
+        except PoolBusy:
+            # Synchronous uploads filled the pool; try again shortly
+            self._requeue(job["id"])
+            await asyncio.sleep(settings.POOL_RETRY_AFTER)
+            return
+        except ExtractionTimeout:
+            self._finish(job["id"], FAILED, error="Resume extraction timed out.")
+            return
+        resume_id = await self.save_result(job["filename"], info, digest)
+        self._finish(job["id"], DONE, resume_id=resume_id)
+
+    def _fail(self, job_id, error):
+        try:
+            self._finish(job_id, FAILED, error=error)
+        except Exception:
+            # Still marked running; start() re-queues it after a restart
+            logger.exception("Could not mark extraction job %s failed", job_id)
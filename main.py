@@ -1,62 +1,71 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException
+import time
+# Cold-start clock for /startup/stats, started before the heavy imports below
+_import_started = time.perf_counter()
+from fastapi import FastAPI, File, UploadFile, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from backend.extractor import extract_information, extract_text_from_pdf
-import sqlite3
+from backend.extractor import extract_information, apply_budget, read_resume_pages, extract_resume, extract_information_batch, extract_skills, warm_up
+from backend import extractor
+from backend.extractor import COMMON_SKILLS, EXTRACTOR_VERSION
+from backend.cache import ExtractionCache, cache_version
+from backend.skill_matcher import artifact_digest
+from backend.pdf_text import page_count, read_pdf_pages
+from backend.budget import ExtractionBudget, cacheable
+from backend.records import experience_from_column
+from backend.uploads import stage_upload, stage_file, staged_path, UploadTooLarge, UPLOAD_DIR
+from backend.worker_pool import get_pool, shutdown_pool, PoolBusy, ExtractionTimeout
+from backend.jobs import JobQueue
+from backend.matching import SkillRanker
+from backend.skill_index import unindex_resume, normalize_skill, parse_skill_query, skill_query_sql
+from backend.db import ConnectionPool, WriteQueue
+from backend.migrations import migrate, WEB_MIGRATIONS
+from backend.text_index import search_text
+from backend.resume_store import insert_resume, insert_resumes
+from backend import settings
+import asyncio
+import logging
 import os
+import json
+import zipfile
+from typing import List, Optional
+from pydantic import BaseModel
 
 from contextlib import asynccontextmanager
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    conn = get_db()
-    conn.execute('''CREATE TABLE IF NOT EXISTS resumes (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        filename TEXT,
-        name TEXT,
-        email TEXT,
-        phone TEXT,
-        skills TEXT,
-        work_experience TEXT,
-        cgpa TEXT
-    )''')
-    try:
-        conn.execute('ALTER TABLE resumes ADD COLUMN cgpa TEXT')
-    except Exception:
-        pass
-    conn.commit()
-    conn.close()
-    yield
+logger = logging.getLogger(__name__)
+startup_timings = {}
 
-# Create FastAPI app with lifespan
-app = FastAPI(lifespan=lifespan)
-
-# Serve React build (static files)
-frontend_build_dir = os.path.join(os.path.dirname(__file__), '..', 'frontend', 'build')
-if os.path.isdir(frontend_build_dir):
-    app.mount("/", StaticFiles(directory=frontend_build_dir, html=True), name="static")
+async def warm_up_models():
+    # Loads the in-process pipeline (batch uploads, /match) off the event loop
+    await asyncio.to_thread(warm_up)
+    logger.info("Skill extraction (%s) loaded in %.2fs", settings.SKILL_ENGINE, extractor.load_seconds)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     conn = get_db()
-    conn.execute('''CREATE TABLE IF NOT EXISTS resumes (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        filename TEXT,
-        name TEXT,
-        email TEXT,
-        phone TEXT,
-        skills TEXT,
-        work_experience TEXT,
-        cgpa TEXT
-    )''')
-    # Add cgpa column if missing
-    try:
-        conn.execute('ALTER TABLE resumes ADD COLUMN cgpa TEXT')
-    except Exception:
-        pass
-    conn.commit()
+    # Creates or upgrades the schema; a current database is left as it is
+    migrate(conn, WEB_MIGRATIONS)
+    # In-memory skill matrix for /match; kept current by this process's writes
+    skill_ranker.load(conn)
     conn.close()
+    extraction_cache.prune()
+    warm_up_task = None
+    if settings.WARM_UP:
+        # Start extraction workers now so the model is loaded before the first upload
+        get_pool().start()
+        warm_up_task = asyncio.create_task(warm_up_models())
+    # Resumes jobs left pending by a previous run
+    await job_queue.start()
+    startup_timings["ready_s"] = round(time.perf_counter() - _import_started, 3)
+    logger.info("API ready %.2fs after import", startup_timings["ready_s"])
     yield
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+    await job_queue.stop()
+    shutdown_pool(wait=False)
+    writer.stop()
+    db_pool.close_all()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -66,50 +75,377 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-After-Id", "X-Next-Offset", "X-Total-Count"],
 )
 
 DB_PATH = "db.sqlite3"
-os.makedirs("uploads", exist_ok=True)
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+db_pool = ConnectionPool(DB_PATH)
+# Inserts from concurrent uploads are grouped into shared commits
+writer = WriteQueue(db_pool)
 
 def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    # Per-thread pooled connection; close() returns it to the pool
+    return db_pool.connection()
+
+
+async def save_resume(filename, info, content_hash=None):
+    resume_id, skill_ids = await asyncio.wrap_future(writer.call(insert_resume, filename, info, content_hash))
+    skill_ranker.add(resume_id, skill_ids)
+    return resume_id
+
+
+def save_resumes(conn, results):
+    # results are (filename, info, content hash) triples, saved in one transaction
+    if not results:
+        return []
+    with conn:
+        indexed = insert_resumes(conn, results)
+    for resume_id, skill_ids in indexed:
+        skill_ranker.add(resume_id, skill_ids)
+    return [resume_id for resume_id, _ in indexed]
+
+
+skill_ranker = SkillRanker()
+extraction_cache = ExtractionCache(DB_PATH, cache_version("web", f"{EXTRACTOR_VERSION}:{settings.SKILL_ENGINE}:{settings.PDF_BACKEND}:{ExtractionBudget().signature()}", COMMON_SKILLS, taxonomy=artifact_digest()), connect=get_db)
+job_queue = JobQueue(get_db, save_resume, cache=extraction_cache)
 
 
 @app.post("/upload")
-async def upload_resume(file: UploadFile = File(...)):
-    if not file.filename.endswith(".pdf"):
+async def upload_resume(file: UploadFile = File(...), async_mode: bool = Query(False, alias="async")):
+    if not is_pdf(file.filename):
         raise HTTPException(status_code=400, detail="Only PDF files are supported.")
-    contents = await file.read()
-    path = f"uploads/{file.filename}"
-    with open(path, "wb") as f:
-        f.write(contents)
-    text = extract_text_from_pdf(path)
-    info = extract_information(text)
+    # Streamed to disk in chunks and kept under the digest computed in the
+    # same pass, so a later upload with the same name can't replace it
+    try:
+        digest, _, path = await stage_upload(file)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    if async_mode:
+        # Nothing is parsed here; the job's worker does all of the extraction
+        job_id = job_queue.enqueue(file.filename, path, digest)
+        return JSONResponse(status_code=202, content={"detail": "Resume queued", "job_id": job_id, "state": "queued"})
+    # Identical bytes were already extracted by this extractor version
+    info = extraction_cache.get(digest)
+    if info is None:
+        # Parse + NLP run in the worker pool so the event loop stays free
+        try:
+            info = await extract_upload(path)
+        except PoolBusy:
+            raise HTTPException(
+                status_code=503,
+                detail="Extraction queue is full, please retry later.",
+                headers={"Retry-After": str(settings.POOL_RETRY_AFTER)},
+            )
+        except ExtractionTimeout:
+            raise HTTPException(status_code=504, detail="Resume extraction timed out.")
+        if cacheable(info):
+            extraction_cache.put(digest, info)
+    await save_resume(file.filename, info, digest)
+    return {"detail": "Resume processed", "info": info.to_dict()}
+
+async def extract_upload(path):
+    pool = get_pool()
+    total = await asyncio.to_thread(page_count, path) if settings.PDF_PAGES_PER_TASK else 0
+    if total > settings.PDF_PAGES_PER_TASK:
+        # Long document: page ranges are parsed on several workers, then one
+        # worker runs the field extraction on the joined text
+        budget = ExtractionBudget()
+        pages, pdf = await asyncio.to_thread(read_pdf_pages, path, pool, budget, total)
+        text, header, truncated = budget.split(pages, pdf)
+        return apply_budget(await pool.run_async(extract_information, text), header, truncated, pdf, text)
+    return await pool.run_async(extract_resume, path)
+
+NOT_PDF = "Only PDF files are supported."
+
+
+def is_pdf(name):
+    # Same test for plain uploads and zip members
+    return name.lower().endswith(".pdf")
+
+
+def zip_members(archive):
+    # Entries of a batch archive, each one result line
+    return [member for member in archive.infolist() if not member.is_dir() and os.path.basename(member.filename)]
+
+
+def unpack_zip(fileobj):
+    # (filename, staged path, content hash, error) per entry
+    saved = []
+    with zipfile.ZipFile(fileobj) as archive:
+        for member in zip_members(archive):
+            name = os.path.basename(member.filename)
+            if not is_pdf(name):
+                saved.append((name, None, None, NOT_PDF))
+                continue
+            if member.file_size > settings.UPLOAD_MAX_BYTES:
+                saved.append((name, None, None, f"Upload exceeds {settings.UPLOAD_MAX_BYTES} bytes"))
+                continue
+            # Staged under the content hash: members with the same name in
+            # different folders never overwrite each other
+            with archive.open(member) as src:
+                digest, path = stage_file(src)
+            saved.append((name, path, digest, None))
+    return saved
+
+
+def batch_results(saved):
+    pool = get_pool()
+    budget = ExtractionBudget()
+    texts = pool.imap(read_resume_pages, [path for _, path, _, _ in saved if path])
+
+    # (text, context) pairs for nlp.pipe; failed files flow through as empty texts
+    def items():
+        for index, (filename, path, _, error) in enumerate(saved):
+            if path is None:
+                yield "", (index, filename, error, None)
+                continue
+            try:
+                pages, pdf = next(texts).result(timeout=pool.timeout)
+            except Exception as e:
+                yield "", (index, filename, str(e) or type(e).__name__, None)
+                continue
+            text, header, truncated = budget.split(pages, pdf)
+            yield text, (index, filename, None, (header, truncated, pdf, text))
+
+    rows, resume_ids = [], []
+
+    def save_rows():
+        conn = get_db()
+        try:
+            resume_ids.extend(save_resumes(conn, rows))
+        finally:
+            conn.close()
+        rows.clear()
+
+    try:
+        for info, (index, filename, error, parsed) in extract_information_batch(
+            items(), batch_size=settings.BATCH_NLP_SIZE, n_process=settings.BATCH_NLP_PROCESSES
+        ):
+            if error:
+                yield json.dumps({"index": index, "filename": filename, "error": error}) + "\n"
+                continue
+            info = apply_budget(info, *parsed)
+            rows.append((filename, info, saved[index][2]))
+            # Saved as the stream goes, one transaction per nlp.pipe batch
+            if len(rows) >= settings.BATCH_NLP_SIZE:
+                save_rows()
+            yield json.dumps({"index": index, "filename": filename, "info": info.to_dict()}) + "\n"
+    finally:
+        # Also runs when the client disconnects and the stream is closed early
+        save_rows()
+    yield json.dumps({"summary": {"processed": len(resume_ids), "failed": len(saved) - len(resume_ids), "resume_ids": resume_ids}}) + "\n"
+
+
+@app.post("/upload/batch")
+async def upload_batch(files: List[UploadFile] = File(...)):
+    # Entries are counted from the zip directories, so an oversized batch is
+    # rejected before anything is written to uploads/
+    entries = 0
+    for file in files:
+        name = file.filename or ""
+        if not name.lower().endswith(".zip"):
+            entries += 1
+            continue
+        try:
+            with zipfile.ZipFile(file.file) as archive:
+                entries += len(zip_members(archive))
+        except zipfile.BadZipFile:
+            raise HTTPException(status_code=400, detail=f"{name} is not a valid zip archive.")
+    if entries > settings.BATCH_MAX_FILES:
+        raise HTTPException(status_code=413, detail=f"At most {settings.BATCH_MAX_FILES} files per batch.")
+    saved = []
+    for file in files:
+        name = file.filename or ""
+        if name.lower().endswith(".zip"):
+            saved.extend(unpack_zip(file.file))
+        elif is_pdf(name):
+            try:
+                digest, _, path = await stage_upload(file)
+            except UploadTooLarge as e:
+                saved.append((name, None, None, str(e)))
+                continue
+            saved.append((name, path, digest, None))
+        else:
+            saved.append((name, None, None, NOT_PDF))
+    # Sync generator: Starlette iterates it in a threadpool, so spaCy never blocks the loop
+    return StreamingResponse(batch_results(saved), media_type="application/x-ndjson")
+
+@app.get("/cache/stats")
+def cache_stats():
+    return extraction_cache.stats()
+
+@app.get("/startup/stats")
+def startup_stats():
+    # Cold-start timings of this process, for sizing how fast workers can be added
+    return {
+        **startup_timings,
+        "warm_up": settings.WARM_UP,
+        "model_loaded": extractor.load_seconds is not None,
+        "model_load_s": round(extractor.load_seconds, 3) if extractor.load_seconds is not None else None,
+    }
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: int):
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+RESUME_COLUMNS = "id, filename, name, email, phone, skills, cgpa"
+
+
+def resume_filters(after_id, name, email, skill, cgpa_min, cgpa_max):
+    clauses, params = [], []
+    if after_id is not None:
+        clauses.append("id > ?")
+        params.append(after_id)
+    if name:
+        # Prefix match, served by the NOCASE index on name; % and _ in the
+        # name itself are matched literally
+        clauses.append("name LIKE ? ESCAPE '\\'")
+        params.append(name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+    if email:
+        clauses.append("email = ? COLLATE NOCASE")
+        params.append(email)
+    if skill:
+        clauses.append("id IN (SELECT rs.resume_id FROM resume_skills rs JOIN skills s ON s.id = rs.skill_id WHERE s.name = ?)")
+        params.append(normalize_skill(skill))
+    if cgpa_min is not None or cgpa_max is not None:
+        # No CGPA is stored as '', which CAST would read as 0.0
+        clauses.append("cgpa != ''")
+    if cgpa_min is not None:
+        clauses.append("CAST(cgpa AS REAL) >= ?")
+        params.append(cgpa_min)
+    if cgpa_max is not None:
+        clauses.append("CAST(cgpa AS REAL) <= ?")
+        params.append(cgpa_max)
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return where, params
+
+
+def stream_resumes(sql, params):
+    # Own connection: the generator is resumed on arbitrary threadpool threads
+    conn = db_pool.dedicated()
+    try:
+        for row in conn.execute(sql, params):
+            yield json.dumps(dict(row)) + "\n"
+    finally:
+        conn.close()
+
+
+@app.get("/resumes")
+def list_resumes(
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    name: Optional[str] = None,
+    email: Optional[str] = None,
+    skill: Optional[str] = None,
+    cgpa_min: Optional[float] = None,
+    cgpa_max: Optional[float] = None,
+    include_total: bool = False,
+    format: str = "json",
+):
+    where, params = resume_filters(after_id, name, email, skill, cgpa_min, cgpa_max)
+    sql = f"SELECT {RESUME_COLUMNS} FROM resumes{where} ORDER BY id"
+    if format == "ndjson":
+        # Rows go straight from the cursor to the socket; no limit unless asked for
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return StreamingResponse(stream_resumes(sql, params), media_type="application/x-ndjson")
+    if format != "json":
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'ndjson'.")
+    limit = min(limit or settings.RESUMES_PAGE_SIZE, settings.RESUMES_MAX_PAGE_SIZE)
     conn = get_db()
-    conn.execute(
-        "INSERT INTO resumes (filename, name, email, phone, skills, work_experience, cgpa) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (
-            file.filename,
-            info["name"],
-            info["email"],
-            info["phone"],
-            ",".join(info["skills"]),
-            str(info["work_experience"]),
-            info["cgpa"]
-        ),
-    )
-    conn.commit()
+    rows = conn.execute(sql + " LIMIT ?", params + [limit]).fetchall()
+    headers = {}
+    if len(rows) == limit:
+        headers["X-Next-After-Id"] = str(rows[-1]["id"])
+    if include_total:
+        # Count ignores the keyset cursor so it is the same for every page
+        count_where, count_params = resume_filters(None, name, email, skill, cgpa_min, cgpa_max)
+        headers["X-Total-Count"] = str(conn.execute(f"SELECT COUNT(*) FROM resumes{count_where}", count_params).fetchone()[0])
     conn.close()
-    return {"detail": "Resume processed", "info": info}
+    return JSONResponse(content=[dict(row) for row in rows], headers=headers)
 
-@app.get("/resumes")
-def list_resumes():
+@app.get("/search")
+def search_resumes(skills: str, after_id: Optional[int] = None, limit: Optional[int] = Query(None, ge=1)):
+    # skills: comma = AND, "|" = OR within a term, leading "-" = NOT,
+    # e.g. "python,react|angular,-php"
+    groups, excluded = parse_skill_query(skills)
+    if not groups and not excluded:
+        raise HTTPException(status_code=400, detail="No skills given.")
+    conn = get_db()
+    query = skill_query_sql(conn, groups, excluded)
+    if query is None:
+        conn.close()
+        return []
+    ids_sql, params = query
+    sql = f"SELECT {RESUME_COLUMNS} FROM resumes WHERE id IN ({ids_sql})"
+    if after_id is not None:
+        sql += " AND id > ?"
+        params.append(after_id)
+    limit = min(limit or settings.RESUMES_PAGE_SIZE, settings.RESUMES_MAX_PAGE_SIZE)
+    rows = conn.execute(sql + " ORDER BY id LIMIT ?", params + [limit]).fetchall()
+    conn.close()
+    headers = {"X-Next-After-Id": str(rows[-1]["id"])} if len(rows) == limit else {}
+    return JSONResponse(content=[dict(row) for row in rows], headers=headers)
+
+@app.get("/search/text")
+def search_resume_text(q: str, limit: Optional[int] = Query(None, ge=1), offset: int = Query(0, ge=0)):
+    # q: words and "quoted phrases" that must all appear, word* for a prefix;
+    # best bm25 match first, each with a snippet around the matched terms
+    limit = min(limit or settings.RESUMES_PAGE_SIZE, settings.RESUMES_MAX_PAGE_SIZE)
+    conn = get_db()
+    hits = search_text(conn, q, limit, offset)
+    if not hits:
+        conn.close()
+        return []
+    ids = [resume_id for resume_id, _, _ in hits]
+    rows = conn.execute(f"SELECT {RESUME_COLUMNS} FROM resumes WHERE id IN ({','.join('?' * len(ids))})", ids).fetchall()
+    conn.close()
+    by_id = {row["id"]: dict(row) for row in rows}
+    results = [
+        {**by_id[resume_id], "score": round(score, 6), "snippet": snippet}
+        for resume_id, score, snippet in hits if resume_id in by_id
+    ]
+    headers = {"X-Next-Offset": str(offset + limit)} if len(hits) == limit else {}
+    return JSONResponse(content=results, headers=headers)
+
+class MatchRequest(BaseModel):
+    text: str
+    k: int = 10
+
+
+@app.post("/match")
+async def match_resumes(request: MatchRequest):
+    if not request.text.strip():
+        raise HTTPException(status_code=400, detail="Job description is empty.")
+    # Same skill extraction as resumes, run off the event loop
+    try:
+        skills = await get_pool().run_async(extract_skills, request.text)
+    except PoolBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="Extraction queue is full, please retry later.",
+            headers={"Retry-After": str(settings.POOL_RETRY_AFTER)},
+        )
+    except ExtractionTimeout:
+        raise HTTPException(status_code=504, detail="Skill extraction timed out.")
     conn = get_db()
-    rows = conn.execute("SELECT id, filename, name, email, phone, skills, cgpa FROM resumes").fetchall()
+    ranked = skill_ranker.match(conn, skills, k=max(1, min(request.k, settings.RESUMES_MAX_PAGE_SIZE)))
+    rows = {}
+    if ranked:
+        ids = [resume_id for resume_id, _, _ in ranked]
+        placeholders = ",".join("?" * len(ids))
+        rows = {row["id"]: dict(row) for row in conn.execute(f"SELECT {RESUME_COLUMNS} FROM resumes WHERE id IN ({placeholders})", ids)}
     conn.close()
-    return [dict(row) for row in rows]
+    results = [
+        {**rows[resume_id], "score": round(score, 4), "matched_skills": matched}
+        for resume_id, score, matched in ranked if resume_id in rows
+    ]
+    return {"skills": skills, "results": results}
 
 @app.get("/resume/{resume_id}")
 def get_resume(resume_id: int):
@@ -118,24 +454,45 @@ def get_resume(resume_id: int):
     conn.close()
     if not row:
         raise HTTPException(status_code=404, detail="Resume not found")
-    return dict(row)
+    resume = dict(row)
+    resume["work_experience"] = [entry.to_dict() for entry in experience_from_column(resume["work_experience"])]
+    return resume
 
 from fastapi import Response
 
 @app.delete("/resume/{resume_id}")
 def delete_resume(resume_id: int):
     conn = get_db()
-    row = conn.execute("SELECT filename FROM resumes WHERE id=?", (resume_id,)).fetchone()
+    row = conn.execute("SELECT filename, content_hash FROM resumes WHERE id=?", (resume_id,)).fetchone()
     if not row:
         conn.close()
         return Response(status_code=404, content="Resume not found")
-    filename = row["filename"]
+    filename, content_hash = row["filename"], row["content_hash"]
     conn.execute("DELETE FROM resumes WHERE id=?", (resume_id,))
+    unindex_resume(conn, resume_id)
     conn.commit()
+    skill_ranker.remove(resume_id)
+    path = staged_path(content_hash) if content_hash else None
+    if path and os.path.exists(path):
+        # Staged files are shared by every resume with the same content
+        # and by async jobs that haven't extracted it yet
+        if conn.execute("SELECT 1 FROM resumes WHERE content_hash=? LIMIT 1", (content_hash,)).fetchone() or \
+                job_queue.pending(conn, content_hash):
+            path = None
+    else:
+        # Uploads staged before content hashing were named after the file
+        path = f"{UPLOAD_DIR}/{filename}"
     conn.close()
     # Remove uploaded file if present
     try:
-        os.remove(f"uploads/{filename}")
+        if path:
+            os.remove(path)
     except Exception:
         pass
     return {"detail": "Resume deleted"}
+
+# Serve React build (static files). Mounted after every route: a mount at "/"
+# matches any path, so it must come last to leave the API reachable
+frontend_build_dir = os.path.join(os.path.dirname(__file__), '..', 'frontend', 'build')
+if os.path.isdir(frontend_build_dir):
+    app.mount("/", StaticFiles(directory=frontend_build_dir, html=True), name="static")
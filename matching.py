@@ -0,0 +1,116 @@
+import heapq
+import math
+import threading
+from collections import defaultdict
+
+from backend.skill_index import skill_ids
+
+
+class SkillRanker:
+    """BM25 ranking of resumes against a set of query skills.
+
+    Keeps the resume x skill matrix in memory as sparse postings
+    (skill id -> set of resume ids) mirrored from the resume_skills table,
+    so a query only touches the postings of the skills it asks for.
+    """
+
+    # b is lower than the usual 0.75: a long skill list is mostly a sign of
+    # a strong candidate, not of a verbose document, so it is penalized less
+    def __init__(self, k1=1.2, b=0.3):
+        self.k1 = k1
+        self.b = b
+        self._postings = defaultdict(set)
+        self._skills_of = {}
+        self._total_len = 0
+        # Per-resume BM25 length normalization, computed against _norm_avg
+        self._norm = {}
+        self._norm_avg = None
+        self._lock = threading.Lock()
+
+    def _length_norm(self, doc_len, avg_len):
+        k1, b = self.k1, self.b
+        return (k1 + 1) / (1 + k1 * (1 - b + b * doc_len / avg_len))
+
+    def _refresh_norms(self):
+        # Caller holds the lock. Norms only need rebuilding once the average
+        # length has drifted noticeably since they were computed
+        n_docs = len(self._skills_of)
+        avg_len = self._total_len / n_docs if n_docs else 1.0
+        if self._norm_avg and abs(avg_len - self._norm_avg) <= 0.02 * self._norm_avg:
+            return
+        self._norm_avg = avg_len or 1.0
+        self._norm = {r: self._length_norm(len(s), self._norm_avg) for r, s in self._skills_of.items()}
+
+    def load(self, conn):
+        postings = defaultdict(set)
+        skills_of = defaultdict(list)
+        for skill_id, resume_id in conn.execute('SELECT skill_id, resume_id FROM resume_skills'):
+            postings[skill_id].add(resume_id)
+            skills_of[resume_id].append(skill_id)
+        with self._lock:
+            self._postings = postings
+            self._skills_of = dict(skills_of)
+            self._total_len = sum(len(s) for s in skills_of.values())
+            self._norm_avg = None
+            self._refresh_norms()
+
+    def add(self, resume_id, skill_ids):
+        with self._lock:
+            self._remove(resume_id)
+            skill_ids = list(set(skill_ids))
+            for skill_id in skill_ids:
+                self._postings[skill_id].add(resume_id)
+            self._skills_of[resume_id] = skill_ids
+            self._total_len += len(skill_ids)
+            self._norm[resume_id] = self._length_norm(len(skill_ids), self._norm_avg or 1.0)
+            self._refresh_norms()
+
+    def remove(self, resume_id):
+        with self._lock:
+            self._remove(resume_id)
+
+    def _remove(self, resume_id):
+        skill_ids = self._skills_of.pop(resume_id, None)
+        if skill_ids is None:
+            return
+        for skill_id in skill_ids:
+            self._postings[skill_id].discard(resume_id)
+        self._total_len -= len(skill_ids)
+        self._norm.pop(resume_id, None)
+
+    def __len__(self):
+        return len(self._skills_of)
+
+    def top_k(self, query_skill_ids, k=10):
+        """Return [(resume_id, score, matched skill ids)] for the k best resumes"""
+        query_skill_ids = set(query_skill_ids)
+        with self._lock:
+            n_docs = len(self._skills_of)
+            if not n_docs or not query_skill_ids:
+                return []
+            # Skills are binary per resume, so BM25's tf term is 1 and a score
+            # is the resume's length norm times the summed idf of its matches
+            idf_sums = {}
+            for skill_id in query_skill_ids:
+                posting = self._postings.get(skill_id)
+                if not posting:
+                    continue
+                idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                get = idf_sums.get
+                idf_sums.update({resume_id: get(resume_id, 0.0) + idf for resume_id in posting})
+            norm = self._norm
+            best = heapq.nlargest(k, idf_sums, key=lambda r: idf_sums[r] * norm[r])
+            return [
+                (resume_id, idf_sums[resume_id] * norm[resume_id],
+                 [s for s in query_skill_ids if resume_id in self._postings.get(s, ())])
+                for resume_id in best
+            ]
+
+    def match(self, conn, skills, k=10):
+        """Rank by skill names; returns [(resume_id, score, matched skill names)]"""
+        ids = skill_ids(conn, skills)
+        names = {skill_id: name for name, skill_id in ids.items()}
+        return [
+            (resume_id, score, sorted(names[s] for s in matched))
+            for resume_id, score, matched in self.top_k(ids.values(), k)
+        ]
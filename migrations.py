@@ -0,0 +1,190 @@
+"""Versioned schema migrations for the SQLite databases.
+
+A schema is a list of steps; step N takes a database from version N - 1 to
+N and is committed together with PRAGMA user_version = N, so every step runs
+once per database and a current database is opened with a single PRAGMA
+read. Databases created before versioning are at version 0; their first step
+brings whatever tables they have up to the base schema.
+"""
+import json
+import logging
+
+from backend.skill_index import SKILL_INDEX_SCHEMA, init_skill_index
+from backend.text_index import TEXT_INDEX_SCHEMA
+
+logger = logging.getLogger(__name__)
+
+
+def user_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn, steps):
+    """Apply the steps this database hasn't had yet; returns the version it was at"""
+    start = user_version(conn)
+    if start > len(steps):
+        raise RuntimeError(f"Database schema version {start} is newer than this code supports ({len(steps)})")
+    for version in range(start + 1, len(steps) + 1):
+        # Write lock first, then re-check: another process may have just migrated
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if user_version(conn) >= version:
+                conn.rollback()
+                continue
+            steps[version - 1](conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        logger.info("Database migrated to schema version %d", version)
+    return start
+
+
+def _columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _add_column(conn, table, column, decl):
+    # Only for base steps, which also meet tables created before versioning
+    if column not in _columns(conn, table):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def _text_index(conn):
+    # Full-text index of resume text; resumes saved before it have no entry
+    for statement in TEXT_INDEX_SCHEMA:
+        conn.execute(statement)
+
+
+# Tables each process used to create for itself at startup, before they were
+# migrations: IF NOT EXISTS, as databases of that time already have them
+
+def _extraction_cache(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS extraction_cache (
+        key TEXT PRIMARY KEY,
+        version TEXT,
+        payload BLOB,
+        created_at TEXT
+    )''')
+
+
+def _skill_index(conn, parse_skills):
+    for statement in SKILL_INDEX_SCHEMA:
+        conn.execute(statement)
+    init_skill_index(conn, parse_skills)
+
+
+# --- Web API (db.sqlite3) ---
+
+def _web_base(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS resumes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT,
+        name TEXT,
+        email TEXT,
+        phone TEXT,
+        skills TEXT,
+        work_experience TEXT,
+        cgpa TEXT
+    )''')
+    _add_column(conn, 'resumes', 'cgpa', 'TEXT')
+    # Indexes backing the /resumes filters
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resumes_name ON resumes (name COLLATE NOCASE)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resumes_email ON resumes (email COLLATE NOCASE)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resumes_cgpa ON resumes (CAST(cgpa AS REAL))')
+
+
+def _web_hash_and_filename(conn):
+    conn.execute('ALTER TABLE resumes ADD COLUMN content_hash TEXT')
+    conn.execute('CREATE INDEX idx_resumes_content_hash ON resumes (content_hash)')
+    conn.execute('CREATE INDEX idx_resumes_filename ON resumes (filename)')
+
+
+def _web_support_tables(conn):
+    # Async upload jobs
+    conn.execute('''CREATE TABLE IF NOT EXISTS jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT,
+        path TEXT,
+        state TEXT DEFAULT 'queued',
+        error TEXT,
+        resume_id INTEGER,
+        attempts INTEGER DEFAULT 0,
+        created_at TEXT,
+        started_at TEXT,
+        finished_at TEXT
+    )''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state, id)')
+    _extraction_cache(conn)
+    _skill_index(conn, lambda skills: skills.split(","))
+    # python -m backend.ingest checkpoint, one row per source file
+    conn.execute('''CREATE TABLE IF NOT EXISTS ingest_files (
+        source TEXT PRIMARY KEY,
+        content_hash TEXT,
+        state TEXT,
+        resume_id INTEGER,
+        error TEXT,
+        ingested_at TEXT
+    )''')
+
+
+def _web_job_hashes(conn):
+    # Checked against the staged file when the job runs
+    conn.execute('ALTER TABLE jobs ADD COLUMN content_hash TEXT')
+
+
+def _web_job_headers(conn):
+    # JSON name, email and phone read from the first page of a running job
+    conn.execute('ALTER TABLE jobs ADD COLUMN header TEXT')
+
+
+WEB_MIGRATIONS = [
+    _web_base,
+    _web_hash_and_filename,
+    _text_index,
+    _web_support_tables,
+    _web_job_hashes,
+    _web_job_headers,
+]
+
+
+# --- Tk app (resumes.db) ---
+
+def _desktop_base(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS resumes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        email TEXT,
+        phone TEXT,
+        skills TEXT,
+        work_experience TEXT,
+        upload_date TEXT,
+        filename TEXT,
+        status TEXT DEFAULT "To Review"
+    )''')
+    if 'status' not in _columns(conn, 'resumes'):
+        conn.execute('ALTER TABLE resumes ADD COLUMN status TEXT DEFAULT "To Review"')
+        conn.execute('UPDATE resumes SET status = "To Review" WHERE status IS NULL')
+
+
+def _desktop_indexes(conn):
+    conn.execute('ALTER TABLE resumes ADD COLUMN content_hash TEXT')
+    conn.execute('CREATE INDEX idx_resumes_content_hash ON resumes (content_hash)')
+    conn.execute('CREATE INDEX idx_resumes_filename ON resumes (filename)')
+    # History list: newest first, all statuses or one
+    conn.execute('CREATE INDEX idx_resumes_upload_date ON resumes (upload_date)')
+    conn.execute('CREATE INDEX idx_resumes_status_date ON resumes (status, upload_date)')
+
+
+def _desktop_support_tables(conn):
+    _extraction_cache(conn)
+    _skill_index(conn, json.loads)
+
+
+DESKTOP_MIGRATIONS = [
+    _desktop_base,
+    _desktop_indexes,
+    _text_index,
+    _desktop_support_tables,
+]
@@ -0,0 +1,38 @@
+# Components of the trained English pipelines and what they read from.
+# en_core_web_* ner embeds its own tok2vec, so it runs on its own
+COMPONENT_DEPENDENCIES = {
+    'tagger': ['tok2vec'],
+    'morphologizer': ['tok2vec'],
+    'parser': ['tok2vec'],
+    'attribute_ruler': ['tagger'],
+    'lemmatizer': ['attribute_ruler'],
+}
+TRAINED_COMPONENTS = ['tok2vec', 'tagger', 'morphologizer', 'parser', 'senter', 'attribute_ruler', 'lemmatizer', 'ner']
+
+
+def resolve_components(components):
+    """Requested components plus everything they depend on"""
+    resolved = []
+    pending = list(components)
+    while pending:
+        name = pending.pop()
+        if name not in resolved:
+            resolved.append(name)
+            pending.extend(COMPONENT_DEPENDENCIES.get(name, []))
+    return resolved
+
+
+def load_pipeline(model, components):
+    """Load model with only the given components; the rest are not loaded at all.
+
+    'sentencizer' is added as a rule-based component. An empty list leaves a
+    tokenizer-only pipeline.
+    """
+    import spacy
+
+    keep = resolve_components(components)
+    nlp = spacy.load(model, exclude=[name for name in TRAINED_COMPONENTS if name not in keep])
+    if 'sentencizer' in keep and 'sentencizer' not in nlp.pipe_names:
+        nlp.add_pipe('sentencizer', first=True)
+    return nlp
+
@@ -0,0 +1,280 @@
+"""Page-level PDF text extraction.
+
+Pages are parsed one at a time and yielded as they are ready, so callers can
+start on page 1 (or stop early) and the full text is joined once at the end.
+Long documents can be split into page ranges that run on a worker pool.
+
+The PDF engine is pluggable: RSE_PDF_BACKEND picks the first one tried and
+RSE_PDF_FALLBACK_BACKENDS the ones tried, in order, when it is not installed
+or fails on a document. A failure on one page only moves that page and the
+ones after it to the next backend.
+"""
+import importlib.util
+import io
+import logging
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from backend import settings
+from backend.worker_pool import ExtractionTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class PyPDF2Document:
+    name = 'pypdf2'
+    module = 'PyPDF2'
+
+    def __init__(self, file_path):
+        import PyPDF2
+        # Given a path, PdfReader reads the file into memory and closes it
+        self._pages = PyPDF2.PdfReader(file_path).pages
+
+    def __len__(self):
+        return len(self._pages)
+
+    def page_text(self, index):
+        return self._pages[index].extract_text() or ''
+
+    def close(self):
+        pass
+
+
+class PdfiumDocument:
+    name = 'pypdfium2'
+    module = 'pypdfium2'
+
+    def __init__(self, file_path):
+        import pypdfium2
+        self._pdf = pypdfium2.PdfDocument(file_path)
+
+    def __len__(self):
+        return len(self._pdf)
+
+    def page_text(self, index):
+        page = self._pdf[index]
+        try:
+            textpage = page.get_textpage()
+            try:
+                return textpage.get_text_range().replace('\r\n', '\n')
+            finally:
+                textpage.close()
+        finally:
+            page.close()
+
+    def close(self):
+        self._pdf.close()
+
+
+class PdfminerDocument:
+    name = 'pdfminer'
+    module = 'pdfminer'
+
+    def __init__(self, file_path):
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        self._file = open(file_path, 'rb')
+        try:
+            self._pages = list(PDFPage.get_pages(self._file))
+        except Exception:
+            self._file.close()
+            raise
+        self._resources = PDFResourceManager(caching=True)
+        # Lines are still grouped (the field rules read line by line), but the
+        # costly reading-order analysis of text boxes is skipped
+        self._laparams = LAParams(boxes_flow=None)
+
+    def __len__(self):
+        return len(self._pages)
+
+    def page_text(self, index):
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfinterp import PDFPageInterpreter
+        out = io.StringIO()
+        device = TextConverter(self._resources, out, laparams=self._laparams)
+        try:
+            PDFPageInterpreter(self._resources, device).process_page(self._pages[index])
+        finally:
+            device.close()
+        return out.getvalue().replace('\f', '')
+
+    def close(self):
+        self._file.close()
+
+
+BACKENDS = {backend.name: backend for backend in (PyPDF2Document, PdfiumDocument, PdfminerDocument)}
+
+
+def available_backends():
+    """Names of the backends whose engine is installed"""
+    return [name for name, backend in BACKENDS.items() if importlib.util.find_spec(backend.module) is not None]
+
+
+def backend_chain(primary=None):
+    """Backend names in the order they are tried"""
+    primary = primary or settings.PDF_BACKEND
+    chain = [primary] + [name for name in settings.PDF_FALLBACK_BACKENDS if name != primary]
+    unknown = [name for name in chain if name not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown PDF backend(s) {', '.join(unknown)}; expected one of {', '.join(BACKENDS)}")
+    return chain
+
+
+def new_report():
+    # Per-document record of how the text was obtained
+    return {'backend': None, 'parse_ms': 0.0, 'pages': 0, 'page_total': None, 'failed': []}
+
+
+def _open(file_path, name, report):
+    started = time.perf_counter()
+    try:
+        return BACKENDS[name](file_path)
+    except ImportError:
+        # Optional engine that isn't installed: not a failure of this document
+        return None
+    finally:
+        report['parse_ms'] += (time.perf_counter() - started) * 1000
+
+
+def _used(report, name):
+    # Pages can come from more than one backend after a fallback
+    if name not in (report['backend'] or '').split('+'):
+        report['backend'] = f"{report['backend']}+{name}" if report['backend'] else name
+
+
+def _failed(report, name, index, error):
+    logger.warning("PDF backend %s failed%s: %s", name, f" on page {index + 1}" if index is not None else "", error)
+    report['failed'].append({'backend': name, 'page': index, 'error': str(error) or type(error).__name__})
+
+
+def page_count(file_path, backends=None):
+    error = None
+    for name in backend_chain() if backends is None else backends:
+        try:
+            document = _open(file_path, name, new_report())
+        except Exception as e:
+            error = error or e
+            continue
+        if document is not None:
+            try:
+                return len(document)
+            finally:
+                document.close()
+    raise error or RuntimeError("No PDF backend is installed")
+
+
+def iter_page_texts(file_path, start=0, stop=None, report=None, backends=None):
+    """Yield the text of pages [start, stop), one page at a time.
+
+    report, if given, is filled in with the backend used, the milliseconds
+    spent in it and any backend failures that were fallen back from.
+    """
+    report = new_report() if report is None else report
+    index = start
+    error = None
+    for name in backend_chain() if backends is None else backends:
+        try:
+            document = _open(file_path, name, report)
+        except Exception as e:
+            _failed(report, name, None, e)
+            error = error or e
+            continue
+        if document is None:
+            continue
+        try:
+            if report['page_total'] is None:
+                report['page_total'] = len(document)
+            end = len(document) if stop is None else min(stop, len(document))
+            while index < end:
+                started = time.perf_counter()
+                try:
+                    text = document.page_text(index)
+                except Exception as e:
+                    _failed(report, name, index, e)
+                    error = error or e
+                    break
+                finally:
+                    report['parse_ms'] += (time.perf_counter() - started) * 1000
+                _used(report, name)
+                report['pages'] += 1
+                index += 1
+                yield text
+            else:
+                if not report['pages']:
+                    _used(report, name)
+                return
+        finally:
+            document.close()
+    raise error or RuntimeError("No PDF backend is installed")
+
+
+def extract_page_range(task):
+    """Pool job: texts and report of one (file_path, start, stop) page range"""
+    file_path, start, stop = task
+    report = new_report()
+    return list(iter_page_texts(file_path, start, stop, report)), report
+
+
+def _merge_report(report, part):
+    for name in filter(None, (part['backend'] or '').split('+')):
+        _used(report, name)
+    report['parse_ms'] += part['parse_ms']
+    report['pages'] += part['pages']
+    report['page_total'] = max(report['page_total'] or 0, part['page_total'] or 0)
+    report['failed'].extend(part['failed'])
+
+
+def iter_pdf_pages(file_path, pool=None, pages_per_task=None, report=None, max_pages=None, total=None):
+    """Yield page texts in order, at most max_pages of them.
+
+    With a pool, documents longer than pages_per_task pages are cut into
+    ranges of that many pages that are parsed in parallel; pages are still
+    yielded in order as soon as their range is done. parse_ms in the report
+    is then the time summed over the workers. total is the page count, when
+    the caller has already read it.
+    """
+    report = new_report() if report is None else report
+    pages_per_task = settings.PDF_PAGES_PER_TASK if pages_per_task is None else pages_per_task
+    if pool is None or not pages_per_task:
+        total = 0
+    elif total is None:
+        total = page_count(file_path)
+    if max_pages and total > max_pages:
+        report['page_total'] = total
+        total = max_pages
+    if total <= pages_per_task:
+        yield from iter_page_texts(file_path, stop=max_pages or None, report=report)
+        return
+    tasks = [(file_path, start, min(start + pages_per_task, total)) for start in range(0, total, pages_per_task)]
+    for future in pool.imap(extract_page_range, tasks):
+        try:
+            texts, part = future.result(timeout=pool.timeout)
+        except FutureTimeout:
+            raise ExtractionTimeout("PDF text extraction timed out")
+        _merge_report(report, part)
+        yield from texts
+
+
+def read_pdf_pages(file_path, pool=None, budget=None, total=None):
+    """([page text], report); with a budget, reading stops at its page, character and time limits.
+
+    total is the page count, when the caller has already read it.
+    """
+    report = new_report()
+    pages = iter_pdf_pages(file_path, pool, report=report, max_pages=budget.max_pages if budget else None, total=total)
+    texts = budget.read(pages, report) if budget else list(pages)
+    report['parse_ms'] = round(report['parse_ms'], 3)
+    logger.debug("Parsed %s with %s: %d pages in %.1f ms", file_path, report['backend'], report['pages'], report['parse_ms'])
+    return texts, report
+
+
+def extract_pdf(file_path, pool=None):
+    """(whole-document text, report): page texts concatenated in order"""
+    texts, report = read_pdf_pages(file_path, pool)
+    return ''.join(texts), report
+
+
+def extract_pdf_text(file_path, pool=None):
+    """Whole-document text: page texts concatenated in order"""
+    return extract_pdf(file_path, pool)[0]
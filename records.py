@@ -0,0 +1,232 @@
+"""Typed extraction results with a compact binary encoding.
+
+ResumeInfo and ExperienceEntry keep a result in __slots__ rather than one
+dict per resume and per experience entry. pack() writes a result as "packed
+columns": a fixed header of counts and flags, then every string in one UTF-8
+blob. unpack() decodes the blob once and splits it, so reading a result back
+is a few C-level calls.
+"""
+import ast
+import json
+import struct
+import sys
+from array import array
+from itertools import accumulate
+
+FORMAT_VERSION = 1
+# version, flags, skills, emails, experience entries, total experience
+_HEADER = struct.Struct('<BBHHHi')
+_EMAIL_NONE = 1
+_TRUNCATED = 2
+_PDF = 4
+# Strings are NUL-separated unless one contains a NUL; then a length array
+# (16-bit, or 32-bit with _WIDE) comes before them instead
+_LENGTHS = 8
+_WIDE = 16
+_TEXT = 32
+
+
+def _pack_strings(strings):
+    """(flags, bytes) for a list of strings"""
+    joined = '\0'.join(strings)
+    if joined.count('\0') == len(strings) - 1:
+        return 0, joined.encode('utf-8', 'surrogatepass')
+    flags = _LENGTHS
+    lengths = array('H')
+    try:
+        lengths.extend(map(len, strings))
+    except OverflowError:
+        lengths = array('I', map(len, strings))
+        flags |= _WIDE
+    if sys.byteorder == 'big':
+        lengths.byteswap()
+    return flags, lengths.tobytes() + ''.join(strings).encode('utf-8', 'surrogatepass')
+
+
+def _unpack_strings(data, offset, count, flags):
+    if not count:
+        return []
+    if not flags & _LENGTHS:
+        return data[offset:].decode('utf-8', 'surrogatepass').split('\0')
+    lengths = array('I' if flags & _WIDE else 'H')
+    end = offset + count * lengths.itemsize
+    lengths.frombytes(data[offset:end])
+    if sys.byteorder == 'big':
+        lengths.byteswap()
+    text = data[end:].decode('utf-8', 'surrogatepass')
+    ends = list(accumulate(lengths))
+    return [text[start:stop] for start, stop in zip([0] + ends, ends)]
+
+
+class ExperienceEntry:
+    __slots__ = ('position', 'organization', 'duration', 'dates', 'description', 'raw')
+
+    def __init__(self, position='', organization='', duration='', dates='', description='', raw=''):
+        self.position = position
+        self.organization = organization
+        self.duration = duration
+        self.dates = dates
+        self.description = description
+        self.raw = raw
+
+    @classmethod
+    def from_dict(cls, entry):
+        return cls(*(str(entry.get(field) or '') for field in cls.__slots__))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __eq__(self, other):
+        return isinstance(other, ExperienceEntry) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"ExperienceEntry({self.position!r}, {self.organization!r}, {self.duration!r})"
+
+
+def pack_experience(entries):
+    """Experience entries as bytes, for the work_experience column"""
+    flags, body = _pack_strings([value for entry in entries for value in (
+        entry.position, entry.organization, entry.duration, entry.dates, entry.description, entry.raw)])
+    return struct.pack('<BBI', FORMAT_VERSION, flags, len(entries)) + body
+
+
+def unpack_experience(data):
+    version, flags, count = struct.unpack_from('<BBI', data)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported experience encoding version {version}")
+    strings = _unpack_strings(data, 6, count * 6, flags)
+    return [ExperienceEntry(*strings[i:i + 6]) for i in range(0, len(strings), 6)]
+
+
+def experience_from_column(value):
+    """[ExperienceEntry] from a work_experience column, whatever wrote it.
+
+    Packed bytes, or text from older rows: JSON (Tk app) or a Python list
+    literal (web API, read with literal_eval, never eval).
+    """
+    if not value:
+        return []
+    if isinstance(value, bytes):
+        return unpack_experience(value)
+    try:
+        entries = json.loads(value)
+    except ValueError:
+        try:
+            entries = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return [ExperienceEntry(raw=value)]
+    if not isinstance(entries, list):
+        return []
+    return [ExperienceEntry.from_dict(e) if isinstance(e, dict) else ExperienceEntry(raw=str(e)) for e in entries]
+
+
+class ResumeInfo:
+    """One extraction result.
+
+    text is the text the fields were extracted from, kept for the full-text
+    index; it is left out of to_dict(), which is what API responses carry.
+    """
+    __slots__ = ('name', 'email', 'phone', 'skills', 'work_experience', 'cgpa', 'emails', 'total_experience',
+                 'truncated', 'pdf', 'text')
+
+    def __init__(self, name='', email=None, phone='', skills=(), work_experience=(), cgpa='', emails=(),
+                 total_experience=0, truncated=None, pdf=None, text=''):
+        self.name = name
+        self.email = email
+        self.phone = phone
+        self.skills = list(skills)
+        self.work_experience = list(work_experience)
+        self.cgpa = cgpa
+        self.emails = list(emails)
+        self.total_experience = total_experience
+        self.truncated = truncated
+        self.pdf = pdf
+        self.text = text
+
+    @classmethod
+    def from_dict(cls, info):
+        """From an extractor's dict; fields one extractor doesn't produce get their defaults"""
+        return cls(
+            name=info.get('name') or '',
+            email=info.get('email'),
+            phone=info.get('phone') or '',
+            skills=info.get('skills') or (),
+            work_experience=[ExperienceEntry.from_dict(e) for e in info.get('work_experience') or ()],
+            cgpa=info.get('cgpa') or '',
+            emails=info.get('emails') or (),
+            total_experience=int(info.get('total_experience') or 0),
+            truncated=info.get('truncated'),
+            pdf=info.get('pdf'),
+            text=info.get('text') or '',
+        )
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'email': self.email,
+            'phone': self.phone,
+            'skills': list(self.skills),
+            'work_experience': [entry.to_dict() for entry in self.work_experience],
+            'cgpa': self.cgpa,
+            'emails': list(self.emails),
+            'total_experience': self.total_experience,
+            'truncated': self.truncated,
+            'pdf': self.pdf,
+        }
+
+    def pack(self):
+        strings = [self.name, self.email or '', self.phone, self.cgpa, *self.skills, *self.emails]
+        for entry in self.work_experience:
+            strings += (entry.position, entry.organization, entry.duration, entry.dates, entry.description, entry.raw)
+        flags = _EMAIL_NONE if self.email is None else 0
+        # Small free-form reports; JSON inside the blob
+        if self.truncated is not None:
+            flags |= _TRUNCATED
+            strings.append(json.dumps(self.truncated, separators=(',', ':')))
+        if self.pdf is not None:
+            flags |= _PDF
+            strings.append(json.dumps(self.pdf, separators=(',', ':')))
+        if self.text:
+            flags |= _TEXT
+            strings.append(self.text)
+        string_flags, body = _pack_strings(strings)
+        header = _HEADER.pack(FORMAT_VERSION, flags | string_flags, len(self.skills), len(self.emails),
+                              len(self.work_experience), self.total_experience)
+        return header + body
+
+    @classmethod
+    def unpack(cls, data):
+        version, flags, n_skills, n_emails, n_entries, total_experience = _HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported result encoding version {version}")
+        count = (4 + n_skills + n_emails + 6 * n_entries
+                 + bool(flags & _TRUNCATED) + bool(flags & _PDF) + bool(flags & _TEXT))
+        strings = _unpack_strings(data, _HEADER.size, count, flags)
+        info = cls(strings[0], None if flags & _EMAIL_NONE else strings[1], strings[2], cgpa=strings[3],
+                   total_experience=total_experience)
+        pos = 4
+        info.skills = strings[pos:pos + n_skills]
+        pos += n_skills
+        info.emails = strings[pos:pos + n_emails]
+        pos += n_emails
+        info.work_experience = [ExperienceEntry(*strings[i:i + 6]) for i in range(pos, pos + 6 * n_entries, 6)]
+        pos += 6 * n_entries
+        if flags & _TRUNCATED:
+            info.truncated = json.loads(strings[pos])
+            pos += 1
+        if flags & _PDF:
+            info.pdf = json.loads(strings[pos])
+            pos += 1
+        if flags & _TEXT:
+            info.text = strings[pos]
+        return info
+
+    def __reduce__(self):
+        # Results cross the worker pool packed, not as pickled attributes
+        return ResumeInfo.unpack, (self.pack(),)
+
+    def __eq__(self, other):
+        return isinstance(other, ResumeInfo) and self.to_dict() == other.to_dict() and self.text == other.text
+
+    def __repr__(self):
+        return f"ResumeInfo(name={self.name!r}, skills={len(self.skills)}, work_experience={len(self.work_experience)})"
@@ -1,19 +1,43 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from ttkthemes import ThemedTk
-import PyPDF2
 import json
 import sqlite3
 import os
+import threading
 from datetime import datetime
-from PIL import Image, ImageTk
 import re
+import sys
 
-# --- spaCy imports for advanced NLP extraction (works offline after model download) ---
-import spacy
-from spacy.matcher import PhraseMatcher
+if not __package__:
+    # Started as `python resume_extractor.py` from the backend directory: its
+    # parent holds the `backend` package the imports below come from
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# spaCy, PyPDF2 and ttkthemes are imported where they are first needed, so
+# pool workers and scripts that only parse never load the GUI theme and the
+# model is only read once an extraction actually runs
+from backend import settings
+from backend.nlp_pipeline import load_pipeline
+from backend.skill_matcher import load_skill_matcher, artifact_digest
+from backend.skill_scanner import SkillScanner
+from backend.pdf_text import extract_pdf, page_count, read_pdf_pages
+from backend.budget import ExtractionBudget, cacheable
+from backend.sections import SectionIndex
+from backend.records import ResumeInfo, ExperienceEntry, pack_experience, experience_from_column
+from backend.worker_pool import ExtractionPool
+from backend.history_view import HistoryView
+from backend.migrations import migrate, DESKTOP_MIGRATIONS
+from backend.text_index import index_text, search_text, text_query_sql
+from backend.desktop_queue import ExtractionQueue, QUEUED, RUNNING, DONE, FAILED, CANCELLED
+from backend.cache import ExtractionCache, cache_version, file_digest
+from backend.skill_index import index_resume, unindex_resume, skill_query_sql
+from backend.matching import SkillRanker
+
+class ResumeParser:
+    """Headless extraction half of the app, also run inside pool workers"""
+    # Bump whenever extraction output changes; cached results keyed on it are dropped
+    EXTRACTOR_VERSION = "8"
 
-class ResumeExtractor:
     # Common Indian and Western name patterns
     NAME_PATTERNS = [
         # Pattern for names with titles
@@ -102,62 +126,254 @@ class ResumeExtractor:
         "React", "Angular", "Node.js", "Tableau", "Power BI", "Excel", "AWS", "Azure", "Docker", "Kubernetes"
     ]
 
+    _skill_scanner = None
+
     def __init__(self):
+        self._nlp = None
+        self._matcher = None
+        # Extraction threads and the window's warm-up may all ask for the model first
+        self._nlp_lock = threading.Lock()
+
+    @classmethod
+    def skill_scanner(cls):
+        """Whole-word scanner over DEFAULT_SKILLS and COMMON_SKILLS, built once per process"""
+        if cls._skill_scanner is None:
+            # DEFAULT_SKILLS first so their capitalization is the one reported
+            cls._skill_scanner = SkillScanner(cls.DEFAULT_SKILLS + sorted(cls.COMMON_SKILLS))
+        return cls._skill_scanner
+
+    def init_nlp(self):
+        """Load the spaCy model and the skills matcher, once"""
+        with self._nlp_lock:
+            if self._matcher is not None:
+                return
+            # Only NER and sentence boundaries are read; see DESKTOP_NLP_COMPONENTS
+            nlp = load_pipeline(settings.SPACY_MODEL, settings.DESKTOP_NLP_COMPONENTS)
+            # Prebuilt taxonomy artifact when there is one, else DEFAULT_SKILLS
+            self._matcher = load_skill_matcher(nlp, self.DEFAULT_SKILLS)
+            self._nlp = nlp
+
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use"""
+        if self._nlp is None:
+            self.init_nlp()
+        return self._nlp
+
+    @property
+    def matcher(self):
+        if self._matcher is None:
+            self.init_nlp()
+        return self._matcher
+
+    def extract_text_from_pdf(self, file_path, pool=None):
+        """Extract text from PDF file"""
+        return extract_pdf(file_path, pool)[0]
+
+    def parse_pdf(self, file_path, pool=None, total=None):
+        """Extract information from a PDF file within the extraction budget; total is its page count, if known"""
+        budget = ExtractionBudget()
+        pages, pdf = read_pdf_pages(file_path, pool, budget, total)
+        text, header, truncated = budget.split(pages, pdf)
+        if pool is not None:
+            info = pool.run(parse_resume_text, text)
+        else:
+            info = self.extract_information(text)
+        if header is not None:
+            # Too long to analyse whole: contact details from the first pages
+            info['email'], info['phone'] = self.extract_contact(header)
+        info['truncated'] = truncated
+        # Which PDF backend produced the text, and how long it took
+        info['pdf'] = pdf
+        # Kept for the full-text index
+        info['text'] = text
+        return ResumeInfo.from_dict(info)
+
+    def extract_skills(self, text):
+        """Skills named in free text such as a job description"""
+        doc = self.nlp.make_doc(text)
+        return sorted(set(self.matcher.skills(doc)))
+    
+    def extract_information(self, text):
+        """
+        Extract relevant information from resume text using spaCy for advanced NLP.
+        - Name: First PERSON entity found
+        - Skills: PhraseMatcher on a predefined list
+        - Email/Phone: Heuristic
+        - Work Experience: NER + keyword heuristics (ORG, DATE, position keyword),
+          over the experience section when there is one
+        """
+        experience = SectionIndex(text).get('experience')
+        if experience:
+            # NER only runs over the experience section; skills only need tokens
+            doc = self.nlp.make_doc(text)
+            experience_doc = self.nlp(text[experience.start_char:experience.end_char])
+        else:
+            doc = experience_doc = self.nlp(text)
+        info = {
+            'name': '',
+            'email': '',
+            'phone': '',
+            'skills': [],
+            'work_experience': []
+        }
+        # --- Skills Extraction ---
+        found_skills = set(self.matcher.skills(doc))
+        if not found_skills:
+            # Nothing from the matcher's list: fall back to the broader COMMON_SKILLS
+            found_skills = set(self.skill_scanner().skills(text))
+        info['skills'] = sorted(found_skills)
+
+        # --- Work Experience Extraction ---
+        experience_entries = []
+        for sent in experience_doc.sents:
+            sent_text = sent.text.strip()
+            org = None
+            date = None
+            position = None
+            # Extract organization and date entities
+            for ent in sent.ents:
+                if ent.label_ == "ORG":
+                    org = ent.text
+                if ent.label_ == "DATE":
+                    date = ent.text
+            # Extract a position by keyword
+            for word in sent_text.split():
+                if word.lower() in self.POSITION_KEYWORDS:
+                    position = word
+                    break
+            # If this sentence looks like work experience, add it
+            if org or date or position or any(word in sent_text.lower() for word in ['experience', 'work', 'employment', 'company', 'internship']):
+                experience_entries.append({
+                    'position': position if position else '',
+                    'organization': org if org else '',
+                    'duration': date if date else '',
+                    'dates': date if date else '',
+                    'raw': sent_text
+                })
+        # Remove duplicates based on 'raw' text
+        seen = set()
+        uniq_experience = []
+        for entry in experience_entries:
+            if entry['raw'] not in seen:
+                uniq_experience.append(entry)
+                seen.add(entry['raw'])
+        info['work_experience'] = uniq_experience
+
+        # --- Email and Phone Extraction ---
+        info['email'], info['phone'] = self.extract_contact(text)
+        return info
+
+    def extract_contact(self, text):
+        """(email, phone) from the first line that has either"""
+        for line in text.split('\n'):
+            # Email detection
+            email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', line)
+            if email_match:
+                return email_match.group(), ''
+            # Phone detection
+            phone_match = re.search(r'\d{10}', line)
+            if phone_match:
+                return '', phone_match.group()
+        return '', ''
+
+
+_worker_parser = None
+
+def init_parser_worker():
+    """Pool preload hook: build one parser per worker process"""
+    global _worker_parser
+    _worker_parser = ResumeParser()
+    _worker_parser.init_nlp()
+
+def parse_resume_file(file_path):
+    """Pool job: extract text and information from one PDF"""
+    return _worker_parser.parse_pdf(file_path)
+
+def parse_resume_text(text):
+    """Pool job: extract information from already extracted text"""
+    return _worker_parser.extract_information(text)
+
+def extract_skills_in_worker(text):
+    """Pool job: skills named in a job description"""
+    return _worker_parser.extract_skills(text)
+
+
+class ResumeExtractor(ResumeParser):
+    def __init__(self):
+        super().__init__()
+        from ttkthemes import ThemedTk
         # Initialize main window
         self.root = ThemedTk(theme="arc")  # Modern theme
         self.root.title("Resume Skill Extractor")
         self.root.geometry("800x600")
 
-        # --- Initialize spaCy NLP model (requires en_core_web_sm, see note below) ---
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            messagebox.showerror(
-                "spaCy Model Missing",
-                "spaCy English model not found. Please run: python -m spacy download en_core_web_sm\nThen restart the app."
-            )
-            raise
-        # Initialize PhraseMatcher for skills
-        self.matcher = PhraseMatcher(self.nlp.vocab, attr='LOWER')
-        patterns = [self.nlp(skill) for skill in self.DEFAULT_SKILLS]
-        self.matcher.add("SKILLS", patterns)
+        # --- Extraction runs in a worker pool when configured, else in this process ---
+        self.pool = None
+        if settings.DESKTOP_POOL_WORKERS > 0:
+            self.pool = ExtractionPool(workers=settings.DESKTOP_POOL_WORKERS, preload=(init_parser_worker,))
+            self.pool.start()
+        else:
+            # --- Load the spaCy model in the background once the window is up (requires en_core_web_sm) ---
+            self.root.after_idle(self.warm_up_nlp)
+
+        # --- PDFs are extracted on background threads; poll_queue saves and shows the results ---
+        self.extraction_queue = ExtractionQueue(
+            self.extract_file, threads=settings.DESKTOP_POOL_WORKERS if self.pool is not None else 1)
+        self._polling = False
 
         # Initialize database
         self.init_db()
+        # Results of previously seen PDFs, keyed by content hash
+        self.cache = ExtractionCache('resumes.db', cache_version(
+            "desktop", f"{self.EXTRACTOR_VERSION}:{','.join(settings.DESKTOP_NLP_COMPONENTS)}:{settings.PDF_BACKEND}:"
+            f"{ExtractionBudget().signature()}", self.DEFAULT_SKILLS + sorted(self.COMMON_SKILLS),
+            taxonomy=artifact_digest()))
+        self.cache.prune()
 
         # Create GUI
         self.create_gui()
 
-    def init_db(self):
-        """Initialize SQLite database and handle migrations"""
-        self.conn = sqlite3.connect('resumes.db')
-        self.cursor = self.conn.cursor()
+    def warm_up_nlp(self):
+        """Load the model in-process so the first upload doesn't wait for it.
 
-        # Create table if it doesn't exist
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS resumes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT,
-                email TEXT,
-                phone TEXT,
-                skills TEXT,
-                work_experience TEXT,
-                upload_date TEXT,
-                filename TEXT
-            )
-        ''')
+        The load runs on a background thread, so the window stays responsive;
+        extractions started meanwhile wait for it in init_nlp.
+        """
+        self._nlp_error = None
+        loader = threading.Thread(target=self._load_nlp, name="load-nlp", daemon=True)
+        loader.start()
+        self.root.after(settings.DESKTOP_POLL_MS, self._nlp_loaded, loader)
 
-        # Check if status column exists
-        self.cursor.execute("PRAGMA table_info(resumes)")
-        columns = [column[1] for column in self.cursor.fetchall()]
+    def _load_nlp(self):
+        try:
+            self.init_nlp()
+        except OSError as e:
+            self._nlp_error = e
 
-        if 'status' not in columns:
-            # Add status column to existing table
-            self.cursor.execute('ALTER TABLE resumes ADD COLUMN status TEXT DEFAULT "To Review"')
-            # Update existing rows
-            self.cursor.execute('UPDATE resumes SET status = "To Review" WHERE status IS NULL')
+    def _nlp_loaded(self, loader):
+        # Tk is only touched on the main thread, so the loader is polled
+        if loader.is_alive():
+            self.root.after(settings.DESKTOP_POLL_MS, self._nlp_loaded, loader)
+        elif self._nlp_error is not None:
+            messagebox.showerror(
+                "spaCy Model Missing",
+                "spaCy English model not found. Please run: python -m spacy download en_core_web_sm\nThen restart the app."
+            )
+            self.root.destroy()
 
-        self.conn.commit()
+    def init_db(self):
+        """Initialize SQLite database and handle migrations"""
+        self.conn = sqlite3.connect('resumes.db')
+        self.cursor = self.conn.cursor()
+        # WAL: cache writes from extraction threads never block the window's reads
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Creates or upgrades the schema once per version
+        migrate(self.conn, DESKTOP_MIGRATIONS)
+        # In-memory skill matrix for job description matching
+        self.ranker = SkillRanker()
+        self.ranker.load(self.conn)
 
     def create_gui(self):
         """Create the main GUI elements"""
@@ -181,11 +397,12 @@ class ResumeExtractor:
         self.file_label = ttk.Label(upload_frame, text="No file selected")
         self.file_label.grid(row=0, column=0, padx=5)
         
-        upload_btn = ttk.Button(upload_frame, text="Select PDF", command=self.select_file)
+        upload_btn = ttk.Button(upload_frame, text="Select PDFs", command=self.select_file)
         upload_btn.grid(row=0, column=1, padx=5)
+        ttk.Button(upload_frame, text="Select Folder", command=self.select_folder).grid(row=0, column=2, padx=5)
         
         # Filter frame
-        filter_frame = ttk.LabelFrame(main_frame, text="Filter by Skills", padding="10")
+        filter_frame = ttk.LabelFrame(main_frame, text="Filter by Skills or Text", padding="10")
         filter_frame.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5)
         
         self.skill_filter = ttk.Entry(filter_frame)
@@ -197,6 +414,15 @@ class ResumeExtractor:
         filter_btn = ttk.Button(filter_frame, text="Filter", command=self.filter_resumes)
         filter_btn.grid(row=0, column=1, padx=5)
         
+        # Full-text search over the stored resume text
+        self.text_search = ttk.Entry(filter_frame)
+        self.text_search.grid(row=1, column=0, padx=5, pady=(5, 0), sticky=(tk.W, tk.E))
+        self.text_search.insert(0, "Search resume text")
+        self.text_search.bind('<FocusIn>', lambda e: self.text_search.delete(0, tk.END) if
+                              self.text_search.get() == "Search resume text" else None)
+        self.text_search.bind('<Return>', lambda e: self.search_resume_text())
+        ttk.Button(filter_frame, text="Search", command=self.search_resume_text).grid(row=1, column=1, padx=5, pady=(5, 0))
+        
         # Results frame
         results_frame = ttk.LabelFrame(main_frame, text="Extracted Information", padding="10")
         results_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
@@ -229,7 +455,10 @@ class ResumeExtractor:
         # Scrollbar for history
         history_scrollbar = ttk.Scrollbar(history_frame, orient=tk.VERTICAL, command=self.history_tree.yview)
         history_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.history_tree.configure(yscrollcommand=history_scrollbar.set)
+        # Rows are read a page at a time as the list is scrolled
+        self.history = HistoryView(self.history_tree, self.conn)
+        self.history_tree.configure(yscrollcommand=self.history_scrolled)
+        self.history_scrollbar = history_scrollbar
         
         # Bind history selection
         self.history_tree.bind('<<TreeviewSelect>>', self.show_selected_resume)
@@ -253,6 +482,38 @@ class ResumeExtractor:
         for i, status in enumerate(['All', 'Accept', 'Reject', 'To Review']):
             ttk.Radiobutton(filter_frame, text=status, variable=self.status_var, value=status, command=self.load_history).grid(row=0, column=i+1, padx=5)
         
+        # Job description matching
+        match_frame = ttk.LabelFrame(main_frame, text="Match Job Description", padding="10")
+        match_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+        match_frame.columnconfigure(0, weight=1)
+        
+        self.jd_text = tk.Text(match_frame, height=4, width=60)
+        self.jd_text.grid(row=0, column=0, padx=5, sticky=(tk.W, tk.E))
+        ttk.Button(match_frame, text="Rank Resumes", command=self.match_job_description).grid(row=0, column=1, padx=5)
+        
+        # Per-file progress of background extraction
+        queue_frame = ttk.LabelFrame(main_frame, text="Extraction Queue", padding="10")
+        queue_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+        queue_frame.columnconfigure(0, weight=1)
+        
+        self.queue_tree = ttk.Treeview(queue_frame, columns=('File', 'State', 'Time'), show='headings', height=4)
+        self.queue_tree.heading('File', text='File')
+        self.queue_tree.heading('State', text='State')
+        self.queue_tree.heading('Time', text='Time')
+        self.queue_tree.column('State', width=220)
+        self.queue_tree.column('Time', width=80)
+        self.queue_tree.tag_configure(FAILED, foreground='red')
+        self.queue_tree.tag_configure(CANCELLED, foreground='gray')
+        self.queue_tree.grid(row=0, column=0, rowspan=3, sticky=(tk.W, tk.E))
+        
+        queue_scrollbar = ttk.Scrollbar(queue_frame, orient=tk.VERTICAL, command=self.queue_tree.yview)
+        queue_scrollbar.grid(row=0, column=1, rowspan=3, sticky=(tk.N, tk.S))
+        self.queue_tree.configure(yscrollcommand=queue_scrollbar.set)
+        
+        ttk.Button(queue_frame, text="Cancel Selected", command=self.cancel_selected_jobs).grid(row=0, column=2, padx=5)
+        ttk.Button(queue_frame, text="Cancel All", command=self.cancel_all_jobs).grid(row=1, column=2, padx=5)
+        ttk.Button(queue_frame, text="Clear Finished", command=self.clear_finished_jobs).grid(row=2, column=2, padx=5)
+        
         # Configure button styles
         style = ttk.Style()
         style.configure('Accept.TButton', foreground='green')
@@ -263,325 +524,158 @@ class ResumeExtractor:
         
     def select_file(self):
         """Handle file selection"""
-        filename = filedialog.askopenfilename(
-            title="Select PDF Resume",
+        filenames = filedialog.askopenfilenames(
+            title="Select PDF Resumes",
             filetypes=[("PDF files", "*.pdf")]
         )
         
-        if filename:
-            self.file_label.config(text=os.path.basename(filename))
-            self.process_pdf(filename)
+        if filenames:
+            self.queue_files(filenames)
     
-    def process_pdf(self, filename):
-        """Process the selected PDF file"""
-        try:
-            # Extract text from PDF
-            text = self.extract_text_from_pdf(filename)
-            
-            # Extract information
-            info = self.extract_information(text)
-            
-            # Save to database
-            self.save_to_db(info, filename)
-            
-            # Display results
-            self.display_results(info)
-            
-            # Refresh history
-            self.load_history()
-            
-            messagebox.showinfo("Success", "Resume processed successfully!")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error processing PDF: {str(e)}")
+    def select_folder(self):
+        """Queue every PDF under a folder"""
+        folder = filedialog.askdirectory(title="Select Folder of PDF Resumes")
+        if not folder:
+            return
+        filenames = []
+        for dirpath, dirnames, files in os.walk(folder):
+            dirnames.sort()
+            filenames.extend(os.path.join(dirpath, f) for f in sorted(files) if f.lower().endswith('.pdf'))
+        if filenames:
+            self.queue_files(filenames)
+        else:
+            messagebox.showinfo("No PDFs", "No PDF files found in this folder.")
     
-    def extract_text_from_pdf(self, file_path):
-        """Extract text from PDF file"""
-        text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-        return text
+    def queue_files(self, filenames):
+        """Add files to the background extraction queue"""
+        for job in self.extraction_queue.add(filenames):
+            self.queue_tree.insert('', 'end', iid=str(job.id), values=(os.path.basename(job.path), job.state, ''))
+        self.update_queue_label()
+        if not self._polling:
+            self._polling = True
+            self.root.after(settings.DESKTOP_POLL_MS, self.poll_queue)
     
-    def extract_information(self, text):
-        """
-        Extract relevant information from resume text using spaCy for advanced NLP.
-        - Name: First PERSON entity found
-        - Skills: PhraseMatcher on a predefined list
-        - Email/Phone: Heuristic
-        - Work Experience: NER + keyword heuristics (ORG, DATE, position keyword)
-        """
-        doc = self.nlp(text)
-        lines = text.split('\n')
-        info = {
-            'name': '',
-            'email': '',
-            'phone': '',
-            'skills': [],
-            'work_experience': []
-        }
-        # --- Skills Extraction ---
-        matches = self.matcher(doc)
-        found_skills = set()
-        for match_id, start, end in matches:
-            found_skills.add(doc[start:end].text)
-        info['skills'] = sorted(found_skills)
-
-        # --- Work Experience Extraction ---
-        experience_entries = []
-        for sent in doc.sents:
-            sent_text = sent.text.strip()
-            org = None
-            date = None
-            position = None
-            # Extract organization and date entities
-            for ent in sent.ents:
-                if ent.label_ == "ORG":
-                    org = ent.text
-                if ent.label_ == "DATE":
-                    date = ent.text
-            # Extract a position by keyword
-            for word in sent_text.split():
-                if word.lower() in self.POSITION_KEYWORDS:
-                    position = word
-                    break
-            # If this sentence looks like work experience, add it
-            if org or date or position or any(word in sent_text.lower() for word in ['experience', 'work', 'employment', 'company', 'internship']):
-                experience_entries.append({
-                    'position': position if position else '',
-                    'organization': org if org else '',
-                    'duration': date if date else '',
-                    'dates': date if date else '',
-                    'raw': sent_text
-                })
-        # Remove duplicates based on 'raw' text
-        seen = set()
-        uniq_experience = []
-        for entry in experience_entries:
-            if entry['raw'] not in seen:
-                uniq_experience.append(entry)
-                seen.add(entry['raw'])
-        info['work_experience'] = uniq_experience
-
-        # --- Email and Phone Extraction ---
-        for line in lines:
-            # Email detection
-            email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', line)
-            if email_match:
-                info['email'] = email_match.group()
-                break
-            # Phone detection
-            phone_match = re.search(r'\d{10}', line)
-            if phone_match:
-                info['phone'] = phone_match.group()
-                break
-        return info
-
-        # Detect start of a new section
-        if in_experience and any(any(kw in lower_line for kw in kws) for sec, kws in section_headers.items() if sec != 'experience'):
-            in_experience = False
-        if in_experience:
-            # Look for date patterns
-            dates = []
-            for pattern in self.DATE_PATTERNS:
-                matches = re.finditer(pattern, line)
-                for match in matches:
-                    dates.append(match.group())
-            # If we found dates, this might be a new position
-            if dates and len(line) < 150:
-                # Try to extract position and organization
-                parts = re.split(r'\s*(?:at|@|-|,|\||with|for)\s*', line)
-                position = parts[0].strip() if len(parts) > 0 else ''
-                org = parts[1].strip() if len(parts) > 1 else ''
-                exp_entry = {
-                    'position': position.title(),
-                    'organization': org,
-                    'dates': ', '.join(dates),
-                    'duration': ''
-                }
-                info['work_experience'].append(exp_entry)
-        # If no work experience found, leave as empty list
-        # Section detection
-        if any(word in lower_line for word in ['skills', 'expertise', 'competencies', 'technical skills']):
-            current_section = 'skills'
-            skill_section_found = True
-        elif any(word in lower_line for word in ['experience', 'employment', 'work history']):
-            current_section = 'experience'
-            
-            # Skills extraction - only from skills section
-            if current_section == 'skills':
-                # Skip lines that look like headers
-                if any(header in lower_line for header in ['skills:', 'expertise:', 'competencies:', 'technical skills:']):
-                    pass  # Do nothing, skip
-                # Skip lines that look like they're from other sections
-                elif any(header in lower_line for header in ['experience', 'education', 'projects', 'achievements']):
-                    current_section = None
-                else:
-                    # Split by common delimiters and process each potential skill
-                    for skill in re.split('[,•\n\t|/]', line):
-                        skill = skill.strip()
-                        # Remove common bullet points and symbols
-                        skill = re.sub(r'^[-•●\*]\s*', '', skill)
-                        # Skip if too short or looks like a date/number
-                        if len(skill) < 2 or skill.isdigit() or re.match(r'\d{4}', skill):
-                            continue
-                        # Skip if it's a common word that's not a skill
-                        if skill.lower() in ['and', 'or', 'in', 'with', 'using', 'etc', 'etc.', 'including']:
-                            continue
-                        # Add skill with proper formatting
-                        if skill.isupper() and len(skill) <= 5:  # Keep acronyms uppercase
-                            info['skills'].add(skill)
-                        else:
-                            # Capitalize first letter of each word for normal skills
-                            formatted_skill = ' '.join(word.capitalize() if not word.isupper() 
-                                                      else word for word in skill.split())
-                            info['skills'].add(formatted_skill)
-            
-            # Work experience extraction
-            if current_section == 'experience':
-                # Look for date patterns
-                dates = []
-                for pattern in self.DATE_PATTERNS:
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        dates.append(match.group())
-                # If we found dates, this might be a new position
-                if dates and len(line) < 150:  # Allow slightly longer lines for full position details
-                    # Skip if this line appears to be a bullet point or description
-                    if line.strip().startswith(('•', '-', '>', '*')) or len(line.strip()) > 100:
-                        pass  # Do nothing, skip
-                    else:
-                        # Try to extract position and organization
-                        # Common patterns: "Position at Organization" or "Position - Organization"
-                        parts = re.split(r'\s*(?:at|@|-|,|\||with|for)\s*', line)
-                        if len(parts) >= 1:
-                            # Check if any part contains position keywords
-                            position_part = None
-                            org_part = None
-                            for part in parts:
-                                part = part.strip().lower()
-                                # If this part contains a position keyword, it's likely the position
-                                if any(keyword in part for keyword in self.POSITION_KEYWORDS):
-                                    position_part = part
-                                    break
-                            if position_part:
-                                # The other part is likely the organization
-                                org_part = next((p.strip() for p in parts if p.strip().lower() != position_part), '')
-                            else:
-                                # If no position keyword found, use first part as position
-                                position_part = parts[0].strip()
-                                org_part = parts[1].strip() if len(parts) > 1 else ''
-                            position = position_part.title()  # Capitalize position title
-                            org = org_part.strip()
-                            # Skip if we don't have both position and organization
-                            if not position or not org:
-                                pass  # Do nothing, skip
-                            else:
-                                # Calculate duration if possible
-                                duration = ''
-                                if len(dates) >= 2:
-                                    try:
-                                        start_year = int(re.search(r'20\d{2}', dates[0]).group())
-                                        end_year = int(re.search(r'20\d{2}', dates[1]).group())
-                                        duration = f"{end_year - start_year} years"
-                                    except:
-                                        pass
-                        
-                        # Add to work experience list
-                        exp_entry = {
-                            'position': position,
-                            'organization': org,
-                            'dates': ' - '.join(dates[:2]) if len(dates) >= 2 else dates[0] if dates else '',
-                            'duration': duration
-                        }
-                        info['work_experience'].append(exp_entry)
-        
-        # If no skills section was found, make sure we have some skills from keyword matching
-        if not skill_section_found:
-            # Scan the entire text again for technical terms
-            text_lower = text.lower()
-            for skill in self.COMMON_SKILLS:
-                if skill in text_lower:
-                    info['skills'].add(skill)
-        
-        # Extract additional skills (words starting with uppercase followed by lowercase)
-        potential_skills = set()
-        for line in lines:
-            # Find words that start with uppercase followed by lowercase (potential technical terms)
-            matches = re.finditer(r'\b[A-Z][a-z]+(?:[A-Z][a-z]+)*\b', line)
-            for match in matches:
-                word = match.group()
-                if len(word) > 2:  # Avoid short abbreviations
-                    potential_skills.add(word.lower())
-        
-        # Add potential skills to the skills set
-        info['skills'].update(potential_skills)
-        
-        # Format skills with proper capitalization
-        formatted_skills = []
-        for skill in sorted(info['skills']):
-            # Handle special cases like 'iOS', 'macOS', etc.
-            if skill.lower() in {'ios', 'macos'}:
-                formatted_skills.append(skill.upper())
-            # Handle multi-word skills
-            elif ' ' in skill:
-                formatted_skills.append(' '.join(word.capitalize() for word in skill.split()))
-            # Handle skills with dots like 'node.js'
-            elif '.' in skill:
-                formatted_skills.append('.'.join(word.capitalize() for word in skill.split('.')))
+    def poll_queue(self):
+        """Pick up finished extractions: save them in one transaction and update the list"""
+        changes = self.extraction_queue.drain(settings.DESKTOP_POLL_BATCH)
+        done = []
+        for job, state in changes:
+            if state == DONE:
+                done.append(job)
+            if not self.queue_tree.exists(str(job.id)):
+                continue
+            if state == FAILED:
+                label = f"failed: {job.error}"
+            elif state == DONE and job.info.truncated:
+                label = "done (truncated)"
             else:
-                formatted_skills.append(skill.capitalize())
-        
-        info['skills'] = formatted_skills
-        return info
+                label = state
+            self.queue_tree.item(str(job.id), values=(
+                os.path.basename(job.path), label,
+                f"{job.elapsed_ms / 1000:.1f} s" if job.elapsed_ms is not None and state != RUNNING else ''),
+                tags=(state,))
+        if done:
+            try:
+                resume_ids = self.save_to_db([(job.info, job.path, job.digest) for job in done])
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                messagebox.showerror("Error", f"Error saving resumes: {str(e)}")
+            else:
+                self.display_results(done[-1].info)
+                self.history.add(resume_ids)
+            for job in done:
+                # Saved; the list only needs its name and state from here on
+                job.info = None
+        self.update_queue_label()
+        counts = self.extraction_queue.counts()
+        if counts[RUNNING] or counts[QUEUED] or not self.extraction_queue.events.empty():
+            self.root.after(settings.DESKTOP_POLL_MS, self.poll_queue)
+        else:
+            self._polling = False
     
-    def save_to_db(self, info, filename):
-        """Save extracted information to database"""
-        self.cursor.execute('''
-            INSERT INTO resumes (name, email, phone, skills, work_experience, upload_date, filename, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            info['name'],
-            info['email'],
-            info['phone'],
-            json.dumps(info['skills']),
-            json.dumps([{  # Convert work experience entries to a consistent format
-                'position': exp.get('position', ''),
-                'organization': exp.get('organization', ''),
-                'dates': exp.get('dates', ''),
-                'duration': exp.get('duration', '')
-            } for exp in info['work_experience']]),
-            datetime.now().isoformat(),
-            os.path.basename(filename),
-            'To Review'
-        ))
+    def update_queue_label(self):
+        counts = self.extraction_queue.counts()
+        total = sum(counts.values())
+        if not total:
+            self.file_label.config(text="No file selected")
+            return
+        text = f"{counts[DONE]} of {total} done"
+        if counts[FAILED]:
+            text += f", {counts[FAILED]} failed"
+        if counts[CANCELLED]:
+            text += f", {counts[CANCELLED]} cancelled"
+        self.file_label.config(text=text)
+    
+    def cancel_selected_jobs(self):
+        for iid in self.queue_tree.selection():
+            self.extraction_queue.cancel(int(iid))
+    
+    def cancel_all_jobs(self):
+        self.extraction_queue.cancel_all()
+    
+    def clear_finished_jobs(self):
+        """Remove finished files from the list"""
+        for job in list(self.extraction_queue.jobs.values()):
+            # A result waiting to be saved is kept until poll_queue has it
+            if job.finished and job.info is None:
+                self.extraction_queue.forget(job.id)
+                self.queue_tree.delete(str(job.id))
+        self.update_queue_label()
+    
+    def extract_file(self, filename):
+        """(info, content hash) for one PDF, from the cache when its content was seen before; runs on a queue thread"""
+        digest = file_digest(filename)
+        info = self.cache.get(digest)
+        if info is None:
+            total = page_count(filename) if self.pool is not None and settings.PDF_PAGES_PER_TASK > 0 else 0
+            if total > settings.PDF_PAGES_PER_TASK > 0:
+                # Long document: its page ranges are parsed on several workers
+                info = self.parse_pdf(filename, pool=self.pool, total=total)
+            elif self.pool is not None:
+                info = self.pool.run(parse_resume_file, filename)
+            else:
+                # Extract text and information from PDF
+                info = self.parse_pdf(filename)
+            if cacheable(info):
+                self.cache.put(digest, info)
+        return info, digest
+    
+    def save_to_db(self, results):
+        """Save extracted (info, filename, content hash) triples to the database in one transaction; returns their ids"""
+        added = []
+        for info, filename, content_hash in results:
+            self.cursor.execute('''
+                INSERT INTO resumes (name, email, phone, skills, work_experience, upload_date, filename, status, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                info.name,
+                info.email,
+                info.phone,
+                json.dumps(info.skills),
+                # The table shows position, organization and dates; the source sentence isn't kept
+                pack_experience([ExperienceEntry(exp.position, exp.organization, exp.duration, exp.dates)
+                                 for exp in info.work_experience]),
+                datetime.now().isoformat(),
+                os.path.basename(filename),
+                'To Review',
+                content_hash
+            ))
+            resume_id = self.cursor.lastrowid
+            added.append((resume_id, index_resume(self.conn, resume_id, info.skills)))
+            index_text(self.conn, resume_id, info.text)
         self.conn.commit()
+        for resume_id, skill_ids in added:
+            self.ranker.add(resume_id, skill_ids)
+        return [resume_id for resume_id, _ in added]
     
     def load_history(self):
         """Load upload history from database with status filter"""
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-        
-        # Load history from database with status filter
         status_filter = self.status_var.get()
-        if status_filter == 'All':
-            self.cursor.execute('SELECT upload_date, filename, status FROM resumes ORDER BY upload_date DESC')
-        else:
-            self.cursor.execute('SELECT upload_date, filename, status FROM resumes WHERE status = ? ORDER BY upload_date DESC', (status_filter,))
-        
-        for row in self.cursor.fetchall():
-            date = datetime.fromisoformat(row[0]).strftime('%Y-%m-%d %H:%M')
-            item = self.history_tree.insert('', 'end', values=(date, row[1], row[2]))
-            
-            # Color-code based on status
-            if row[2] == 'Accept':
-                self.history_tree.tag_configure('accept', foreground='green')
-                self.history_tree.item(item, tags=('accept',))
-            elif row[2] == 'Reject':
-                self.history_tree.tag_configure('reject', foreground='red')
-                self.history_tree.item(item, tags=('reject',))
+        self.history.show(status=None if status_filter == 'All' else status_filter)
+    
+    def history_scrolled(self, first, last):
+        self.history_scrollbar.set(first, last)
+        self.history.on_scroll(first, last)
     
     def update_resume_status(self, status):
         """Update the status of the selected resume"""
@@ -590,10 +684,10 @@ class ResumeExtractor:
             messagebox.showwarning("No Selection", "Please select a resume to update its status.")
             return
         
-        filename = self.history_tree.item(selection[0])['values'][1]
-        self.cursor.execute('UPDATE resumes SET status = ? WHERE filename = ?', (status, filename))
+        resume_id = int(selection[0])
+        self.cursor.execute('UPDATE resumes SET status = ? WHERE id = ?', (status, resume_id))
         self.conn.commit()
-        self.load_history()
+        self.history.set_status(resume_id, status)
     
     def delete_resume(self):
         """Delete the selected resume from the database"""
@@ -603,10 +697,12 @@ class ResumeExtractor:
             return
         
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this resume?"):
-            filename = self.history_tree.item(selection[0])['values'][1]
-            self.cursor.execute('DELETE FROM resumes WHERE filename = ?', (filename,))
+            resume_id = int(selection[0])
+            unindex_resume(self.conn, resume_id)
+            self.cursor.execute('DELETE FROM resumes WHERE id = ?', (resume_id,))
             self.conn.commit()
-            self.load_history()
+            self.ranker.remove(resume_id)
+            self.history.remove(resume_id)
     
     def show_selected_resume(self, event):
         """Display selected resume from history"""
@@ -614,14 +710,11 @@ class ResumeExtractor:
         if not selection:
             return
         
-        # Get filename from selected item
-        filename = self.history_tree.item(selection[0])['values'][1]
-        
         # Fetch resume data
         self.cursor.execute('''
             SELECT email, phone, skills, work_experience
-            FROM resumes WHERE filename = ?
-        ''', (filename,))
+            FROM resumes WHERE id = ?
+        ''', (int(selection[0]),))
         row = self.cursor.fetchone()
         
         if row:
@@ -634,7 +727,7 @@ class ResumeExtractor:
                 self.results_text.insert(tk.END, f"- {skill}\n")
             
             # Display work experience in table format
-            work_exp = json.loads(row[3])
+            work_exp = experience_from_column(row[3])
             self.results_text.insert(tk.END, "\nWork Experience:\n")
             self.results_text.insert(tk.END, "-" * 60 + "\n")
             self.results_text.insert(tk.END, "{:<25} {:<20} {:<15}\n".format("Position", "Organization", "Duration"))
@@ -642,19 +735,40 @@ class ResumeExtractor:
             
             for exp in work_exp:
                 self.results_text.insert(tk.END, "{:<25} {:<20} {:<15}\n".format(
-                    exp['position'][:24],
-                    exp['organization'][:19],
-                    exp['duration'] if exp['duration'] else exp['dates']
+                    exp.position[:24],
+                    exp.organization[:19],
+                    exp.duration if exp.duration else exp.dates
                 ))
             self.results_text.insert(tk.END, "-" * 60)
     
+    def match_job_description(self):
+        """Rank stored resumes against the pasted job description"""
+        jd = self.jd_text.get(1.0, tk.END).strip()
+        if not jd:
+            return
+        if self.pool is not None:
+            skills = self.pool.run(extract_skills_in_worker, jd)
+        else:
+            skills = self.extract_skills(jd)
+        ranked = self.ranker.match(self.conn, skills, k=20)
+        
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, f"Job skills: {', '.join(skills) if skills else 'none recognised'}\n\n")
+        self.results_text.insert(tk.END, "{:<6} {:<30} {}\n".format("Score", "Filename", "Matched Skills"))
+        self.results_text.insert(tk.END, "-" * 60 + "\n")
+        for resume_id, score, matched in ranked:
+            self.cursor.execute('SELECT filename FROM resumes WHERE id = ?', (resume_id,))
+            row = self.cursor.fetchone()
+            if row:
+                self.results_text.insert(tk.END, "{:<6.2f} {:<30} {}\n".format(score, row[0][:29], ', '.join(matched)))
+    
     def display_results(self, info):
         """Display extracted information in the results text widget"""
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"Email: {info['email']}\n\n")
-        self.results_text.insert(tk.END, f"Phone: {info['phone']}\n\n")
+        self.results_text.insert(tk.END, f"Email: {info.email}\n\n")
+        self.results_text.insert(tk.END, f"Phone: {info.phone}\n\n")
         self.results_text.insert(tk.END, "Skills:\n")
-        for skill in info['skills']:
+        for skill in info.skills:
             self.results_text.insert(tk.END, f"- {skill}\n")
         
         self.results_text.insert(tk.END, "\nWork Experience:\n")
@@ -662,17 +776,29 @@ class ResumeExtractor:
         self.results_text.insert(tk.END, "{:<25} {:<20} {:<15}\n".format("Position", "Organization", "Duration"))
         self.results_text.insert(tk.END, "-" * 60 + "\n")
         
-        for exp in info['work_experience']:
+        for exp in info.work_experience:
             self.results_text.insert(tk.END, "{:<25} {:<20} {:<15}\n".format(
-                exp['position'][:24],
-                exp['organization'][:19],
-                exp['duration'] if exp['duration'] else exp['dates']
+                exp.position[:24],
+                exp.organization[:19],
+                exp.duration if exp.duration else exp.dates
             ))
         self.results_text.insert(tk.END, "-" * 60)
-    
+        if info.pdf:
+            self.results_text.insert(tk.END, "\n\nPDF read with {} in {:.0f} ms".format(
+                info.pdf['backend'], info.pdf['parse_ms']))
+        if info.truncated:
+            truncated = info.truncated
+            self.results_text.insert(tk.END, "\nLong document: analysed {} of {} characters read from {} of {} pages ({})".format(
+                truncated['chars_analysed'], truncated['chars_read'], truncated['pages_read'],
+                truncated['pages_total'], ', '.join(truncated['reasons'])))
+
     def run(self):
         """Start the application"""
         self.root.mainloop()
+        # Queued files are dropped; threads are daemons and end with the process
+        self.extraction_queue.cancel_all()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False)
         
     def filter_resumes(self):
         """Filter resumes based on required skills"""
@@ -682,18 +808,40 @@ class ResumeExtractor:
             
         required_skills = [s.strip().lower() for s in skill_text.split(',')]
         
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-        
-        # Query resumes with matching skills
-        self.cursor.execute('SELECT upload_date, filename, skills FROM resumes ORDER BY upload_date DESC')
-        for row in self.cursor.fetchall():
-            resume_skills = [s.lower() for s in json.loads(row[2])]
-            # Check if any of the required skills are in the resume's skills
-            if any(skill in resume_skills for skill in required_skills):
-                date = datetime.fromisoformat(row[0]).strftime('%Y-%m-%d %H:%M')
-                self.history_tree.insert('', 'end', values=(date, row[1]))
+        # Resumes having any of the required skills, looked up in the skill index
+        query = skill_query_sql(self.conn, [required_skills])
+        if query is None:
+            self.history.clear()
+            return
+        ids_sql, params = query
+        self.history.show(ids_sql=ids_sql, params=params)
+
+    def search_resume_text(self):
+        """Show resumes whose text matches the search box: all of them in the
+        history list, the best matches with snippets in the results pane"""
+        query = self.text_search.get().strip()
+        if query == "Search resume text" or not query:
+            return
+        
+        match = text_query_sql(query)
+        if match is None:
+            self.history.clear()
+            return
+        ids_sql, params = match
+        self.history.show(ids_sql=ids_sql, params=params)
+        
+        hits = search_text(self.conn, query, 20)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, f"Text search: {query}\n\n")
+        if not hits:
+            self.results_text.insert(tk.END, "No resumes match.")
+            return
+        filenames = dict(self.conn.execute(
+            f"SELECT id, filename FROM resumes WHERE id IN ({','.join('?' * len(hits))})",
+            [resume_id for resume_id, _, _ in hits]).fetchall())
+        for resume_id, score, snippet in hits:
+            self.results_text.insert(tk.END, "{:<6.2f} {}\n    {}\n".format(
+                score, filenames.get(resume_id, ''), ' '.join(snippet.split())))
 
 if __name__ == "__main__":
     app = ResumeExtractor()
@@ -0,0 +1,47 @@
+"""Writes to the API's resumes table, shared by the API and the bulk ingest.
+
+Both insert functions run inside the caller's transaction and return the
+skill ids of each new row, for SkillRanker.add.
+"""
+from backend.records import pack_experience
+from backend.skill_index import index_resume
+from backend.text_index import index_text
+
+INSERT_RESUME = "INSERT INTO resumes (filename, name, email, phone, skills, work_experience, cgpa, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def resume_row(filename, info, content_hash=None):
+    return (
+        filename,
+        info.name,
+        info.email,
+        info.phone,
+        ",".join(info.skills),
+        pack_experience(info.work_experience),
+        info.cgpa,
+        content_hash
+    )
+
+
+def insert_resume(conn, filename, info, content_hash=None):
+    resume_id = conn.execute(INSERT_RESUME, resume_row(filename, info, content_hash)).lastrowid
+    index_text(conn, resume_id, info.text)
+    return resume_id, index_resume(conn, resume_id, info.skills)
+
+
+def insert_resumes(conn, results):
+    """Insert (filename, info, content hash) triples; returns [(resume_id, skill_ids)].
+
+    Ids are contiguous because the transaction holds the write lock for
+    every insert.
+    """
+    if not results:
+        return []
+    conn.executemany(INSERT_RESUME, [resume_row(*result) for result in results])
+    last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    resume_ids = range(last_id - len(results) + 1, last_id + 1)
+    indexed = []
+    for resume_id, (_, info, _) in zip(resume_ids, results):
+        indexed.append((resume_id, index_resume(conn, resume_id, info.skills)))
+        index_text(conn, resume_id, info.text)
+    return indexed
@@ -0,0 +1,95 @@
+"""One-pass section segmentation of resume text.
+
+Each line is checked once against the compiled header patterns. The result
+maps every section label to the line and character span of the section's
+body: from the line after its header up to the next section line.
+"""
+import re
+
+SKILLS_HEADER = re.compile(r'^\s*technical skills\s*:?$', re.I)
+CAPS_SECTION = re.compile(r'^[A-Z][A-Z\s\-]{2,}$')
+EXPERIENCE_HEADERS = {"work experience", "experience", "professional experience", "employment history", "career history"}
+KNOWN_SECTION_HEADERS = ["projects", "position of responsibility", "entrepreneurship", "extra curriculars", "education", "skills", "summary", "profile", "objective"]
+# Any known header anywhere in a lowercased line
+KNOWN_HEADER = re.compile('|'.join(map(re.escape, KNOWN_SECTION_HEADERS)))
+
+# The line boundaries str.splitlines() splits on
+LINE_ENDS = '\r\n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+
+def is_section_line(lstrip):
+    """True for a line that starts a new section and so ends the one before"""
+    return bool(CAPS_SECTION.match(lstrip)) or bool(KNOWN_HEADER.search(lstrip.lower()))
+
+
+class Section:
+    __slots__ = ('label', 'header_line', 'start_line', 'end_line', 'start_char', 'end_char')
+
+    def __init__(self, label, header_line, start_char):
+        self.label = label
+        self.header_line = header_line
+        self.start_line = header_line + 1
+        self.start_char = start_char
+        self.end_line = None
+        self.end_char = None
+
+    def __repr__(self):
+        return f"Section({self.label!r}, lines {self.start_line}-{self.end_line}, chars {self.start_char}-{self.end_char})"
+
+
+class SectionIndex:
+    """Lines of a text and its sections, found in a single pass.
+
+    Labels are 'technical skills' and 'experience' for the headers the field
+    rules look for, the known header a section line contains (e.g.
+    'education'), or else the lowercased all-caps line itself. get(label)
+    gives the first section with that label.
+    """
+
+    def __init__(self, text):
+        lines, stripped, sections = [], [], []
+        pending = []
+        offset = 0
+        for index, raw in enumerate(text.splitlines(keepends=True)):
+            line = raw.rstrip(LINE_ENDS)
+            lstrip = line.strip()
+            lines.append(line)
+            stripped.append(lstrip)
+            if lstrip:
+                lower = lstrip.lower()
+                known = KNOWN_HEADER.search(lower)
+                caps = known is None and CAPS_SECTION.match(lstrip)
+                if known or caps:
+                    # A section line ends every open section, whatever its label
+                    for section in pending:
+                        section.end_line, section.end_char = index, offset
+                    pending = []
+                if SKILLS_HEADER.match(lstrip):
+                    label = 'technical skills'
+                elif lower in EXPERIENCE_HEADERS:
+                    label = 'experience'
+                elif known:
+                    label = known.group()
+                else:
+                    label = lower if caps else None
+                if label:
+                    section = Section(label, index, offset + len(raw))
+                    pending.append(section)
+                    sections.append(section)
+            offset += len(raw)
+        for section in pending:
+            section.end_line, section.end_char = len(lines), offset
+        self.lines = lines
+        self.stripped = stripped
+        self.sections = sections
+        self._first = {}
+        for section in sections:
+            self._first.setdefault(section.label, section)
+
+    def get(self, label):
+        return self._first.get(label)
+
+    def lines_of(self, label):
+        """Stripped lines of the first section with this label; [] without one"""
+        section = self._first.get(label)
+        return self.stripped[section.start_line:section.end_line] if section else []
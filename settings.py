@@ -0,0 +1,119 @@
+import os
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name, default):
+    value = os.environ.get(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    return value.strip().lower() in ("1", "true", "yes", "on") if value not in (None, "") else default
+
+
+def _env_list(name, default):
+    # Comma-separated; set but empty means an empty list
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+# --- spaCy pipelines ---
+SPACY_MODEL = os.environ.get("RSE_SPACY_MODEL", "en_core_web_sm")
+# Components each extractor loads; anything else in the model is excluded.
+# The web extractor only feeds the skills PhraseMatcher, so it needs just the
+# tokenizer; the desktop app reads entities and sentences. Add e.g. "parser"
+# or "tagger,lemmatizer" to opt components back in.
+WEB_NLP_COMPONENTS = _env_list("RSE_WEB_NLP_COMPONENTS", [])
+DESKTOP_NLP_COMPONENTS = _env_list("RSE_DESKTOP_NLP_COMPONENTS", ["ner", "sentencizer"])
+# Prebuilt skill matcher (python -m backend.skill_matcher build) and the
+# taxonomy it is built from; without the artifact each extractor matches its
+# own built-in skill list
+SKILL_MATCHER_PATH = os.environ.get("RSE_SKILL_MATCHER", os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_matcher"))
+SKILL_TAXONOMY_PATH = os.environ.get("RSE_SKILL_TAXONOMY", os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills_taxonomy.json"))
+# How the web extractor finds skills: "matcher" (spaCy tokens + PhraseMatcher
+# or the prebuilt taxonomy) or "scanner" (Aho-Corasick over the raw text,
+# whole words only, no spaCy at all)
+SKILL_ENGINE = os.environ.get("RSE_SKILL_ENGINE", "matcher")
+# Load models at API startup (in the background, so reads are served at once);
+# off, they load on the first extraction that needs them
+WARM_UP = _env_bool("RSE_WARM_UP", True)
+
+# --- Extraction worker pool ---
+# Number of worker processes that run PDF parsing + spaCy off the event loop
+POOL_WORKERS = _env_int("RSE_POOL_WORKERS", max(1, min(4, os.cpu_count() or 1)))
+# Jobs allowed to wait for a free worker before new uploads get a 503
+POOL_QUEUE_DEPTH = _env_int("RSE_POOL_QUEUE_DEPTH", 16)
+# Seconds a single extraction may take before the request gives up
+POOL_JOB_TIMEOUT = _env_float("RSE_POOL_JOB_TIMEOUT", 60.0)
+# Seconds clients are told to wait in the Retry-After header when the queue is full
+POOL_RETRY_AFTER = _env_int("RSE_POOL_RETRY_AFTER", 5)
+# "spawn" keeps workers independent of Tk / uvicorn state in the parent process
+POOL_START_METHOD = os.environ.get("RSE_POOL_START_METHOD", "spawn")
+# PDF text engine: pypdf2 (default), pypdfium2 or pdfminer (pdfminer.six); the
+# fallbacks are tried in order when it isn't installed or fails on a document
+PDF_BACKEND = os.environ.get("RSE_PDF_BACKEND", "pypdf2")
+PDF_FALLBACK_BACKENDS = _env_list("RSE_PDF_FALLBACK_BACKENDS", ["pypdf2", "pypdfium2", "pdfminer"])
+# PDFs longer than this many pages are parsed as page ranges of this size on
+# several pool workers at once; 0 always parses a document in one job
+PDF_PAGES_PER_TASK = _env_int("RSE_PDF_PAGES_PER_TASK", 10)
+# Worker processes for the Tk app; 0 keeps extraction in the GUI process
+DESKTOP_POOL_WORKERS = _env_int("RSE_DESKTOP_POOL_WORKERS", 0)
+# How often the Tk app picks up finished extractions, and how many per pick-up
+DESKTOP_POLL_MS = _env_int("RSE_DESKTOP_POLL_MS", 100)
+DESKTOP_POLL_BATCH = _env_int("RSE_DESKTOP_POLL_BATCH", 50)
+# History rows the Tk app reads per page, as the list is scrolled
+DESKTOP_HISTORY_PAGE = _env_int("RSE_DESKTOP_HISTORY_PAGE", 200)
+
+# --- Extraction budget (0 turns a limit off) ---
+# Reading a PDF stops after this many pages, characters or ms of parsing
+BUDGET_MAX_PAGES = _env_int("RSE_BUDGET_MAX_PAGES", 50)
+BUDGET_MAX_CHARS = _env_int("RSE_BUDGET_MAX_CHARS", 1_000_000)
+BUDGET_MAX_MS = _env_int("RSE_BUDGET_MAX_MS", 10_000)
+# Skills and experience come from the first KB of text; for a document cut
+# short, name/email/phone/CGPA come from its first pages
+BUDGET_BODY_KB = _env_int("RSE_BUDGET_BODY_KB", 64)
+BUDGET_HEADER_PAGES = _env_int("RSE_BUDGET_HEADER_PAGES", 2)
+
+# --- Async ingestion jobs (/upload?async=1) ---
+# Concurrent job consumers; each one keeps a pool worker busy
+JOB_WORKERS = _env_int("RSE_JOB_WORKERS", POOL_WORKERS)
+# Seconds an idle consumer waits before re-checking the jobs table
+JOB_POLL_INTERVAL = _env_float("RSE_JOB_POLL_INTERVAL", 2.0)
+
+# --- Batch uploads (/upload/batch) ---
+# Documents per nlp.pipe batch and spaCy processes used for the NLP pass
+BATCH_NLP_SIZE = _env_int("RSE_BATCH_NLP_SIZE", 32)
+BATCH_NLP_PROCESSES = _env_int("RSE_BATCH_NLP_PROCESSES", 1)
+# Upper bound on PDFs accepted in one request, zip members included
+BATCH_MAX_FILES = _env_int("RSE_BATCH_MAX_FILES", 1000)
+
+# --- Extraction result cache ---
+# Bytes of serialized results kept in the in-process LRU in front of the SQLite table
+CACHE_MAX_BYTES = _env_int("RSE_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+
+# --- Uploads ---
+# Uploads are streamed to disk in chunks of this size and rejected past the maximum
+UPLOAD_CHUNK_SIZE = _env_int("RSE_UPLOAD_CHUNK_SIZE", 1024 * 1024)
+UPLOAD_MAX_BYTES = _env_int("RSE_UPLOAD_MAX_BYTES", 20 * 1024 * 1024)
+
+# --- SQLite ---
+# Seconds a connection waits on a locked database before raising
+DB_BUSY_TIMEOUT = _env_float("RSE_DB_BUSY_TIMEOUT", 10.0)
+# Bytes of the database file memory-mapped for reads
+DB_MMAP_SIZE = _env_int("RSE_DB_MMAP_SIZE", 256 * 1024 * 1024)
+# Prepared statements kept per connection
+DB_CACHED_STATEMENTS = _env_int("RSE_DB_CACHED_STATEMENTS", 256)
+# Writes grouped into one commit, and seconds the writer waits for more to arrive
+DB_WRITE_BATCH = _env_int("RSE_DB_WRITE_BATCH", 64)
+DB_WRITE_WAIT = _env_float("RSE_DB_WRITE_WAIT", 0.005)
+
+# --- GET /resumes paging ---
+RESUMES_PAGE_SIZE = _env_int("RSE_RESUMES_PAGE_SIZE", 100)
+RESUMES_MAX_PAGE_SIZE = _env_int("RSE_RESUMES_MAX_PAGE_SIZE", 1000)
@@ -0,0 +1,97 @@
+SKILL_INDEX_SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS skills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE
+    )''',
+    '''CREATE TABLE IF NOT EXISTS resume_skills (
+        skill_id INTEGER NOT NULL,
+        resume_id INTEGER NOT NULL,
+        PRIMARY KEY (skill_id, resume_id)
+    ) WITHOUT ROWID''',
+    'CREATE INDEX IF NOT EXISTS idx_resume_skills_resume ON resume_skills (resume_id)',
+)
+
+
+def normalize_skill(skill):
+    return ' '.join(skill.split()).lower()
+
+
+def init_skill_index(conn, parse_skills):
+    """Fill empty index tables from resumes.skills, inside the caller's transaction.
+
+    parse_skills turns the stored skills column into a list of names.
+    """
+    indexed = conn.execute('SELECT 1 FROM resume_skills LIMIT 1').fetchone()
+    if not indexed:
+        rows = conn.execute("SELECT id, skills FROM resumes WHERE skills IS NOT NULL AND skills != ''").fetchall()
+        for resume_id, skills in rows:
+            index_resume(conn, resume_id, parse_skills(skills))
+
+
+def skill_ids(conn, names, create=False):
+    """Map normalized skill names to ids, optionally adding unknown ones"""
+    names = sorted({normalize_skill(n) for n in names if n and n.strip()})
+    if not names:
+        return {}
+    if create:
+        conn.executemany('INSERT OR IGNORE INTO skills (name) VALUES (?)', [(n,) for n in names])
+    placeholders = ','.join('?' * len(names))
+    return dict(conn.execute(f'SELECT name, id FROM skills WHERE name IN ({placeholders})', names).fetchall())
+
+
+def index_resume(conn, resume_id, skills):
+    """Add a resume's skills to the index inside the caller's transaction;
+    returns the skill ids"""
+    ids = skill_ids(conn, skills, create=True)
+    conn.executemany(
+        'INSERT OR IGNORE INTO resume_skills (skill_id, resume_id) VALUES (?, ?)',
+        [(skill_id, resume_id) for skill_id in ids.values()],
+    )
+    return list(ids.values())
+
+
+def unindex_resume(conn, resume_id):
+    conn.execute('DELETE FROM resume_skills WHERE resume_id = ?', (resume_id,))
+
+
+def parse_skill_query(query):
+    """Parse 'python,react|angular,-php' into AND-ed OR-groups plus exclusions.
+
+    Commas separate required terms, '|' separates alternatives within a term
+    and a leading '-' excludes a skill.
+    """
+    groups, excluded = [], []
+    for term in query.split(','):
+        term = term.strip()
+        if not term:
+            continue
+        if term.startswith('-'):
+            excluded.extend(t for t in term[1:].split('|') if t.strip())
+            continue
+        alternatives = [t for t in term.split('|') if t.strip()]
+        if alternatives:
+            groups.append(alternatives)
+    return groups, excluded
+
+
+def skill_query_sql(conn, groups, excluded=()):
+    """Build a SELECT of matching resume ids from the index.
+
+    Each group in groups is OR-ed internally and the groups are AND-ed; ids
+    having any excluded skill are removed. Returns (sql, params), or None
+    when a required group names only unknown skills and nothing can match.
+    """
+    ids = skill_ids(conn, [s for group in groups for s in group] + list(excluded))
+    parts, params = [], []
+    for group in groups:
+        group_ids = sorted({ids[n] for n in map(normalize_skill, group) if n in ids})
+        if not group_ids:
+            return None
+        parts.append(f"SELECT resume_id FROM resume_skills WHERE skill_id IN ({','.join('?' * len(group_ids))})")
+        params.extend(group_ids)
+    sql = ' INTERSECT '.join(parts) if parts else 'SELECT id FROM resumes'
+    excluded_ids = sorted({ids[n] for n in map(normalize_skill, excluded) if n in ids})
+    if excluded_ids:
+        sql += f" EXCEPT SELECT resume_id FROM resume_skills WHERE skill_id IN ({','.join('?' * len(excluded_ids))})"
+        params.extend(excluded_ids)
+    return sql, params
@@ -0,0 +1,313 @@
+"""Skills matcher built from a taxonomy, with a prebuilt on-disk artifact.
+
+    python -m backend.skill_matcher build [--taxonomy skills_taxonomy.json] [--out DIR]
+
+The build step tokenizes every skill name and synonym once and stores the
+lowercased token sequences as a phrase table keyed by first token, mapped to
+canonical skill ids. The file is a hash table that is read in place through a
+read-only mmap: loading it tokenizes nothing and copies nothing, and every
+worker process that maps it shares the same page-cache pages. Each process
+only keeps a bounded cache of the tokens it has looked up.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from importlib.metadata import version as package_version
+
+from backend import settings
+from backend.skill_index import normalize_skill
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = 2
+PHRASES_FILE = 'phrases.bin'
+META_FILE = 'meta.json'
+
+# phrases.bin: header, then uint32 arrays (native byte order, recorded in the
+# meta) of bucket offsets and id/name offsets, then the entry, id and name bytes.
+# A bucket holds (skill index, phrase length, phrase) records, the phrase being
+# its lowercased tokens joined by NUL, longest phrases first per first token.
+MAGIC = b'RSEP'
+HEADER = struct.Struct('<4sIIII')  # magic, buckets, phrases, skills, entry bytes
+RECORD = struct.Struct('<IH')
+# Looked-up tokens cached per process; resume vocabulary repeats a lot
+TOKEN_CACHE_SIZE = 1 << 16
+
+
+def _bucket(token, mask):
+    return zlib.crc32(token.encode('utf-8')) & mask
+
+
+def _offsets(chunks):
+    offsets, total = array('I', [0]), 0
+    for chunk in chunks:
+        total += len(chunk)
+        offsets.append(total)
+    return offsets
+
+
+def pack_phrase_table(table, ids, names):
+    """phrases.bin bytes for a build_phrase_table() table"""
+    # At most half the buckets used, so most tokens land in an empty one
+    n_buckets = 1 << max(4, (2 * len(table)).bit_length())
+    buckets = [[] for _ in range(n_buckets)]
+    for first, entries in table.items():
+        for rest, index in entries:
+            if any('\0' in token for token in (first, *rest)):
+                raise ValueError(f"Skill phrase token contains NUL: {(first, *rest)!r}")
+            phrase = '\0'.join((first, *rest)).encode('utf-8')
+            buckets[_bucket(first, n_buckets - 1)].append(RECORD.pack(index, len(phrase)) + phrase)
+    entries = [b''.join(bucket) for bucket in buckets]
+    id_bytes = [skill_id.encode('utf-8') for skill_id in ids]
+    name_bytes = [name.encode('utf-8') for name in names]
+    phrases = sum(len(e) for e in table.values())
+    header = HEADER.pack(MAGIC, n_buckets, phrases, len(ids), sum(map(len, entries)))
+    return b''.join([header, _offsets(entries).tobytes(), _offsets(id_bytes).tobytes(),
+                     _offsets(name_bytes).tobytes(), *entries, *id_bytes, *name_bytes])
+
+
+class _Strings:
+    """Read-only list of the strings between offsets[i] and offsets[i + 1] of data"""
+
+    def __init__(self, data, offsets, base):
+        self._data = data
+        self._offsets = offsets
+        self._base = base
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        start = self._base + self._offsets[index]
+        return str(self._data[start:self._base + self._offsets[index + 1]], 'utf-8')
+
+
+class PhraseTable:
+    """The phrase table of a mapped phrases.bin, looked up by first token"""
+
+    def __init__(self, data):
+        magic, n_buckets, self.phrases, n_skills, entry_bytes = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a skill matcher phrase table")
+        view = memoryview(data)
+        pos = HEADER.size
+        self._buckets = view[pos:pos + 4 * (n_buckets + 1)].cast('I')
+        pos += 4 * (n_buckets + 1)
+        id_offsets = view[pos:pos + 4 * (n_skills + 1)].cast('I')
+        pos += 4 * (n_skills + 1)
+        name_offsets = view[pos:pos + 4 * (n_skills + 1)].cast('I')
+        pos += 4 * (n_skills + 1)
+        self._data = data
+        self._entries = pos
+        self._mask = n_buckets - 1
+        self._cache = {}
+        self.ids = _Strings(data, id_offsets, pos + entry_bytes)
+        self.names = _Strings(data, name_offsets, pos + entry_bytes + id_offsets[-1])
+
+    def get(self, first):
+        """[(remaining tokens, skill index)] of the phrases starting with first, or None"""
+        try:
+            return self._cache[first]
+        except KeyError:
+            pass
+        bucket = _bucket(first, self._mask)
+        start, end = self._buckets[bucket], self._buckets[bucket + 1]
+        entries = self._decode(self._entries + start, self._entries + end).get(first) if start != end else None
+        if len(self._cache) >= TOKEN_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[first] = entries
+        return entries
+
+    def _decode(self, pos, end):
+        phrases = {}
+        data = self._data
+        while pos < end:
+            index, length = RECORD.unpack_from(data, pos)
+            pos += RECORD.size
+            first, *rest = str(data[pos:pos + length], 'utf-8').split('\0')
+            pos += length
+            phrases.setdefault(first, []).append((tuple(rest), index))
+        return phrases
+
+
+def load_taxonomy(path):
+    """Read [{"id", "name", "synonyms"}] entries from a JSON file"""
+    with open(path, encoding='utf-8') as f:
+        taxonomy = json.load(f)
+    for entry in taxonomy:
+        entry.setdefault('id', normalize_skill(entry['name']))
+        entry.setdefault('synonyms', [])
+    return taxonomy
+
+
+def taxonomy_digest(taxonomy):
+    data = json.dumps(sorted((e['id'], e['name'], sorted(e['synonyms'])) for e in taxonomy))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+
+def build_phrase_table(nlp, taxonomy):
+    """{first token: [(remaining tokens, skill index)]}, longest phrases first.
+
+    Tokens are lowercased, which is what a PhraseMatcher with attr='LOWER'
+    compares, so both find the same spans.
+    """
+    table, seen = {}, set()
+    for index, entry in enumerate(taxonomy):
+        for surface in [entry['name'], *entry['synonyms']]:
+            tokens = tuple(token.lower_ for token in nlp.make_doc(surface))
+            if tokens and tokens not in seen:
+                seen.add(tokens)
+                table.setdefault(tokens[0], []).append((tokens[1:], index))
+    for entries in table.values():
+        entries.sort(key=lambda e: -len(e[0]))
+    return table
+
+
+class SkillMatcher:
+    """Finds skills in a Doc, from a built-in list or a prebuilt taxonomy.
+
+    With a built-in list it is a plain LOWER PhraseMatcher and skills are
+    reported as the matched text; taxonomy skills (and their synonyms) are
+    reported under their canonical name.
+    """
+
+    def __init__(self, vocab):
+        self.vocab = vocab
+        self.matcher = None
+        self.table = None
+        self.ids = []
+        self.names = []
+        self.digest = None
+
+    @classmethod
+    def from_skills(cls, nlp, skills):
+        from spacy.matcher import PhraseMatcher
+        skill_matcher = cls(nlp.vocab)
+        skill_matcher.matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+        skill_matcher.matcher.add("SKILLS", [nlp.make_doc(skill) for skill in skills])
+        return skill_matcher
+
+    @classmethod
+    def from_artifact(cls, nlp, path, meta):
+        skill_matcher = cls(nlp.vocab)
+        # The mapping outlives the file object and stays open for the process
+        with open(os.path.join(path, PHRASES_FILE), 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        table = PhraseTable(data)
+        skill_matcher.table = table
+        skill_matcher.ids = table.ids
+        skill_matcher.names = table.names
+        skill_matcher.digest = meta['digest']
+        return skill_matcher
+
+    def _table_matches(self, doc):
+        # (skill index, start, end) for every phrase in the table, overlaps included
+        lowers = [token.lower_ for token in doc]
+        table = self.table
+        for start, first in enumerate(lowers):
+            entries = table.get(first)
+            if not entries:
+                continue
+            for rest, index in entries:
+                end = start + 1 + len(rest)
+                if not rest or tuple(lowers[start + 1:end]) == rest:
+                    yield index, start, end
+
+    def __call__(self, doc):
+        """(match_id, start, end) triples, like a PhraseMatcher"""
+        if self.matcher is not None:
+            return self.matcher(doc)
+        strings = self.vocab.strings
+        return [(strings[self.ids[index]], start, end) for index, start, end in self._table_matches(doc)]
+
+    def __len__(self):
+        return len(self.matcher) if self.matcher is not None else self.table.phrases
+
+    def skills(self, doc):
+        """Skill names found in doc, one per match"""
+        if self.matcher is not None:
+            return [doc[start:end].text for _, start, end in self.matcher(doc)]
+        return [self.names[index] for index, _, _ in self._table_matches(doc)]
+
+
+def build_artifact(nlp, taxonomy, out_dir):
+    """Tokenize the taxonomy once and write the artifact to out_dir"""
+    table = build_phrase_table(nlp, taxonomy)
+    phrases = pack_phrase_table(table, [entry['id'] for entry in taxonomy], [entry['name'] for entry in taxonomy])
+    # Kept small: it is read at API import to version the extraction cache
+    meta = {
+        'artifact_version': ARTIFACT_VERSION,
+        'spacy_version': package_version('spacy'),
+        'lang': nlp.lang,
+        'byteorder': sys.byteorder,
+        'digest': taxonomy_digest(taxonomy),
+        'skills': len(taxonomy),
+        'phrases': sum(len(e) for e in table.values()),
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    # Write beside the final names and swap in, so readers never see half a build
+    for name, data in ((PHRASES_FILE, phrases), (META_FILE, json.dumps(meta).encode('utf-8'))):
+        path = os.path.join(out_dir, name)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.tmp', path)
+    return meta
+
+
+def read_meta(path=None):
+    """The artifact's meta, or None when it is missing or built for another spaCy"""
+    path = path or settings.SKILL_MATCHER_PATH
+    try:
+        with open(os.path.join(path, META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Token boundaries can change between spaCy minor versions
+    same_spacy = meta.get('spacy_version', '').split('.')[:2] == package_version('spacy').split('.')[:2]
+    stale = meta.get('artifact_version') != ARTIFACT_VERSION or meta.get('byteorder') != sys.byteorder
+    if stale or not same_spacy:
+        logger.warning("Ignoring stale skill matcher artifact at %s; rebuild it", path)
+        return None
+    return meta
+
+
+def artifact_digest(path=None):
+    """Taxonomy digest of a usable artifact, for cache versions; None if absent"""
+    meta = read_meta(path)
+    return meta['digest'] if meta else None
+
+
+def load_skill_matcher(nlp, fallback_skills, path=None):
+    """SkillMatcher from the artifact, or built from fallback_skills without one"""
+    path = path or settings.SKILL_MATCHER_PATH
+    meta = read_meta(path)
+    if meta is None or meta['lang'] != nlp.lang:
+        return SkillMatcher.from_skills(nlp, fallback_skills)
+    return SkillMatcher.from_artifact(nlp, path, meta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the prebuilt skill matcher artifact')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help='tokenize a taxonomy into an artifact')
+    build.add_argument('--taxonomy', default=settings.SKILL_TAXONOMY_PATH)
+    build.add_argument('--out', default=settings.SKILL_MATCHER_PATH)
+    args = parser.parse_args(argv)
+
+    from backend.nlp_pipeline import load_pipeline
+    # Patterns only need the tokenizer, which every component profile shares
+    nlp = load_pipeline(settings.SPACY_MODEL, [])
+    taxonomy = load_taxonomy(args.taxonomy)
+    meta = build_artifact(nlp, taxonomy, args.out)
+    print(f"Wrote {meta['phrases']} phrases for {meta['skills']} skills to {args.out} (digest {meta['digest']})")
+
+
+if __name__ == '__main__':
+    main()
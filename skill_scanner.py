@@ -0,0 +1,98 @@
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+
+def _fold_with_origin(text):
+    # casefold() can change a character's length (e.g. 'ß' -> 'ss'); keep the
+    # original index of every folded character so offsets stay in text
+    folded, origin = [], []
+    for index, ch in enumerate(text):
+        for folded_ch in ch.casefold():
+            folded.append(folded_ch)
+            origin.append(index)
+    return ''.join(folded), origin
+
+
+class SkillScanner:
+    """Aho-Corasick automaton over skill names, independent of spaCy.
+
+    Finds every case-insensitive, whole-word occurrence of every skill in a
+    single pass over the text: "java" does not match inside "javascript" and
+    "r" only matches on its own. Skills may be given as a list of names or as
+    a {surface form: name} mapping (e.g. synonyms onto a canonical name); the
+    first spelling given for a surface form is the one reported.
+    """
+
+    def __init__(self, skills):
+        surfaces = skills.items() if isinstance(skills, dict) else ((s, s) for s in skills)
+        self._delta = [{}]
+        self._outputs = [()]
+        seen = set()
+        for surface, name in surfaces:
+            key = surface.casefold()
+            if key and key not in seen:
+                seen.add(key)
+                self._insert(key, name)
+        self._link()
+
+    def _insert(self, key, name):
+        node = 0
+        for ch in key:
+            child = self._delta[node].get(ch)
+            if child is None:
+                child = len(self._delta)
+                self._delta[node][ch] = child
+                self._delta.append({})
+                self._outputs.append(())
+            node = child
+        self._outputs[node] += ((len(key), name),)
+
+    def _link(self):
+        # Breadth-first over the trie: compute failure links, merge each node's
+        # outputs with its failure target's, and fill in the failure
+        # transitions so scanning is one dict lookup per character
+        fail = [0] * len(self._delta)
+        queue = list(self._delta[0].values())
+        for node in queue:
+            for ch, child in self._delta[node].items():
+                target = fail[node]
+                while target and ch not in self._delta[target]:
+                    target = fail[target]
+                link = self._delta[target].get(ch, 0)
+                fail[child] = link if link != child else 0
+                self._outputs[child] += self._outputs[fail[child]]
+                queue.append(child)
+        for node in queue:
+            # Parents come before children, so fail[node] is already complete
+            for ch, child in self._delta[fail[node]].items():
+                self._delta[node].setdefault(ch, child)
+
+    def scan(self, text):
+        """[(start, end, name)] for every whole-word occurrence, in text order"""
+        folded = text.casefold()
+        origin = None
+        if len(folded) != len(text):
+            folded, origin = _fold_with_origin(text)
+        delta, outputs = self._delta, self._outputs
+        last = len(folded) - 1
+        found = []
+        node = 0
+        for index, ch in enumerate(folded):
+            node = delta[node].get(ch, 0)
+            if not outputs[node]:
+                continue
+            if index < last and _is_word_char(folded[index + 1]):
+                continue
+            for length, name in outputs[node]:
+                start = index + 1 - length
+                if start and _is_word_char(folded[start - 1]):
+                    continue
+                if origin is None:
+                    found.append((start, index + 1, name))
+                else:
+                    found.append((origin[start], origin[index] + 1, name))
+        return found
+
+    def skills(self, text):
+        """Skill names found in text, one per occurrence"""
+        return [name for _, _, name in self.scan(text)]
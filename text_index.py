@@ -0,0 +1,73 @@
+"""Full-text index over extracted resume text (SQLite FTS5).
+
+resume_text keeps the text each resume's fields were extracted from, under
+rowid = resumes.id. A row is added with its resume, in the same
+transaction, and removed by the resumes_text_delete trigger, so every way a
+resume is deleted keeps the index consistent. The schema is created by the
+migrations.
+"""
+import re
+
+TEXT_INDEX_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS resume_text USING fts5(text, tokenize = 'porter unicode61 remove_diacritics 2')",
+    '''CREATE TRIGGER IF NOT EXISTS resumes_text_delete AFTER DELETE ON resumes BEGIN
+        DELETE FROM resume_text WHERE rowid = old.id;
+    END''',
+)
+
+# Matched terms in snippets; plain text so the text of a PDF is never markup
+SNIPPET_START, SNIPPET_END, SNIPPET_ELLIPSIS = '[', ']', '…'
+SNIPPET_TOKENS = 12
+
+# A "quoted phrase" or a run of non-space characters
+_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def _quote(term):
+    return '"' + term.replace('"', '""') + '"'
+
+
+def fts_query(text):
+    """FTS5 MATCH expression for a search box query, or None when it has no terms.
+
+    Every word and "quoted phrase" must appear; a word ending in * matches
+    as a prefix. Everything else is taken literally, so input such as
+    c++, node.js or a stray AND never reaches FTS5 as query syntax.
+    """
+    terms = []
+    for phrase, word in _TERM.findall(text):
+        if phrase.strip():
+            terms.append(_quote(phrase))
+        elif word.rstrip('*'):
+            terms.append(_quote(word.rstrip('*')) + ('*' if word.endswith('*') else ''))
+    return ' '.join(terms) or None
+
+
+def index_text(conn, resume_id, text):
+    """Add a resume's text inside the caller's transaction"""
+    if text:
+        conn.execute('INSERT INTO resume_text (rowid, text) VALUES (?, ?)', (resume_id, text))
+
+
+def search_text(conn, query, limit, offset=0):
+    """[(resume_id, score, snippet)], best match first.
+
+    score is bm25 negated, so higher is better as with skill matching.
+    """
+    match = fts_query(query)
+    if match is None:
+        return []
+    return conn.execute(
+        f'''SELECT rowid, -bm25(resume_text),
+                   snippet(resume_text, 0, ?, ?, ?, {SNIPPET_TOKENS})
+            FROM resume_text WHERE resume_text MATCH ? ORDER BY rank LIMIT ? OFFSET ?''',
+        (SNIPPET_START, SNIPPET_END, SNIPPET_ELLIPSIS, match, limit, offset),
+    ).fetchall()
+
+
+def text_query_sql(query):
+    """(subquery of matching resume ids, params), or None when the query has no terms"""
+    match = fts_query(query)
+    if match is None:
+        return None
+    return 'SELECT rowid FROM resume_text WHERE resume_text MATCH ?', [match]
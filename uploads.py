@@ -0,0 +1,81 @@
+import hashlib
+import os
+import uuid
+
+from starlette.concurrency import run_in_threadpool
+
+from backend import settings
+
+UPLOAD_DIR = "uploads"
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload grows past the configured maximum size"""
+
+
+async def save_upload(upload, path, max_bytes=None, chunk_size=None):
+    """Stream an UploadFile to path in chunks, hashing it in the same pass.
+
+    Returns (sha256 hex digest, size in bytes). The data goes to a temporary
+    sibling file first, so a rejected upload never replaces an existing one.
+    """
+    max_bytes = max_bytes or settings.UPLOAD_MAX_BYTES
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+    digest = hashlib.sha256()
+    size = 0
+    partial = path + ".part"
+    try:
+        with open(partial, "wb") as out:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+                digest.update(chunk)
+                await run_in_threadpool(out.write, chunk)
+        os.replace(partial, path)
+    except BaseException:
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
+    return digest.hexdigest(), size
+
+
+def staged_path(digest, directory=UPLOAD_DIR):
+    """Where the upload with this content hash is kept: one file per content,
+    whatever it was called"""
+    return os.path.join(directory, f"{digest}.pdf")
+
+
+async def stage_upload(upload, directory=UPLOAD_DIR, max_bytes=None, chunk_size=None):
+    """save_upload under the content hash; returns (digest, size, path)"""
+    partial = os.path.join(directory, f"{uuid.uuid4().hex}.upload")
+    digest, size = await save_upload(upload, partial, max_bytes, chunk_size)
+    path = staged_path(digest, directory)
+    os.replace(partial, path)
+    return digest, size, path
+
+
+def stage_file(src, directory=UPLOAD_DIR, chunk_size=None):
+    """Copy a file object under its content hash; returns (digest, path)"""
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+    digest = hashlib.sha256()
+    partial = os.path.join(directory, f"{uuid.uuid4().hex}.part")
+    try:
+        with open(partial, "wb") as out:
+            for chunk in iter(lambda: src.read(chunk_size), b""):
+                digest.update(chunk)
+                out.write(chunk)
+        path = staged_path(digest.hexdigest(), directory)
+        os.replace(partial, path)
+    except BaseException:
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
+    return digest.hexdigest(), path
@@ -0,0 +1,119 @@
+import asyncio
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+from backend import settings
+
+
+class PoolBusy(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+
+
+class ExtractionTimeout(Exception):
+    """Raised when a job does not finish within the per-job timeout"""
+
+
+def _init_worker(preload):
+    # Runs once in every worker process, so models are loaded before the first job
+    for hook in preload:
+        hook()
+
+
+def _noop():
+    return None
+
+
+class ExtractionPool:
+    """Fixed-size process pool with a bounded wait queue for extraction jobs"""
+
+    def __init__(self, workers=None, queue_depth=None, timeout=None, preload=()):
+        self.workers = workers or settings.POOL_WORKERS
+        self.queue_depth = settings.POOL_QUEUE_DEPTH if queue_depth is None else queue_depth
+        self.timeout = timeout or settings.POOL_JOB_TIMEOUT
+        # One slot per running job plus one per queued job; submit() never blocks
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_depth)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(settings.POOL_START_METHOD),
+            initializer=_init_worker,
+            initargs=(tuple(preload),),
+        )
+
+    def start(self):
+        """Launch the worker processes so they preload before the first job"""
+        # Processes are spawned on demand, one per submit that finds no idle worker
+        for _ in range(self.workers):
+            self._executor.submit(_noop)
+
+    def submit(self, fn, *args, wait=False):
+        """Queue fn(*args) on a worker; raises PoolBusy instead of waiting for a slot
+        unless wait is set, in which case it waits up to the job timeout"""
+        acquired = self._slots.acquire(timeout=self.timeout) if wait else self._slots.acquire(blocking=False)
+        if not acquired:
+            raise PoolBusy("Extraction queue is full")
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def imap(self, fn, items, window=None):
+        """Yield futures of fn(item) in input order with at most `window` jobs in flight"""
+        window = window or self.workers
+        pending = deque()
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft()
+            pending.append(self.submit(fn, item, wait=True))
+        while pending:
+            yield pending.popleft()
+
+    def run(self, fn, *args, timeout=None):
+        """Blocking submit-and-wait, for callers without an event loop"""
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except FutureTimeout:
+            # A job that already started keeps its worker (and slot) until it ends
+            future.cancel()
+            raise ExtractionTimeout("Extraction timed out")
+
+    async def run_async(self, fn, *args, timeout=None):
+        """Submit-and-await without blocking the event loop"""
+        future = self.submit(fn, *args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise ExtractionTimeout("Extraction timed out")
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(preload=None):
+    """Return the process-wide pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            if preload is None:
+                from backend.extractor import warm_up
+                preload = (warm_up,)
+            _pool = ExtractionPool(preload=preload)
+        return _pool
+
+
+def shutdown_pool(wait=True):
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait)
+            _pool = None